@@ -135,7 +135,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'showcase.pagination.StandardPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
 }
@@ -151,6 +151,9 @@ SIMPLE_JWT = {
 }
 
 MAX_UPLOAD_SIZE = 2 * 1024 * 1024
+
+# Cache des réponses GET anonymes de l'API (showcase.response_cache)
+RESPONSE_CACHE_ENABLED = config('RESPONSE_CACHE_ENABLED', default=True, cast=bool)
 # Limites d'upload (optionnel)
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5MB
@@ -163,3 +166,27 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+
+# Tâches périodiques (Celery beat)
+CELERY_BEAT_SCHEDULE = {
+    'reprice-due-promotions': {
+        'task': 'showcase.tasks.reprice_due_promotions',
+        'schedule': 60.0,
+    },
+    'flush-engagement-counters': {
+        'task': 'showcase.tasks.flush_engagement_counters',
+        'schedule': 30.0,
+    },
+    'rescore-catalog': {
+        'task': 'showcase.tasks.rescore_catalog',
+        'schedule': 300.0,
+    },
+    'rescore-dirty-products': {
+        'task': 'showcase.tasks.rescore_dirty_products',
+        'schedule': 60.0,
+    },
+    'prune-engagement-history': {
+        'task': 'showcase.tasks.prune_engagement_history',
+        'schedule': 24 * 60 * 60.0,
+    },
+}
@@ -1,20 +1,22 @@
 from django.contrib import messages
 
+from ..caching import bump_model_generation, invalidate_catalog
+from ..services.autocomplete import invalidate_autocomplete_index
+from ..services.category_stats import CategoryStatsService
+from ..services.promotion_index import invalidate_promotion_index
+from ..services.repricing_service import RepricingService
+from ..services.scoring_service import ScoringService
+
 
 class ProductActions:
     """Bulk actions for Product admin"""
 
     @staticmethod
     def recalculate_scores(modeladmin, request, queryset):
-        from ..services.scoring_service import ScoringService
-
-        count = 0
-        for product in queryset:
-            if hasattr(product, 'status'):
-                product.status.recalculate_scores()
-                count += 1
+        product_ids = list(queryset.values_list('pk', flat=True))
+        ScoringService.rescore_catalog(product_ids)
 
-        messages.success(request, f"✅ Scores recalculés pour {count} produit(s)")
+        messages.success(request, f"✅ Scores recalculés pour {len(product_ids)} produit(s)")
 
     @staticmethod
     def force_featured(modeladmin, request, queryset):
@@ -23,6 +25,7 @@ class ProductActions:
             status__is_featured=True,
             status__featured_score=100.0
         )
+        bump_model_generation(queryset.model)
         messages.success(request, f"⭐ {count} produit(s) forcé(s) en vedette")
 
     @staticmethod
@@ -32,6 +35,7 @@ class ProductActions:
             status__is_recommended=True,
             status__recommendation_score=100.0
         )
+        bump_model_generation(queryset.model)
         messages.success(request, f"👍 {count} produit(s) forcé(s) en recommandé")
 
     @staticmethod
@@ -40,6 +44,7 @@ class ProductActions:
             status__exclude_from_featured=True,
             status__is_featured=False
         )
+        bump_model_generation(queryset.model)
         messages.success(request, f"🚫 {count} produit(s) exclu(s) des vedettes")
 
     @staticmethod
@@ -48,26 +53,53 @@ class ProductActions:
             status__exclude_from_recommended=True,
             status__is_recommended=False
         )
+        bump_model_generation(queryset.model)
         messages.success(request, f"🚫 {count} produit(s) exclu(s) des recommandations")
 
     @staticmethod
     def activate(modeladmin, request, queryset):
+        # Capturé avant update() : le queryset filtré de la liste ne les contient plus ensuite
+        rows = list(queryset.values_list('pk', 'category_id'))
         count = queryset.update(is_active=True)
+        bump_model_generation(queryset.model)
+        CategoryStatsService.rebuild(category_id for _, category_id in rows)
+        ScoringService.mark_dirty([pk for pk, _ in rows])
+        invalidate_catalog()
+        invalidate_autocomplete_index()
         messages.success(request, f"✅ {count} produit(s) activé(s)")
 
     @staticmethod
     def deactivate(modeladmin, request, queryset):
+        # Capturé avant update() : le queryset filtré de la liste ne les contient plus ensuite
+        rows = list(queryset.values_list('pk', 'category_id'))
         count = queryset.update(is_active=False)
+        bump_model_generation(queryset.model)
+        CategoryStatsService.rebuild(category_id for _, category_id in rows)
+        ScoringService.mark_dirty([pk for pk, _ in rows])
+        invalidate_catalog()
+        invalidate_autocomplete_index()
         messages.success(request, f"⏸️ {count} produit(s) désactivé(s)")
 
     @staticmethod
     def mark_in_stock(modeladmin, request, queryset):
+        # Capturé avant update() : le queryset filtré de la liste ne les contient plus ensuite
+        rows = list(queryset.values_list('pk', 'category_id'))
         count = queryset.update(in_stock=True)
+        bump_model_generation(queryset.model)
+        CategoryStatsService.rebuild(category_id for _, category_id in rows)
+        ScoringService.mark_dirty([pk for pk, _ in rows])
+        invalidate_catalog()
         messages.success(request, f"📦 {count} produit(s) marqué(s) en stock")
 
     @staticmethod
     def mark_out_of_stock(modeladmin, request, queryset):
+        # Capturé avant update() : le queryset filtré de la liste ne les contient plus ensuite
+        rows = list(queryset.values_list('pk', 'category_id'))
         count = queryset.update(in_stock=False)
+        bump_model_generation(queryset.model)
+        CategoryStatsService.rebuild(category_id for _, category_id in rows)
+        ScoringService.mark_dirty([pk for pk, _ in rows])
+        invalidate_catalog()
         messages.warning(request, f"📦 {count} produit(s) marqué(s) rupture de stock")
 
 
@@ -79,6 +111,10 @@ class CategoryActions:
         from ..models import Category
 
         Category.objects.rebuild()
+        bump_model_generation(Category)
+        invalidate_promotion_index()
+        invalidate_catalog()
+        RepricingService.schedule_catalog_reprice()
         messages.success(request, "✅ L'arbre des catégories a été reconstruit avec succès.")
 
 
@@ -88,21 +124,33 @@ class PromotionActions:
     @staticmethod
     def activate_promotions(modeladmin, request, queryset):
         count = queryset.update(active=True)
+        bump_model_generation(queryset.model)
+        invalidate_promotion_index()
+        RepricingService.schedule_catalog_reprice()
         messages.success(request, f"✅ {count} promotion(s) activée(s)")
 
     @staticmethod
     def deactivate_promotions(modeladmin, request, queryset):
         count = queryset.update(active=False)
+        bump_model_generation(queryset.model)
+        invalidate_promotion_index()
+        RepricingService.schedule_catalog_reprice()
         messages.warning(request, f"⏸️ {count} promotion(s) désactivée(s)")
 
     @staticmethod
     def mark_stackable(modeladmin, request, queryset):
         count = queryset.update(is_stackable=True)
+        bump_model_generation(queryset.model)
+        invalidate_promotion_index()
+        RepricingService.schedule_catalog_reprice()
         messages.info(request, f"🔗 {count} promotion(s) marquée(s) comme empilables")
 
     @staticmethod
     def mark_non_stackable(modeladmin, request, queryset):
         count = queryset.update(is_stackable=False)
+        bump_model_generation(queryset.model)
+        invalidate_promotion_index()
+        RepricingService.schedule_catalog_reprice()
         messages.info(request, f"🚫 {count} promotion(s) marquée(s) comme non-empilables")
 
 
@@ -66,7 +66,7 @@ class CategoryAdmin(MPTTModelAdmin, OptimizedModelAdmin):
     ]
 
     def optimize_queryset(self, qs):
-        return qs.select_related('parent')
+        return qs.select_related('parent').with_tree_data()
 
     # Display methods
     def icon_preview(self, obj):
@@ -49,6 +49,11 @@ class ProductDisplays:
 
     @staticmethod
     def formatted_price(obj):
+        # Prix déjà formatés pour toute la page de la liste (ProductAdmin.get_changelist_instance)
+        formatted_prices = getattr(obj, 'formatted_prices', None)
+        display_price, display_compare_price = formatted_prices or (
+            obj.display_price, obj.display_compare_price
+        )
         if obj.has_discount:
             return format_html(
                 '<div style="line-height:1.4;">'
@@ -57,13 +62,13 @@ class ProductDisplays:
                 '<span style="background:#e8f5e9; color:#2e7d32; padding:2px 6px; '
                 'border-radius:3px; font-size:10px; font-weight:bold;">-{}%</span>'
                 '</div>',
-                obj.display_price,
-                obj.display_compare_price,
+                display_price,
+                display_compare_price,
                 obj.discount_percent
             )
         return format_html(
             '<span style="font-weight:bold;">{}</span>',
-            obj.display_price
+            display_price
         )
 
     @staticmethod
@@ -149,6 +154,7 @@ class ProductDisplays:
         from ..constants import FEATURED_SCORE_THRESHOLD, RECOMMENDATION_SCORE_THRESHOLD
 
         days_since_creation = (obj.created_at.now() - obj.created_at).days if hasattr(obj.created_at, 'now') else 0
+        views_30, clicks_30 = obj.status.get_engagement_last_n_days(30)
 
         info = format_html(
             '<div style="background:#f5f5f5; padding:15px; border-radius:8px; '
@@ -158,7 +164,7 @@ class ProductDisplays:
             '<strong>⭐ Produit Vedette (seuil: {})</strong><br>'
             '• Score actuel: <strong>{:.2f}/100</strong><br>'
             '• Statut: {}<br>'
-            '• Vues (30j): {} | Clics WhatsApp: {}<br>'
+            '• Vues (30j): {} | Clics WhatsApp (30j): {}<br>'
             '• Stock: {} | Ancienneté: {} jours<br><br>'
 
             '<strong>👍 Produit Recommandé (seuil: {})</strong><br>'
@@ -174,8 +180,8 @@ class ProductDisplays:
             FEATURED_SCORE_THRESHOLD,
             obj.status.featured_score,
             "✅ VEDETTE" if obj.status.is_featured else "❌ Non vedette",
-            obj.status.get_views_last_n_days(30),
-            obj.status.whatsapp_click_count,
+            views_30,
+            clicks_30,
             obj.stock_quantity,
             days_since_creation,
             RECOMMENDATION_SCORE_THRESHOLD,
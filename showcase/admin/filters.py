@@ -1,6 +1,9 @@
 from django.contrib.admin import SimpleListFilter, DateFieldListFilter
 from django.utils.translation import gettext_lazy as _
 
+from ..constants import PRICE_BUCKETS
+from ..services.engagement_history import EngagementHistoryService
+
 
 class StockStatusFilter(SimpleListFilter):
     title = _("Statut du stock")
@@ -27,22 +30,16 @@ class PriceRangeFilter(SimpleListFilter):
     parameter_name = "price_range"
 
     def lookups(self, request, model_admin):
-        return (
-            ("<10k", _("Moins de 10k FCFA")),
-            ("10k-50k", _("10k - 50k FCFA")),
-            ("50k-100k", _("50k - 100k FCFA")),
-            (">100k", _("Plus de 100k FCFA")),
-        )
+        return tuple((key, _(label)) for key, label, _min, _max in PRICE_BUCKETS)
 
     def queryset(self, request, queryset):
-        if self.value() == "<10k":
-            return queryset.filter(price__lt=10000)
-        if self.value() == "10k-50k":
-            return queryset.filter(price__gte=10000, price__lt=50000)
-        if self.value() == "50k-100k":
-            return queryset.filter(price__gte=50000, price__lt=100000)
-        if self.value() == ">100k":
-            return queryset.filter(price__gte=100000)
+        for key, _label, min_price, max_price in PRICE_BUCKETS:
+            if self.value() == key:
+                if min_price is not None:
+                    queryset = queryset.filter(price__gte=min_price)
+                if max_price is not None:
+                    queryset = queryset.filter(price__lt=max_price)
+                return queryset
 
 
 class DiscountFilter(SimpleListFilter):
@@ -96,7 +93,7 @@ class NewProductFilter(SimpleListFilter):
 
 
 class EngagementFilter(SimpleListFilter):
-    title = _("Engagement")
+    title = _("Engagement (30 jours)")
     parameter_name = "engagement"
 
     def lookups(self, request, model_admin):
@@ -108,14 +105,20 @@ class EngagementFilter(SimpleListFilter):
         )
 
     def queryset(self, request, queryset):
+        # Vues + clics de l'historique journalier, lus sur la seule fenêtre (index sur la date)
+        engaged = EngagementHistoryService.engagement_queryset(days=30)
         if self.value() == "high":
-            return queryset.filter(status__view_count__gte=100)
+            return queryset.filter(pk__in=engaged.filter(engagement__gte=100).values('product_id'))
         if self.value() == "medium":
-            return queryset.filter(status__view_count__gte=20, status__view_count__lt=100)
+            return queryset.filter(
+                pk__in=engaged.filter(engagement__gte=20, engagement__lt=100).values('product_id')
+            )
         if self.value() == "low":
-            return queryset.filter(status__view_count__gt=0, status__view_count__lt=20)
+            return queryset.filter(
+                pk__in=engaged.filter(engagement__gt=0, engagement__lt=20).values('product_id')
+            )
         if self.value() == "none":
-            return queryset.filter(status__view_count=0)
+            return queryset.exclude(pk__in=engaged.filter(engagement__gt=0).values('product_id'))
 
 
 class CategoryLevelFilter(SimpleListFilter):
@@ -1,5 +1,6 @@
 from django.contrib import admin
 
+from ..formatting import format_prices
 from ..models import Product, ProductImage
 from .base import OptimizedModelAdmin, OptimizedTabularInline, TimestampReadOnlyMixin
 from .displays import ProductDisplays, ImageDisplays
@@ -183,6 +184,20 @@ class ProductAdmin(OptimizedModelAdmin, TimestampReadOnlyMixin):
     def optimize_queryset(self, qs):
         return qs.select_related('category', 'status').prefetch_related('images')
 
+    def get_changelist_instance(self, request):
+        """Formate en une passe (format_prices) les prix des produits de la page."""
+        changelist = super().get_changelist_instance(request)
+        products = list(changelist.result_list)
+        prices = format_prices(
+            [product.price for product in products]
+            + [product.compare_at_price for product in products]
+        )
+        for product, display_price, display_compare_price in zip(
+            products, prices, prices[len(products):]
+        ):
+            product.formatted_prices = (display_price, display_compare_price)
+        return changelist
+
     # Display methods
     def product_thumbnail(self, obj):
         return ProductDisplays.thumbnail(obj)
@@ -1,5 +1,6 @@
 from django.contrib import admin
 
+from ..formatting import format_fcfa
 from ..models import Promotion, PromotionUsage
 from .base import OptimizedModelAdmin, OptimizedTabularInline, TimestampReadOnlyMixin
 from .actions import PromotionActions
@@ -158,9 +159,9 @@ class PromotionAdmin(OptimizedModelAdmin, TimestampReadOnlyMixin):
         if obj.promotion_type == 'percent' and obj.value:
             return AdminDisplay.badge(f"{obj.value}%")
         elif obj.promotion_type == 'amount' and obj.value:
-            return AdminDisplay.badge(f"{obj.value} FCFA")
+            return AdminDisplay.badge(format_fcfa(obj.value))
         elif obj.promotion_type == 'set_price' and obj.value:
-            return AdminDisplay.badge(f"{obj.value} FCFA")
+            return AdminDisplay.badge(format_fcfa(obj.value))
         elif obj.promotion_type == 'bogo':
             return AdminDisplay.badge(f"Buy {obj.buy_x} Get {obj.get_y}")
         return "—"
@@ -2,6 +2,7 @@ from django_filters import rest_framework as filters
 from django.db import models
 from .models import Product, Category, Promotion, NewsletterCampaign, NewsletterSubscriber, NewsletterTemplate
 from .constants import PROMOTION_TYPES, NEWSLETTER_CAMPAIGN_STATUSES
+from .services.search_service import SearchService
 
 
 class ProductFilter(filters.FilterSet):
@@ -13,9 +14,9 @@ class ProductFilter(filters.FilterSet):
     category = filters.ModelChoiceFilter(queryset=Category.objects.all())
     category_slug = filters.CharFilter(field_name='category__slug', lookup_expr='exact')
     
-    # Filtres de prix
-    min_price = filters.NumberFilter(field_name='price', lookup_expr='gte')
-    max_price = filters.NumberFilter(field_name='price', lookup_expr='lte')
+    # Filtres de prix (min/max portent sur le prix effectif, promotions incluses)
+    min_price = filters.NumberFilter(field_name='effective_price', lookup_expr='gte')
+    max_price = filters.NumberFilter(field_name='effective_price', lookup_expr='lte')
     price_range = filters.RangeFilter(field_name='price')
     
     # Filtres de stock
@@ -27,6 +28,7 @@ class ProductFilter(filters.FilterSet):
     is_featured = filters.BooleanFilter(field_name='status__is_featured')
     is_recommended = filters.BooleanFilter(field_name='status__is_recommended')
     has_discount = filters.BooleanFilter(method='filter_has_discount')
+    on_sale = filters.BooleanFilter(method='filter_on_sale')
     
     # Filtres de date
     created_after = filters.DateTimeFilter(field_name='created_at', lookup_expr='gte')
@@ -40,8 +42,9 @@ class ProductFilter(filters.FilterSet):
         fields=(
             ('name', 'name'),
             ('price', 'price'),
+            ('effective_price', 'final_price'),
             ('created_at', 'created_at'),
-            ('status__views_count', 'views_count'),
+            ('status__view_count', 'views_count'),
             ('status__featured_score', 'featured_score'),
         )
     )
@@ -57,15 +60,15 @@ class ProductFilter(filters.FilterSet):
         else:
             return queryset.filter(compare_at_price__isnull=True) | queryset.filter(compare_at_price__lte=0)
     
+    def filter_on_sale(self, queryset, name, value):
+        """Filtre les produits dont une promotion réduit le prix de vente"""
+        if value:
+            return queryset.filter(effective_price__lt=models.F('price'))
+        return queryset.exclude(effective_price__lt=models.F('price'))
+
     def filter_search(self, queryset, name, value):
-        """Recherche dans nom, brand, description, SKU"""
-        return queryset.filter(
-            models.Q(name__icontains=value) |
-            models.Q(brand__icontains=value) |
-            models.Q(description__icontains=value) |
-            models.Q(sku__icontains=value) |
-            models.Q(barcode__icontains=value)
-        )
+        """Recherche plein texte (nom, marque, SKU, code-barres, descriptions), triée par pertinence"""
+        return SearchService.search(queryset, value)
 
 
 class CategoryFilter(filters.FilterSet):
@@ -0,0 +1,277 @@
+"""
+Mesure des endpoints de l'API : catalogue de démonstration et scénarios.
+
+Partagé par les tests de budget de requêtes (showcase/tests/test_query_budgets.py)
+et la commande ``benchmark_api``. Chaque scénario déclare le nombre maximal de
+requêtes SQL autorisé, qui ne doit pas dépendre de la taille de page.
+"""
+import random
+import time
+from collections import namedtuple
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+Endpoint = namedtuple('Endpoint', 'name method url_name lookup data paginated auth max_queries')
+Endpoint.__new__.__defaults__ = (None, None, False, False, None)
+
+# lookup : (clé de l'objet témoin, attribut) pour les routes de détail ;
+# les détails produit / catégorie comptent la requête des validateurs (ETag)
+ENDPOINTS = [
+    Endpoint('categories', 'get', 'showcase:category-list', paginated=True, max_queries=3),
+    Endpoint('categories/tree', 'get', 'showcase:category-tree', max_queries=0),
+    Endpoint('categories/minimal', 'get', 'showcase:category-minimal', max_queries=2),
+    Endpoint('categories/{slug}', 'get', 'showcase:category-detail', lookup=('category', 'slug'), max_queries=5),
+    Endpoint('categories/{slug}/products', 'get', 'showcase:category-products', lookup=('category', 'slug'), max_queries=4),
+    Endpoint('products', 'get', 'showcase:product-list', paginated=True, max_queries=3),
+    Endpoint(
+        'products?search', 'get', 'showcase:product-list',
+        data=lambda catalog: {'search': f"{catalog['product'].brand} produit"}, paginated=True, max_queries=3,
+    ),
+    Endpoint(
+        'products/autocomplete', 'get', 'showcase:product-autocomplete',
+        data=lambda catalog: {'q': catalog['product'].name[:5]}, max_queries=0,
+    ),
+    Endpoint('products/featured', 'get', 'showcase:product-featured', paginated=True, max_queries=2),
+    Endpoint('products/recommended', 'get', 'showcase:product-recommended', paginated=True, max_queries=2),
+    Endpoint('products/on_sale', 'get', 'showcase:product-on-sale', paginated=True, max_queries=3),
+    Endpoint('products/trending', 'get', 'showcase:product-trending', paginated=True, max_queries=2),
+    Endpoint('products/new_arrivals', 'get', 'showcase:product-new-arrivals', paginated=True, max_queries=2),
+    Endpoint('products/best_sellers', 'get', 'showcase:product-best-sellers', paginated=True, max_queries=2),
+    Endpoint('products/{slug}', 'get', 'showcase:product-detail', lookup=('product', 'slug'), max_queries=3),
+    Endpoint(
+        'products/quote', 'post', 'showcase:product-quote',
+        data=lambda catalog: {'lines': [{'id': pk, 'quantity': 2} for pk in catalog['quote_ids']]},
+        max_queries=1,
+    ),
+    Endpoint('promotions', 'get', 'showcase:promotion-list', paginated=True, max_queries=2),
+    Endpoint('promotions/active', 'get', 'showcase:promotion-active', max_queries=4),
+    Endpoint('promotions/{slug}', 'get', 'showcase:promotion-detail', lookup=('promotion', 'slug'), max_queries=4),
+    Endpoint(
+        'promotions/validate_code', 'post', 'showcase:promotion-validate-code',
+        data=lambda catalog: {'code': catalog['promotion'].code}, max_queries=4,
+    ),
+    Endpoint('newsletter/subscribers', 'get', 'showcase:newsletter-subscriber-list', paginated=True, auth=True, max_queries=2),
+    Endpoint('newsletter/templates', 'get', 'showcase:newsletter-template-list', paginated=True, max_queries=2),
+    Endpoint('newsletter/campaigns', 'get', 'showcase:newsletter-campaign-list', paginated=True, auth=True, max_queries=3),
+    Endpoint('services', 'get', 'showcase:service-list', paginated=True, max_queries=2),
+    Endpoint('social-links', 'get', 'showcase:social-link-list', paginated=True, max_queries=2),
+    Endpoint('settings/current', 'get', 'showcase:settings-current', max_queries=0),
+]
+
+BRANDS = ['HP', 'Dell', 'Lenovo', 'Asus', 'Acer', 'Apple', 'Samsung', 'Epson', 'Canon', 'Logitech']
+
+
+def seed_catalog(categories=300, products=3000, images_per_product=2, promotions=40,
+                 subscribers=1000, seed=42):
+    """
+    Crée un catalogue réaliste en insertions groupées et retourne les objets témoins.
+
+    À exécuter sur une base vide ou dans une transaction annulée ensuite.
+    """
+    from .models import (
+        Category, Product, ProductImage, ProductStatus, Promotion, PromotionUsage,
+        NewsletterSubscriber, NewsletterTemplate, NewsletterCampaign,
+        Service, SocialLink, SiteSettings,
+    )
+    from .services.autocomplete import invalidate_autocomplete_index
+    from .services.category_stats import CategoryStatsService
+    from .services.repricing_service import RepricingService
+    from .services.search_service import SearchService
+    from .services.trending import TrendingService
+
+    rng = random.Random(seed)
+    now = timezone.now()
+
+    roots = max(categories // 15, 1)
+    created_categories = []
+    with Category._tree_manager.disable_mptt_updates():
+        for i in range(categories):
+            parent = None
+            if i >= roots:
+                parent = rng.choice(created_categories[:max(i // 2, roots)])
+            created_categories.append(Category.objects.create(
+                name=f'Catégorie {i}', slug=f'bench-categorie-{i}', parent=parent
+            ))
+    Category._tree_manager.rebuild()
+
+    product_objects = []
+    for i in range(products):
+        price = Decimal(rng.randrange(5_000, 1_500_000, 500))
+        stock = rng.choice([0, 2, 8, 15, 40])
+        product_objects.append(Product(
+            name=f'Produit {i}',
+            slug=f'bench-produit-{i}',
+            sku=f'BEN-{i:06d}',
+            brand=rng.choice(BRANDS),
+            category=rng.choice(created_categories),
+            description=f'Description du produit {i}',
+            short_description=f'Produit de démonstration {i}',
+            price=price,
+            effective_price=price,
+            compare_at_price=price * Decimal('1.2') if i % 4 == 0 else None,
+            stock_quantity=stock,
+            in_stock=stock > 0,
+            is_active=i % 20 != 0,
+        ))
+    product_objects = Product.objects.bulk_create(product_objects, batch_size=500)
+
+    ProductStatus.objects.bulk_create([
+        ProductStatus(
+            product=product,
+            view_count=rng.randrange(0, 2000),
+            whatsapp_click_count=rng.randrange(0, 200),
+            last_viewed_at=now - timedelta(days=rng.randrange(0, 120)),
+            trending_score=TrendingService.log_weight(
+                rng.randrange(0, 50), rng.randrange(0, 10),
+                at=(now - timedelta(hours=rng.randrange(0, 72))).timestamp(),
+            ),
+            is_featured=i % 5 == 0,
+            is_recommended=i % 7 == 0,
+        )
+        for i, product in enumerate(product_objects)
+    ], batch_size=500)
+
+    ProductImage.objects.bulk_create([
+        ProductImage(
+            product=product,
+            image=f'products/bench/{product.pk}-{position}.jpg',
+            order=position,
+            is_primary=position == 0,
+        )
+        for product in product_objects
+        for position in range(images_per_product)
+    ], batch_size=1000)
+
+    created_promotions = []
+    for i in range(promotions):
+        promotion_type = rng.choice([Promotion.PERCENT, Promotion.AMOUNT])
+        promotion = Promotion.objects.create(
+            name=f'Promotion {i}',
+            code=f'BENCH{i}',
+            promotion_type=promotion_type,
+            value=Decimal(rng.choice([5, 10, 15, 20])) if promotion_type == Promotion.PERCENT else Decimal('2500'),
+            start_at=now - timedelta(days=5),
+            end_at=now + timedelta(days=30),
+            is_stackable=i % 3 == 0,
+            # Limite globale : is_active_now dépend du total d'utilisations
+            usage_limit=500 if i % 2 else None,
+        )
+        promotion.products.add(*rng.sample(product_objects, min(25, len(product_objects))))
+        promotion.categories.add(*rng.sample(created_categories, min(3, len(created_categories))))
+        created_promotions.append(promotion)
+    PromotionUsage.objects.bulk_create([
+        PromotionUsage(promotion=promotion, count=rng.randint(0, 600), last_used_at=now)
+        for promotion in created_promotions if promotion.usage_limit
+    ])
+    RepricingService.reprice()
+    SearchService.rebuild_index()
+    CategoryStatsService.rebuild()
+    invalidate_autocomplete_index()
+
+    subscriber_objects = NewsletterSubscriber.objects.bulk_create([
+        NewsletterSubscriber(
+            email=f'abonne{i}@example.com',
+            confirmed=i % 3 != 0,
+            confirmation_token=f'bench-token-{i}',
+        )
+        for i in range(subscribers)
+    ], batch_size=1000)
+    templates = [
+        NewsletterTemplate.objects.create(name=f'Modèle {i}', subject=f'Nos nouveautés {i}')
+        for i in range(5)
+    ]
+    for i in range(10):
+        campaign = NewsletterCampaign.objects.create(name=f'Campagne {i}', template=templates[i % 5])
+        campaign.subscribers.add(*rng.sample(subscriber_objects, min(50, len(subscriber_objects))))
+
+    for i in range(8):
+        Service.objects.create(title=f'Service {i}', description='Installation et maintenance', order=i)
+    settings = SiteSettings.load()
+    for name, _ in SocialLink._meta.get_field('name').choices:
+        settings.social_links.add(SocialLink.objects.create(name=name, url=f'https://example.com/{name}'))
+
+    active_products = [product for product in product_objects if product.is_active]
+    return {
+        # Catégorie avec sous-catégories et le plus de produits directs
+        'category': Category.objects.filter(children__isnull=False).annotate(
+            direct_total=Count('products', distinct=True)
+        ).order_by('-direct_total', 'pk').first(),
+        'product': active_products[0],
+        'promotion': created_promotions[0],
+        'quote_ids': [product.pk for product in active_products[:20]],
+    }
+
+
+def get_benchmark_user():
+    User = get_user_model()
+    user, _ = User.objects.get_or_create(
+        username='benchmark', defaults={'is_staff': True, 'is_superuser': True}
+    )
+    return user
+
+
+def measure(endpoint, catalog, page_size=None, client=None, user=None):
+    """Exécute une requête et retourne (statut, requêtes SQL, secondes, octets)."""
+    client = client or APIClient()
+    if endpoint.auth:
+        client.force_authenticate(user or get_benchmark_user())
+
+    args = []
+    if endpoint.lookup:
+        key, attribute = endpoint.lookup
+        args = [getattr(catalog[key], attribute)]
+    url = reverse(endpoint.url_name, args=args)
+
+    kwargs = {}
+    if endpoint.method == 'post':
+        kwargs = {'data': endpoint.data(catalog), 'format': 'json'}
+    else:
+        params = endpoint.data(catalog) if endpoint.data else {}
+        if endpoint.paginated and page_size:
+            params['page_size'] = page_size
+        if params:
+            kwargs = {'data': params}
+
+    with CaptureQueriesContext(connection) as context:
+        started = time.perf_counter()
+        response = getattr(client, endpoint.method)(url, **kwargs)
+        elapsed = time.perf_counter() - started
+
+    client.force_authenticate(None)
+    return response.status_code, len(context.captured_queries), elapsed, len(response.content)
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+def run_benchmark(catalog, page_sizes=(10, 50, 100), endpoints=ENDPOINTS):
+    """
+    Mesure chaque scénario (et chaque taille de page pour les listes paginées).
+
+    Une première requête non mesurée remplit les caches (compteurs de
+    catégories, index des promotions) : les chiffres sont ceux du régime établi.
+    Le cache des réponses est désactivé pour mesurer le chemin ORM + sérialiseurs.
+    """
+    client = APIClient()
+    user = get_benchmark_user()
+    rows = []
+    for endpoint in endpoints:
+        sizes = page_sizes if endpoint.paginated else (None,)
+        measure(endpoint, catalog, sizes[0], client, user)
+        for page_size in sizes:
+            status, queries, elapsed, size = measure(endpoint, catalog, page_size, client, user)
+            rows.append({
+                'endpoint': endpoint,
+                'page_size': page_size,
+                'status': status,
+                'queries': queries,
+                'seconds': elapsed,
+                'bytes': size,
+            })
+    return rows
@@ -0,0 +1,129 @@
+"""
+Compteurs de génération partagés pour l'invalidation des caches.
+
+Chaque espace de noms (``promotions``, ``catalog``...) possède un entier stocké
+dans le cache Django. Les signaux l'incrémentent à chaque modification ; les
+caches construits à partir des données incluent la génération dans leur clé
+ou la comparent avant usage, ce qui les invalide sans suppression explicite.
+
+single_flight() coalesce le recalcul des entrées coûteuses : un seul processus
+recalcule une entrée absente ou périmée, les autres servent la valeur périmée
+ou attendent brièvement le résultat.
+"""
+import time
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from .constants import SINGLE_FLIGHT_LOCK_SECONDS, SINGLE_FLIGHT_POLL_INTERVAL, SINGLE_FLIGHT_WAIT_SECONDS
+
+GENERATION_KEY = 'showcase:generation:{}'
+CHANGED_AT_KEY = 'showcase:generation-changed-at:{}'
+
+# Catégories et produits : arborescence, compteurs par sous-arbre
+CATALOG_NAMESPACE = 'catalog'
+
+# Un espace par modèle (« model:showcase.product »...), incrémenté par les signaux
+MODEL_NAMESPACE = 'model:{}'
+
+
+def get_generation(namespace):
+    """Retourne la génération courante d'un espace de noms (1 par défaut)."""
+    key = GENERATION_KEY.format(namespace)
+    value = cache.get(key)
+    if value is None:
+        cache.add(key, 1, timeout=None)
+        value = cache.get(key, 1)
+    return value
+
+
+def bump_generation(namespace):
+    """Incrémente la génération d'un espace de noms et retourne la nouvelle valeur."""
+    key = GENERATION_KEY.format(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+        return cache.incr(key)
+
+
+def invalidate_catalog():
+    """Invalide les caches dérivés des catégories et des produits."""
+    return bump_generation(CATALOG_NAMESPACE)
+
+
+def model_namespace(model):
+    return MODEL_NAMESPACE.format(model._meta.label_lower)
+
+
+def get_model_generations(models):
+    """Générations des modèles donnés, lues en un seul aller-retour au cache."""
+    keys = [GENERATION_KEY.format(model_namespace(model)) for model in models]
+    values = cache.get_many(keys)
+    return tuple(
+        values[key] if key in values else get_generation(model_namespace(model))
+        for key, model in zip(keys, models)
+    )
+
+
+def bump_model_generation(*models):
+    """Invalide les caches dérivés des modèles donnés (écritures sans signal : update(), bulk_update())."""
+    now = time.time()
+    for model in models:
+        bump_generation(model_namespace(model))
+        cache.set(CHANGED_AT_KEY.format(model_namespace(model)), now, timeout=None)
+
+
+def last_model_change(models):
+    """Horodatage (secondes) de la dernière modification connue parmi les modèles donnés, ou None."""
+    keys = [CHANGED_AT_KEY.format(model_namespace(model)) for model in models]
+    return max(cache.get_many(keys).values(), default=None)
+
+
+def store(key, value, version=None, timeout=DEFAULT_TIMEOUT):
+    """Écrit une entrée au format de single_flight() (précalcul hors requête)."""
+    cache.set(key, {'version': version, 'created_at': time.time(), 'value': value}, timeout)
+
+
+def single_flight(key, compute, version=None, max_age=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Retourne (valeur, issue) pour l'entrée `key`, recalculée par une seule requête à la fois.
+
+    L'entrée est fraîche si elle a été calculée pour `version` (génération...)
+    et, si `max_age` est donné, il y a moins de `max_age` secondes. Sinon, la
+    requête qui obtient le verrou `{key}:lock` (cache.add : verrou partagé sous
+    Redis, local au processus avec LocMem) appelle compute() ; les autres
+    servent la valeur périmée ou, à défaut, attendent jusqu'à
+    SINGLE_FLIGHT_WAIT_SECONDS avant de calculer elles-mêmes.
+
+    `issue` vaut 'hit', 'stale' ou 'miss' (valeur calculée par cet appel).
+    Une valeur None renvoyée par compute() n'est pas mise en cache.
+    """
+    def is_fresh(entry):
+        return entry is not None and entry['version'] == version and (
+            max_age is None or time.time() - entry['created_at'] < max_age
+        )
+
+    entry = cache.get(key)
+    if is_fresh(entry):
+        return entry['value'], 'hit'
+
+    lock_key = f'{key}:lock'
+    if not cache.add(lock_key, True, SINGLE_FLIGHT_LOCK_SECONDS):
+        if entry is not None:
+            return entry['value'], 'stale'
+        deadline = time.monotonic() + SINGLE_FLIGHT_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+            entry = cache.get(key)
+            if is_fresh(entry):
+                return entry['value'], 'hit'
+        return compute(), 'miss'
+
+    try:
+        value = compute()
+        if value is not None:
+            store(key, value, version, timeout)
+    finally:
+        cache.delete(lock_key)
+    return value, 'miss'
@@ -0,0 +1,133 @@
+"""
+Requêtes GET conditionnelles (ETag / Last-Modified) des viewsets de l'API.
+
+- Détail : ETag fort calculé à partir de (pk, updated_at) de l'objet.
+- Liste : ETag faible calculé à partir de max(updated_at) et du nombre de
+  lignes du queryset filtré (un seul agrégat) et des paramètres de requête.
+  Le nombre de lignes est repris par la pagination (pas de second COUNT) ;
+  il n'est pas calculé pour la pagination par curseur, qui n'en a pas besoin.
+
+Les deux incluent les générations des modèles dont dépend la réponse
+(images, promotions...), et Last-Modified tient compte de leur date de
+dernière modification : une modification sans updated_at (retarification,
+suppression) change aussi les validateurs. Les compteurs de vues et de clics,
+appliqués en base par lots, n'en font pas partie.
+
+If-None-Match (prioritaire) ou If-Modified-Since évitent alors la
+sérialisation : la réponse est un 304 sans corps.
+"""
+import hashlib
+from calendar import timegm
+
+from django.db.models import Count, Max
+from django.utils.cache import parse_etags
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from .caching import get_model_generations, last_model_change
+
+VALIDATOR_HEADERS = ('ETag', 'Last-Modified')
+
+
+def is_not_modified(request, etag, last_modified):
+    """Évalue If-None-Match (comparaison faible) puis, à défaut, If-Modified-Since."""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        if if_none_match.strip() == '*':
+            return True
+        opaque = etag.removeprefix('W/')
+        return any(tag.removeprefix('W/') == opaque for tag in parse_etags(if_none_match))
+
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE'))
+    if if_modified_since is not None and last_modified is not None:
+        return int(last_modified) <= if_modified_since
+    return False
+
+
+def not_modified_response(headers):
+    return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def conditional_response(request, headers):
+    """Réponse 304 si les validateurs enregistrés (en-têtes ETag / Last-Modified) correspondent, sinon None."""
+    etag = headers.get('ETag')
+    last_modified = parse_http_date_safe(headers.get('Last-Modified'))
+    if etag and is_not_modified(request, etag, last_modified):
+        return not_modified_response(headers)
+    return None
+
+
+class ConditionalGetMixin:
+    """
+    Ajoute ETag et Last-Modified aux actions listées dans conditional_actions
+    et répond 304 aux requêtes conditionnelles correspondantes.
+
+    cache_models énumère les modèles dont dépend le contenu des réponses
+    (partagé avec CachedResponseMixin).
+    """
+
+    conditional_actions = ('list', 'retrieve')
+    cache_models = ()
+    queryset_count = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in ('GET', 'HEAD') and self.action in self.conditional_actions:
+            handler_name = request.method.lower()
+            setattr(self, handler_name, self.conditional_handler(getattr(self, handler_name)))
+
+    def get_validator_headers(self, request):
+        """Retourne {'ETag', 'Last-Modified'}, ou None si l'objet demandé n'existe pas."""
+        queryset = self.filter_queryset(self.get_queryset()).order_by().prefetch_related(None)
+
+        if self.action == 'retrieve':
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            row = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            ).values_list('pk', 'updated_at').first()
+            if row is None:
+                return None
+            version, updated_at, weak = row, row[1], False
+        else:
+            aggregates = {'last_updated': Max('updated_at')}
+            counts_rows = getattr(self.paginator, 'counts_rows', None)
+            if counts_rows is not None and counts_rows(request):
+                aggregates['total'] = Count('pk')
+            summary = queryset.aggregate(**aggregates)
+            self.queryset_count = summary.get('total')
+            version, updated_at, weak = (summary['last_updated'], self.queryset_count), summary['last_updated'], True
+
+        params = sorted((name, sorted(values)) for name, values in request.query_params.lists())
+        digest = hashlib.md5(repr((
+            type(self).__name__, self.action, request.path, params,
+            request.user.is_authenticated, version, get_model_generations(self.cache_models),
+        )).encode(), usedforsecurity=False).hexdigest()
+
+        timestamps = [timegm(updated_at.utctimetuple())] if updated_at else []
+        changed_at = last_model_change(self.cache_models)
+        if changed_at is not None:
+            timestamps.append(int(changed_at))
+
+        headers = {'ETag': f'W/"{digest}"' if weak else f'"{digest}"'}
+        if timestamps:
+            headers['Last-Modified'] = http_date(max(timestamps))
+        return headers
+
+    def conditional_handler(self, handler):
+        def wrapped(request, *args, **kwargs):
+            headers = self.get_validator_headers(request)
+            if headers is None:
+                return handler(request, *args, **kwargs)
+
+            response = conditional_response(request, headers)
+            if response is not None:
+                return response
+
+            response = handler(request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                for name, value in headers.items():
+                    response[name] = value
+            return response
+
+        return wrapped
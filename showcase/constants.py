@@ -4,8 +4,80 @@ FEATURED_SCORE_THRESHOLD = Decimal('70.0')
 RECOMMENDATION_SCORE_THRESHOLD = Decimal('65.0')
 
 MAX_IMAGES_PER_PRODUCT = 10
+MAX_PAGE_SIZE = 100
+MAX_QUOTE_LINES = 100
 NEW_PRODUCT_DAYS_THRESHOLD = 30
 
+PROMOTION_INDEX_CHECK_INTERVAL = 2  # secondes
+SITE_SETTINGS_CHECK_INTERVAL = 2  # secondes entre deux lectures des générations partagées
+SITE_SETTINGS_RELOAD_INTERVAL = 5 * 60  # secondes, relecture complète (vidage du cache partagé)
+WHATSAPP_LINK_CACHE_SIZE = 5000  # liens WhatsApp précalculés gardés par processus
+REPRICE_CHUNK_SIZE = 500
+REPRICE_DEBOUNCE_SECONDS = 5
+RESCORE_BATCH_SIZE = 1000
+RESCORE_DEBOUNCE_SECONDS = 10  # les demandes de recalcul rapprochées partagent une tâche
+
+COUNTER_FLUSH_INTERVAL = 30  # secondes
+COUNTER_FLUSH_CHUNK_SIZE = 500
+COUNTER_SHARDS = 16
+ENGAGEMENT_HISTORY_DAYS = 90  # jours de vues/clics conservés par produit (ProductDailyStats)
+
+# Produits tendance : vues et clics à décroissance exponentielle (voir TrendingService)
+TRENDING_HALF_LIFE_HOURS = 24  # un événement compte moitié moins au bout de 24 h
+TRENDING_WEIGHTS = {'views': 1, 'whatsapp_clicks': 3}
+TRENDING_EPOCH = 1735689600  # 2025-01-01 UTC, origine des scores stockés
+TRENDING_MIN_SCORE = 0.1  # score courant minimal pour figurer dans les tendances
+
+CATALOG_CACHE_TIMEOUT = 60 * 60 * 24  # secondes, clé versionnée par génération
+
+# Rayons précalculés (vedettes, recommandés, nouveautés, tendances) : voir ShelfService
+SHELF_MAX_SIZE = 1000  # identifiants gardés par rayon
+SHELF_FRESH_SECONDS = 60  # les tendances et nouveautés évoluent sans signal
+SHELF_DEBOUNCE_SECONDS = 5
+
+# Recalcul coalescé des entrées de cache coûteuses (voir caching.single_flight)
+SINGLE_FLIGHT_LOCK_SECONDS = 30  # durée maximale du verrou de recalcul
+SINGLE_FLIGHT_WAIT_SECONDS = 2  # attente d'un recalcul en cours quand aucune valeur périmée n'existe
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+# Recherche plein texte : poids par champ (lettres A-D pour SearchVector côté PostgreSQL)
+SEARCH_FIELD_WEIGHTS = {
+    'name': (8, 'A'),
+    'brand': (4, 'B'),
+    'sku': (4, 'B'),
+    'barcode': (4, 'B'),
+    'short_description': (2, 'C'),
+    'description': (1, 'D'),
+}
+SEARCH_MIN_TOKEN_LENGTH = 2
+SEARCH_POPULARITY_BOOST = 0.1  # rang × (1 + boost × ln(1 + vues + 3 × clics))
+SEARCH_STOPWORDS = frozenset({
+    'a', 'au', 'aux', 'avec', 'ce', 'ces', 'd', 'dans', 'de', 'des', 'du', 'elle', 'en',
+    'est', 'et', 'il', 'l', 'la', 'le', 'les', 'leur', 'mais', 'ou', 'par', 'pas', 'plus',
+    'pour', 'qui', 'que', 'sa', 'sans', 'se', 'ses', 'son', 'sur', 'un', 'une', 'vos', 'votre',
+})
+
+# Autocomplétion (index de préfixes en mémoire de chaque processus)
+AUTOCOMPLETE_DEFAULT_LIMIT = 5
+AUTOCOMPLETE_MAX_LIMIT = 10
+AUTOCOMPLETE_MIN_SIMILARITY = 0.35  # similarité trigrammes pour la tolérance aux fautes
+AUTOCOMPLETE_CHECK_INTERVAL = 2  # secondes entre deux lectures de la génération partagée
+AUTOCOMPLETE_REBUILD_INTERVAL = 15 * 60  # secondes, rafraîchit la popularité
+
+# Tranches de prix (FCFA) : filtre admin et facettes de l'API ; (clé, libellé, min inclus, max exclu)
+PRICE_BUCKETS = (
+    ('<10k', 'Moins de 10k FCFA', None, 10000),
+    ('10k-50k', '10k - 50k FCFA', 10000, 50000),
+    ('50k-100k', '50k - 100k FCFA', 50000, 100000),
+    ('>100k', 'Plus de 100k FCFA', 100000, None),
+)
+FACETS_CACHE_TIMEOUT = 5 * 60  # secondes ; les prix effectifs changent sans signal (retarification)
+FACETS_STALE_TIMEOUT = 60 * 60  # conservation des compteurs périmés servis pendant un recalcul
+
+# Cache des réponses GET anonymes (voir showcase/response_cache.py)
+RESPONSE_CACHE_FRESH_SECONDS = 60  # au-delà, servie périmée pendant qu'une requête la recalcule
+RESPONSE_CACHE_TIMEOUT = 60 * 60  # durée de vie maximale d'une entrée
+
 SCORE_WEIGHTS = {
     'views': Decimal('30.0'),
     'whatsapp_clicks': Decimal('25.0'),
@@ -0,0 +1,65 @@
+"""
+Formatage des prix en FCFA, sans locale.
+
+Le regroupement des milliers est fait sur l'entier (ou le Decimal arrondi au
+centime) par le mini-langage de format de Python, puis les séparateurs sont
+remplacés par une table de traduction précompilée : espace fine insécable
+entre les milliers, virgule décimale, espace insécable avant la devise
+(« 1 999 FCFA », « 1 999,50 FCFA »). Aucun appel à locale.setlocale, global
+au processus et non thread-safe, ni passage par float.
+"""
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+THOUSANDS_SEPARATOR = '\u202f'  # espace fine insécable
+CURRENCY_SUFFIX = '\u00a0FCFA'  # espace insécable
+EMPTY_PRICE = '—'
+CENTS = Decimal('0.01')
+UNITS = Decimal('1')
+
+_SEPARATORS = str.maketrans({',': THOUSANDS_SEPARATOR, '.': ','})
+
+
+def to_decimal(price):
+    if isinstance(price, Decimal):
+        return price
+    if isinstance(price, float):
+        return Decimal(repr(price))
+    return Decimal(price)
+
+
+def format_fcfa(price, with_decimals=False, display_mode=True):
+    """
+    Formate un prix en FCFA.
+
+    :param price: Decimal, int, float ou chaîne numérique
+    :param with_decimals: bool, True pour afficher 2 décimales
+    :param display_mode: bool, True pour affichage utilisateur ("—" si None),
+                         False pour logique interne ("0 FCFA" si None)
+    """
+    if price is None:
+        return EMPTY_PRICE if display_mode else f'0{CURRENCY_SUFFIX}'
+
+    if isinstance(price, int) and not with_decimals:
+        return f'{price:,}'.translate(_SEPARATORS) + CURRENCY_SUFFIX
+
+    try:
+        value = to_decimal(price)
+        if with_decimals:
+            formatted = f'{value.quantize(CENTS, rounding=ROUND_HALF_UP):,.2f}'
+        else:
+            formatted = f'{int(value.quantize(UNITS, rounding=ROUND_HALF_UP)):,}'
+    except (InvalidOperation, TypeError, ValueError):
+        return f'{price}{CURRENCY_SUFFIX}'
+    return formatted.translate(_SEPARATORS) + CURRENCY_SUFFIX
+
+
+def format_prices(prices, with_decimals=False, display_mode=True):
+    """Formate une liste de prix (chaque valeur distincte n'est formatée qu'une fois)."""
+    formatted = {}
+    results = []
+    for price in prices:
+        text = formatted.get(price)
+        if text is None:
+            text = formatted[price] = format_fcfa(price, with_decimals, display_mode)
+        results.append(text)
+    return results
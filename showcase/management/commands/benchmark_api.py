@@ -0,0 +1,83 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+
+from showcase.benchmark import run_benchmark, seed_catalog
+from showcase.caching import invalidate_catalog
+from showcase.services.autocomplete import invalidate_autocomplete_index
+from showcase.services.counter_service import CounterService, LocalCounterBackend
+from showcase.services.promotion_index import invalidate_promotion_index
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure requêtes SQL, temps et taille de réponse de chaque endpoint de l'API "
+        "sur un catalogue généré (dans une transaction annulée à la fin)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--categories', type=int, default=300)
+        parser.add_argument('--products', type=int, default=3000)
+        parser.add_argument('--promotions', type=int, default=40)
+        parser.add_argument('--subscribers', type=int, default=1000)
+        parser.add_argument(
+            '--page-sizes', default='10,50,100',
+            help='Tailles de page séparées par des virgules (listes paginées)'
+        )
+
+    def handle(self, *args, **options):
+        page_sizes = tuple(int(size) for size in options['page_sizes'].split(','))
+
+        self.stdout.write('📦 Génération du catalogue...')
+        # Compteurs isolés : les deltas en attente du site (Redis en production)
+        # ne sont ni mélangés au benchmark ni effacés à la fin
+        shared_backend = CounterService._backend
+        CounterService._backend = LocalCounterBackend()
+        try:
+            with transaction.atomic(), override_settings(ALLOWED_HOSTS=['*']):
+                catalog = seed_catalog(
+                    categories=options['categories'],
+                    products=options['products'],
+                    promotions=options['promotions'],
+                    subscribers=options['subscribers'],
+                )
+                rows = run_benchmark(catalog, page_sizes=page_sizes)
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            # Les caches ne doivent rien garder du catalogue annulé
+            CounterService._backend = shared_backend
+            invalidate_catalog()
+            invalidate_promotion_index()
+            invalidate_autocomplete_index()
+
+        self.print_table(rows)
+
+    def print_table(self, rows):
+        header = f"{'Endpoint':<32} {'Page':>5} {'HTTP':>5} {'Requêtes':>10} {'Temps (ms)':>11} {'Taille (Ko)':>12}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+
+        over_budget = 0
+        for row in rows:
+            endpoint = row['endpoint']
+            queries = f"{row['queries']}/{endpoint.max_queries}"
+            line = (
+                f"{endpoint.name:<32} {row['page_size'] or '-':>5} {row['status']:>5} {queries:>10} "
+                f"{row['seconds'] * 1000:>11.1f} {row['bytes'] / 1024:>12.1f}"
+            )
+            if row['queries'] > endpoint.max_queries or row['status'] >= 400:
+                over_budget += 1
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        if over_budget:
+            self.stdout.write(self.style.ERROR(f'❌ {over_budget} mesure(s) hors budget'))
+        else:
+            self.stdout.write(self.style.SUCCESS('✅ Tous les endpoints respectent leur budget de requêtes'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from showcase.services.category_stats import CategoryStatsService
+
+
+class Command(BaseCommand):
+    help = 'Reconstruit les statistiques par catégorie (prix moyen, vues triées) à partir du catalogue'
+
+    def handle(self, *args, **kwargs):
+        stats = CategoryStatsService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'✅ Statistiques reconstruites pour {len(stats)} catégorie(s)'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from showcase.services.search_service import SearchService
+
+
+class Command(BaseCommand):
+    help = "Reconstruit l'index de recherche plein texte de tous les produits"
+
+    def handle(self, *args, **kwargs):
+        indexed = SearchService.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'✅ {indexed} produit(s) indexé(s)'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from showcase.services.repricing_service import RepricingService
+
+
+class Command(BaseCommand):
+    help = 'Recalcule le prix effectif (promotions incluses) de tous les produits'
+
+    def handle(self, *args, **kwargs):
+        updated = RepricingService.reprice()
+        self.stdout.write(self.style.SUCCESS(f'✅ {updated} produit(s) retarifé(s)'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from showcase.services.scoring_service import ScoringService
+
+
+class Command(BaseCommand):
+    help = 'Recalcule les scores vedette/recommandation de tout le catalogue en une passe'
+
+    def handle(self, *args, **kwargs):
+        updated = ScoringService.rescore_catalog()
+        self.stdout.write(self.style.SUCCESS(f'✅ Scores mis à jour pour {updated} produit(s)'))
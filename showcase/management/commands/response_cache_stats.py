@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+import showcase.views  # noqa: F401  (enregistre les vues en cache)
+from showcase.response_cache import response_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Affiche les compteurs HIT / STALE / MISS du cache des réponses par vue'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Remet les compteurs à zéro après affichage')
+
+    def handle(self, *args, **options):
+        header = f"{'Vue':<24} {'HIT':>8} {'STALE':>8} {'MISS':>8} {'Taux':>7}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for view, counts in response_cache_stats(reset=options['reset']).items():
+            ratio = f"{counts['hit_ratio']:.0%}" if counts['hit_ratio'] is not None else '-'
+            self.stdout.write(
+                f"{view:<24} {counts['hit']:>8} {counts['stale']:>8} {counts['miss']:>8} {ratio:>7}"
+            )
+        if options['reset']:
+            self.stdout.write(self.style.SUCCESS('✅ Compteurs remis à zéro'))
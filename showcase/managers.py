@@ -1,10 +1,20 @@
 from datetime import timedelta
 from decimal import Decimal
+from django.core.cache import cache
 from django.db import models
 from django.db.models import Avg, Count, F, Q
+from django.db.models.query import ModelIterable
 from django.utils import timezone
 
-from .constants import FEATURED_SCORE_THRESHOLD, RECOMMENDATION_SCORE_THRESHOLD, NEW_PRODUCT_DAYS_THRESHOLD
+from .caching import CATALOG_NAMESPACE, get_generation, single_flight
+from .constants import (
+    FEATURED_SCORE_THRESHOLD, RECOMMENDATION_SCORE_THRESHOLD, NEW_PRODUCT_DAYS_THRESHOLD,
+    CATALOG_CACHE_TIMEOUT, TRENDING_MIN_SCORE,
+)
+
+SUBTREE_COUNTS_KEY = 'showcase:category-counts'
+PATH_NAMES_KEY = 'showcase:category-paths:{}'
+EMPTY_SUBTREE_COUNTS = {'total': 0, 'active': 0, 'available': 0, 'direct': 0}
 
 
 class ProductQuerySet(models.QuerySet):
@@ -39,15 +49,21 @@ class ProductQuerySet(models.QuerySet):
             in_stock=True
         ).select_related('category').prefetch_related('images')
 
-    def best_sellers(self):
+    def trending(self, min_score=TRENDING_MIN_SCORE):
+        """Produits actifs par score de tendance décroissant (parcours de l'index, sans agrégat)."""
+        from .services.trending import TrendingService
+
         return self.filter(
             is_active=True,
-            in_stock=True
+            status__trending_score__gte=TrendingService.threshold(min_score)
         ).select_related('category', 'status').prefetch_related('images').order_by(
-            '-status__whatsapp_click_count',
-            '-status__view_count'
+            '-status__trending_score'
         )
 
+    def best_sellers(self):
+        # Activité récente (vues et clics décroissants) plutôt que totaux cumulés
+        return self.trending().filter(in_stock=True)
+
     def by_category(self, category):
         descendant_ids = category.get_descendants(include_self=True).values_list('id', flat=True)
         return self.filter(category_id__in=descendant_ids)
@@ -90,11 +106,35 @@ class ProductManager(models.Manager):
     def new_arrivals(self, limit=10):
         return self.get_queryset().new_arrivals().order_by('-created_at')[:limit]
 
+    def trending(self, limit=10):
+        return self.get_queryset().trending()[:limit]
+
     def best_sellers(self, limit=10):
         return self.get_queryset().best_sellers()[:limit]
 
 
+class CategoryTreeDataIterable(ModelIterable):
+    """
+    Attache à chaque catégorie ses compteurs de sous-arbre et le nom de ses
+    ancêtres, lus dans le cache catalogue une seule fois par itération.
+    """
+
+    def __iter__(self):
+        manager = self.queryset.model.objects
+        counts = manager.subtree_counts()
+        path_names = manager.path_names()
+        for category in super().__iter__():
+            category._subtree_counts = counts.get(category.pk, EMPTY_SUBTREE_COUNTS)
+            category._path_names = path_names.get(category.pk)
+            yield category
+
+
 class CategoryQuerySet(models.QuerySet):
+    def with_tree_data(self):
+        clone = self._chain()
+        clone._iterable_class = CategoryTreeDataIterable
+        return clone
+
     def with_product_count(self):
         return self.annotate(
             direct_products=Count('products', filter=Q(products__is_active=True))
@@ -117,6 +157,64 @@ class CategoryManager(models.Manager):
     def with_product_count(self):
         return self.get_queryset().with_product_count()
 
+    def with_tree_data(self):
+        return self.get_queryset().with_tree_data()
+
+    def subtree_counts(self):
+        """
+        Nombre de produits par sous-arbre pour toutes les catégories.
+
+        Retourne {category_id: {'total', 'active', 'available', 'direct'}}, où
+        available = actif et en stock. Mis en cache pour la génération « catalog »
+        et recalculé par une seule requête à la fois (single_flight).
+        """
+        counts, _ = single_flight(
+            SUBTREE_COUNTS_KEY, self.compute_subtree_counts,
+            version=get_generation(CATALOG_NAMESPACE), timeout=CATALOG_CACHE_TIMEOUT,
+        )
+        return counts
+
+    def path_names(self):
+        """Noms des ancêtres (catégorie incluse) de chaque catégorie : {category_id: [noms]}."""
+        key = PATH_NAMES_KEY.format(get_generation(CATALOG_NAMESPACE))
+        paths = cache.get(key)
+        if paths is None:
+            paths = {}
+            rows = self.get_queryset().order_by('tree_id', 'lft').values_list('id', 'parent_id', 'name')
+            for category_id, parent_id, name in rows:
+                paths[category_id] = paths.get(parent_id, []) + [name]
+            cache.set(key, paths, CATALOG_CACHE_TIMEOUT)
+        return paths
+
+    def compute_subtree_counts(self):
+        """
+        Calcule les compteurs en une requête groupée.
+
+        Les comptages directs sont lus dans l'ordre MPTT (tree_id, lft) : en
+        parcourant la liste à rebours, chaque sous-arbre [lft, rght] est
+        complet avant d'être ajouté à son parent.
+        """
+        rows = self.get_queryset().order_by('tree_id', 'lft').annotate(
+            total=Count('products'),
+            active=Count('products', filter=Q(products__is_active=True)),
+            available=Count('products', filter=Q(
+                products__is_active=True, products__in_stock=True, products__stock_quantity__gt=0
+            )),
+        ).values_list('id', 'parent_id', 'total', 'active', 'available')
+
+        counts = {}
+        parents = []
+        for category_id, parent_id, total, active, available in rows:
+            counts[category_id] = {'total': total, 'active': active, 'available': available, 'direct': total}
+            parents.append((category_id, parent_id))
+
+        for category_id, parent_id in reversed(parents):
+            if parent_id is not None:
+                node, parent = counts[category_id], counts[parent_id]
+                for field in ('total', 'active', 'available'):
+                    parent[field] += node[field]
+        return counts
+
 
 class PromotionQuerySet(models.QuerySet):
     def active(self):
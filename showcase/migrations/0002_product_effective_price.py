@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 00:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_effective_price(apps, schema_editor):
+    # Valeur initiale sans promotion ; `manage.py reprice_catalog` applique ensuite les promotions
+    Product = apps.get_model('showcase', 'Product')
+    Product.objects.update(effective_price=models.F('price'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='best_promotion',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='showcase.promotion', verbose_name='Promotion appliquée'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='effective_discount_percent',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='Remise promotion (%)'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='effective_price',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, editable=False, max_digits=10, null=True, verbose_name='Prix effectif (promotions incluses)'),
+        ),
+        migrations.RunPython(backfill_effective_price, migrations.RunPython.noop),
+    ]
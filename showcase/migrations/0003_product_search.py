@@ -0,0 +1,52 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:06
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS showcase_product_search_vector_gin '
+            'ON showcase_product USING GIN (search_vector)'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS showcase_product_search_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0002_product_effective_price'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='ProductSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='showcase.product')),
+            ],
+            options={
+                'verbose_name': 'Jeton de recherche',
+                'verbose_name_plural': 'Jetons de recherche',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='productsearchtoken',
+            constraint=models.UniqueConstraint(fields=('token', 'product'), name='unique_search_token_per_product'),
+        ),
+        # Le contenu de l'index est construit par `manage.py rebuild_search_index`
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:28
+
+import re
+
+from django.db import migrations, models
+
+SKU_RE = re.compile(r'^(?P<prefix>.+)-(?P<number>\d+)$')
+
+
+def seed_sku_sequences(apps, schema_editor):
+    Product = apps.get_model('showcase', 'Product')
+    SkuSequence = apps.get_model('showcase', 'SkuSequence')
+    highest = {}
+    for sku in Product.objects.values_list('sku', flat=True).iterator():
+        match = SKU_RE.match(sku or '')
+        if match:
+            prefix, number = match['prefix'], int(match['number'])
+            highest[prefix] = max(highest.get(prefix, 0), number)
+    SkuSequence.objects.bulk_create([
+        SkuSequence(prefix=prefix, last_value=number)
+        for prefix, number in highest.items() if len(prefix) <= 20
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0003_product_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkuSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=20, unique=True)),
+                ('last_value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Séquence de SKU',
+                'verbose_name_plural': 'Séquences de SKU',
+            },
+        ),
+        migrations.RunPython(seed_sku_sequences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0004_sku_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productstatus',
+            name='scores_dirty',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='productstatus',
+            index=models.Index(condition=models.Q(('scores_dirty', True)), fields=['product'], name='productstatus_scores_dirty'),
+        ),
+    ]
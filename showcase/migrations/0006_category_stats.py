@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0005_productstatus_scores_dirty'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryStats',
+            fields=[
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='showcase.category')),
+                ('active_count', models.PositiveIntegerField(default=0)),
+                ('available_count', models.PositiveIntegerField(default=0)),
+                ('available_price_sum', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('view_counts', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Statistiques de catégorie',
+                'verbose_name_plural': 'Statistiques de catégories',
+            },
+        ),
+    ]
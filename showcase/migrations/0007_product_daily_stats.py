@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0006_category_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('clicks', models.PositiveIntegerField(default=0)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='showcase.product')),
+            ],
+            options={
+                'verbose_name': 'Statistiques journalières produit',
+                'verbose_name_plural': 'Statistiques journalières produits',
+                'indexes': [models.Index(fields=['date'], name='showcase_pr_date_d21f84_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='productdailystats',
+            constraint=models.UniqueConstraint(fields=('product', 'date'), name='productdailystats_product_date'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0007_product_daily_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productstatus',
+            name='trending_score',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True, verbose_name='Score tendance'),
+        ),
+    ]
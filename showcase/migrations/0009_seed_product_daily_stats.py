@@ -0,0 +1,43 @@
+from django.db import migrations
+from django.db.models import Q
+from django.utils import timezone
+
+
+def seed_daily_stats(apps, schema_editor):
+    """
+    Compartiments initiaux à partir des compteurs cumulés.
+
+    Les vues sont datées du dernier affichage et les clics du jour : la somme
+    sur 30 jours reproduit l'ancienne estimation (vues extrapolées depuis
+    last_viewed_at, clics cumulés) jusqu'à ce que l'historique réel prenne
+    le relais.
+    """
+    ProductStatus = apps.get_model('showcase', 'ProductStatus')
+    ProductDailyStats = apps.get_model('showcase', 'ProductDailyStats')
+    today = timezone.localdate()
+    rows = ProductStatus.objects.filter(
+        Q(view_count__gt=0) | Q(whatsapp_click_count__gt=0)
+    ).values_list('product_id', 'view_count', 'whatsapp_click_count', 'last_viewed_at').iterator()
+
+    buckets = {}
+    for product_id, views, clicks, last_viewed_at in rows:
+        if views and last_viewed_at:
+            buckets.setdefault((product_id, timezone.localdate(last_viewed_at)), [0, 0])[0] += views
+        if clicks:
+            buckets.setdefault((product_id, today), [0, 0])[1] += clicks
+
+    ProductDailyStats.objects.bulk_create([
+        ProductDailyStats(product_id=product_id, date=date, views=views, clicks=clicks)
+        for (product_id, date), (views, clicks) in buckets.items()
+    ], batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('showcase', '0008_productstatus_trending_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_daily_stats, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,11 @@
 from .category import Category
 from .product import Product, ProductStatus, ProductImage
 from .promotion import Promotion, PromotionUsage
+from .search import ProductSearchToken
+from .sequence import SkuSequence
 from .service import Service
 from .settings import SiteSettings, SocialLink
+from .stats import CategoryStats, ProductDailyStats
 from .newsletter import (
     NewsletterSubscriber,
     NewsletterTemplate,
@@ -16,9 +19,13 @@ __all__ = [
     'ProductImage',
     'Promotion',
     'PromotionUsage',
+    'ProductSearchToken',
+    'SkuSequence',
     'Service',
     'SiteSettings',
     'SocialLink',
+    'CategoryStats',
+    'ProductDailyStats',
     'NewsletterSubscriber',
     'NewsletterTemplate',
     'NewsletterCampaign',
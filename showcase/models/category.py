@@ -4,7 +4,7 @@ from django.utils.text import slugify
 from mptt.models import MPTTModel, TreeForeignKey
 
 from ..constants import ICON_FORMATS
-from ..managers import CategoryManager
+from ..managers import CategoryManager, EMPTY_SUBTREE_COUNTS
 
 
 class Category(MPTTModel):
@@ -55,13 +55,29 @@ class Category(MPTTModel):
     def is_main_category(self):
         return self.is_root_node()
 
+    @property
+    def subtree_counts(self):
+        counts = getattr(self, '_subtree_counts', None)
+        if counts is None:
+            counts = Category.objects.subtree_counts().get(self.pk, EMPTY_SUBTREE_COUNTS)
+            self._subtree_counts = counts
+        return counts
+
     @property
     def product_count(self):
-        return self.get_all_products().count()
+        return self.subtree_counts['total']
+
+    @property
+    def active_product_count(self):
+        return self.subtree_counts['active']
+
+    @property
+    def available_product_count(self):
+        return self.subtree_counts['available']
 
     @property
     def direct_product_count(self):
-        return self.products.count()
+        return self.subtree_counts['direct']
 
     def get_all_products(self):
         descendant_ids = self.get_descendants(include_self=True).values_list('id', flat=True)
@@ -75,5 +91,9 @@ class Category(MPTTModel):
         return self.get_siblings(include_self=True)
 
     def get_full_path(self, separator=' > '):
-        ancestors = self.get_ancestors(include_self=True)
-        return separator.join([cat.name for cat in ancestors])
+        names = getattr(self, '_path_names', None)
+        if names is None:
+            names = Category.objects.path_names().get(self.pk)
+        if names is None:
+            names = [cat.name for cat in self.get_ancestors(include_self=True)]
+        return separator.join(names)
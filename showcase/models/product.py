@@ -1,15 +1,15 @@
 from decimal import Decimal
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator, MinValueValidator
 from django.db import models
-from django.db.models import F
 from django.urls import reverse
 from django.utils import timezone
 from mptt.models import TreeForeignKey
 
 from ..constants import PRODUCT_IMAGE_FORMATS, MAX_IMAGES_PER_PRODUCT, NEW_PRODUCT_DAYS_THRESHOLD
 from ..managers import ProductManager
-from ..utils import format_price, generate_unique_slug, generate_sku, build_whatsapp_message, build_whatsapp_link
+from ..utils import format_price, generate_unique_slug, generate_sku
 from ..validators import validate_product_image_size
 
 
@@ -116,6 +116,33 @@ class Product(models.Model):
         db_index=True
     )
 
+    effective_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name="Prix effectif (promotions incluses)"
+    )
+    best_promotion = models.ForeignKey(
+        'Promotion',
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name="Promotion appliquée"
+    )
+    effective_discount_percent = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Remise promotion (%)"
+    )
+
+    # Vecteur plein texte (PostgreSQL uniquement, index GIN) ; voir SearchService
+    search_vector = SearchVectorField(null=True, editable=False)
+
     objects = ProductManager()
 
     class Meta:
@@ -149,8 +176,51 @@ class Product(models.Model):
         if not self.sku:
             self.sku = generate_sku(self.category.slug if self.category else '', Product)
 
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'price', 'category'} & set(update_fields):
+            self.refresh_effective_price()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | set(self.EFFECTIVE_PRICE_FIELDS)
+
         super().save(*args, **kwargs)
 
+    EFFECTIVE_PRICE_FIELDS = ('effective_price', 'best_promotion', 'effective_discount_percent')
+    STATS_FIELDS = ('category_id', 'is_active', 'in_stock', 'price')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # État chargé, comparé au post_save pour mettre à jour CategoryStats
+        instance._stats_state = instance.stats_state()
+        return instance
+
+    def stats_state(self):
+        """(catégorie, actif, en stock, prix), ou None si l'un de ces champs n'est pas chargé."""
+        if self.get_deferred_fields() & set(self.STATS_FIELDS):
+            return None
+        return tuple(getattr(self, field) for field in self.STATS_FIELDS)
+
+    def refresh_effective_price(self, quote=None):
+        """
+        Met à jour les colonnes dénormalisées du prix effectif (sans sauvegarder).
+
+        Retourne True si une valeur a changé.
+        """
+        if quote is None:
+            from ..services.promotion_service import PromotionService
+            quote = PromotionService.calculate_prices_bulk([self])[0]
+
+        final_unit = quote['final_unit_price']
+        promotion = quote['promotion']
+        discount_percent = 0
+        if self.price and final_unit < self.price:
+            discount_percent = int((self.price - final_unit) / self.price * 100)
+
+        values = (final_unit, promotion.pk if promotion else None, discount_percent)
+        changed = values != (self.effective_price, self.best_promotion_id, self.effective_discount_percent)
+        self.effective_price, self.best_promotion_id, self.effective_discount_percent = values
+        return changed
+
     @property
     def is_new(self):
         return (timezone.now() - self.created_at).days <= NEW_PRODUCT_DAYS_THRESHOLD
@@ -196,13 +266,13 @@ class Product(models.Model):
         return PromotionService.get_best_promotion(self, quantity)
 
     def get_main_image(self):
-        try:
-            return self.images.filter(is_primary=True).first() or self.images.first()
-        except Exception:
-            return None
+        # images.all() est trié image principale en tête (Meta.ordering) et
+        # profite du prefetch_related('images') des listes
+        images = self.images.all()
+        return images[0] if images else None
 
     def get_all_images(self):
-        return self.images.all().order_by('-is_primary', 'order')
+        return self.images.all()
 
     def get_image_url(self):
         main_image = self.get_main_image()
@@ -219,15 +289,9 @@ class Product(models.Model):
 
     @property
     def whatsapp_link(self):
-        try:
-            from .settings import SiteSettings
-            settings = SiteSettings.load()
-            message = build_whatsapp_message(self, settings)
-            return build_whatsapp_link(settings.whatsapp_number, message)
-        except Exception:
-            from .settings import SiteSettings
-            settings = SiteSettings.load()
-            return f"https://wa.me/{settings.whatsapp_number}"
+        from .settings import SiteSettings
+        from ..services.whatsapp_links import WhatsAppLinkService
+        return WhatsAppLinkService.link_for(self, SiteSettings.load())
 
 
 class ProductStatus(models.Model):
@@ -240,6 +304,14 @@ class ProductStatus(models.Model):
     view_count = models.PositiveIntegerField(default=0, verbose_name="Vues", editable=False)
     whatsapp_click_count = models.PositiveIntegerField(default=0, verbose_name="Clics WhatsApp", editable=False)
     last_viewed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Vues et clics à décroissance exponentielle, stockés en log (voir TrendingService)
+    trending_score = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name="Score tendance"
+    )
 
     is_featured = models.BooleanField(
         default=False,
@@ -278,6 +350,8 @@ class ProductStatus(models.Model):
         default=False,
         verbose_name="🚫 Exclure des recommandations"
     )
+    # Scores à recalculer par la tâche groupée (ScoringService.rescore_dirty)
+    scores_dirty = models.BooleanField(default=False, editable=False)
 
     class Meta:
         verbose_name = "Statut produit"
@@ -285,29 +359,30 @@ class ProductStatus(models.Model):
         indexes = [
             models.Index(fields=['is_featured', '-featured_score']),
             models.Index(fields=['is_recommended', '-recommendation_score']),
+            models.Index(
+                fields=['product'], condition=models.Q(scores_dirty=True), name='productstatus_scores_dirty',
+            ),
         ]
 
     def __str__(self):
         return f"Statut de {self.product.name}"
 
-    def get_views_last_n_days(self, days=30):
-        if not self.last_viewed_at:
-            return 0
-        days_since_view = (timezone.now() - self.last_viewed_at).days
-        if days_since_view > days:
-            return 0
-        return min(int(self.view_count * (days / max(days_since_view, 1))), self.view_count)
+    def get_engagement_last_n_days(self, days=30, now=None):
+        """(vues, clics) des `days` derniers jours, d'après l'historique journalier."""
+        from ..services.engagement_history import EngagementHistoryService
+        return EngagementHistoryService.totals([self.product_id], days, now=now).get(self.product_id, (0, 0))
+
+    def get_views_last_n_days(self, days=30, now=None):
+        return self.get_engagement_last_n_days(days, now=now)[0]
 
     def increment_view_count(self):
-        self.view_count = F('view_count') + 1
-        self.last_viewed_at = timezone.now()
-        self.save(update_fields=['view_count', 'last_viewed_at'])
-        self.refresh_from_db()
+        # Tamponné : la valeur en base est mise à jour au prochain flush des compteurs
+        from ..services.counter_service import CounterService
+        CounterService.record_view(self.product_id)
 
     def increment_whatsapp_count(self):
-        self.whatsapp_click_count = F('whatsapp_click_count') + 1
-        self.save(update_fields=['whatsapp_click_count'])
-        self.refresh_from_db()
+        from ..services.counter_service import CounterService
+        CounterService.record_click(self.product_id)
 
     def recalculate_scores(self):
         from ..services.scoring_service import ScoringService
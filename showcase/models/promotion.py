@@ -110,7 +110,8 @@ class Promotion(models.Model):
         validate_promotion_dates(self.start_at, self.end_at)
         validate_promotion_value(self.promotion_type, self.value, self.buy_x, self.get_y)
 
-    def is_active_now(self):
+    def is_active_now(self, usage_count=None):
+        """usage_count : total d'utilisations déjà connu (annotation), évite l'agrégat."""
         if not self.active:
             return False
 
@@ -122,8 +123,11 @@ class Promotion(models.Model):
         if self.end_at and now > self.end_at:
             return False
 
-        if self.usage_limit is not None and self.usage_count() >= self.usage_limit:
-            return False
+        if self.usage_limit is not None:
+            if usage_count is None:
+                usage_count = self.usage_count()
+            if usage_count >= self.usage_limit:
+                return False
 
         return True
 
@@ -148,13 +152,17 @@ class Promotion(models.Model):
         return False
 
     def get_discount_amount(self, product, quantity=1):
+        if not self.applies_to_product(product) or not self.is_active_now():
+            return Decimal('0.00'), product.price
+
+        return self.compute_discount(product, quantity)
+
+    def compute_discount(self, product, quantity=1):
+        """Calcule la remise sans vérifier l'applicabilité (déjà garantie par l'appelant)."""
         qty = max(1, int(quantity))
         price = product.price
         discount = Decimal('0.00')
 
-        if not self.applies_to_product(product) or not self.is_active_now():
-            return discount, price
-
         if self.promotion_type == self.PERCENT:
             percent = (self.value or Decimal('0')) / Decimal('100')
             discount = (price * percent) * qty
@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class ProductSearchToken(models.Model):
+    """
+    Index inversé local de la recherche produits (SQLite, tests).
+
+    Un jeton normalisé par produit, avec la somme des poids des champs où il
+    apparaît. Sous PostgreSQL, la recherche utilise Product.search_vector.
+    """
+
+    product = models.ForeignKey(
+        'Product',
+        on_delete=models.CASCADE,
+        related_name='search_tokens'
+    )
+    token = models.CharField(max_length=64)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        verbose_name = "Jeton de recherche"
+        verbose_name_plural = "Jetons de recherche"
+        constraints = [
+            models.UniqueConstraint(fields=['token', 'product'], name='unique_search_token_per_product'),
+        ]
+
+    def __str__(self):
+        return f"{self.token} ({self.weight})"
@@ -0,0 +1,66 @@
+import re
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+SKU_RE = re.compile(r'^(?P<prefix>.+)-(?P<number>\d+)$')
+
+
+def highest_sku_numbers(skus):
+    """{préfixe: plus grand numéro} pour des SKU de la forme « PRÉFIXE-00042 »."""
+    highest = {}
+    for sku in skus:
+        match = SKU_RE.match(sku or '')
+        if match:
+            prefix, number = match['prefix'], int(match['number'])
+            highest[prefix] = max(highest.get(prefix, 0), number)
+    return highest
+
+
+class SkuSequence(models.Model):
+    """
+    Dernier numéro de SKU attribué, par préfixe.
+
+    Les numéros sont réservés par un UPDATE atomique (last_value + n) : des
+    créations concurrentes obtiennent des numéros distincts sans relire ni
+    trier les SKU existants. Une séquence absente est initialisée une fois
+    à partir du plus grand SKU existant du préfixe.
+    """
+
+    prefix = models.CharField(max_length=20, unique=True)
+    last_value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Séquence de SKU"
+        verbose_name_plural = "Séquences de SKU"
+
+    def __str__(self):
+        return f"{self.prefix}-{self.last_value:05d}"
+
+    @staticmethod
+    def highest_existing(prefix):
+        from .product import Product
+
+        skus = Product.objects.filter(sku__startswith=f"{prefix}-").values_list('sku', flat=True)
+        return highest_sku_numbers(skus).get(prefix, 0)
+
+    @classmethod
+    def allocate(cls, prefix, count=1):
+        """Réserve `count` numéros consécutifs pour le préfixe et retourne le premier."""
+        # La ligne reste verrouillée par l'UPDATE jusqu'à la fin de la transaction
+        with transaction.atomic(savepoint=False):
+            if not cls.objects.filter(prefix=prefix).update(last_value=F('last_value') + count):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(prefix=prefix, last_value=cls.highest_existing(prefix) + count)
+                except IntegrityError:
+                    # Créée entre-temps par un autre processus
+                    cls.objects.filter(prefix=prefix).update(last_value=F('last_value') + count)
+            last_value = cls.objects.filter(prefix=prefix).values_list('last_value', flat=True).get()
+        return last_value - count + 1
+
+    @classmethod
+    def resync(cls, prefix):
+        """Recale la séquence sur le plus grand SKU existant (SKU saisis à la main)."""
+        highest = cls.highest_existing(prefix)
+        cls.objects.filter(prefix=prefix, last_value__lt=highest).update(last_value=highest)
@@ -1,8 +1,16 @@
+import threading
+import time
+
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import prefetch_related_objects
+
+from ..caching import get_model_generations
+from ..constants import SITE_SETTINGS_CHECK_INTERVAL, SITE_SETTINGS_RELOAD_INTERVAL, SOCIAL_MEDIA_PLATFORMS
 
-from ..constants import SOCIAL_MEDIA_PLATFORMS
+_lock = threading.Lock()
+_state = {'settings': None, 'generations': None, 'loaded_at': 0.0, 'checked_at': 0.0}
 
 
 class SocialLink(models.Model):
@@ -63,11 +71,41 @@ class SiteSettings(models.Model):
     def save(self, *args, **kwargs):
         self.pk = 1
         super().save(*args, **kwargs)
+        SiteSettings.invalidate_cache()
 
     def delete(self, *args, **kwargs):
         raise ValidationError("La suppression des paramètres du site est interdite.")
 
     @classmethod
     def load(cls):
+        """
+        Retourne le singleton (pk=1), social_links préchargés, depuis la copie du processus.
+
+        Les générations de SiteSettings et SocialLink (cache partagé) ne sont
+        relues qu'au plus toutes les SITE_SETTINGS_CHECK_INTERVAL secondes :
+        pas de requête SQL tant qu'elles n'ont pas changé. L'instance est
+        partagée entre les appels et ne doit pas être modifiée sans save().
+        """
+        obj = _state['settings']
+        now = time.monotonic()
+        fresh = obj is not None and now - _state['loaded_at'] < SITE_SETTINGS_RELOAD_INTERVAL
+        if fresh and now - _state['checked_at'] < SITE_SETTINGS_CHECK_INTERVAL:
+            return obj
+
+        # Lues avant la base : une modification concurrente provoquera un rechargement
+        generations = get_model_generations((cls, SocialLink))
+        if fresh and generations == _state['generations']:
+            _state['checked_at'] = now
+            return obj
+
         obj, _ = cls.objects.get_or_create(pk=1)
+        prefetch_related_objects([obj], 'social_links')
+        with _lock:
+            _state.update(settings=obj, generations=generations, loaded_at=now, checked_at=now)
         return obj
+
+    @staticmethod
+    def invalidate_cache():
+        """Oublie la copie du processus ; les autres la rechargent via les générations (signaux)."""
+        with _lock:
+            _state['settings'] = None
@@ -0,0 +1,76 @@
+from bisect import bisect_right
+from django.db import models
+
+
+class CategoryStats(models.Model):
+    """
+    Statistiques par catégorie (produits directs), tenues à jour de façon incrémentale.
+
+    Servent au calcul des scores : prix moyen des produits actifs en stock et
+    rang de vues parmi les produits actifs, sans agrégat sur la table des
+    produits. Voir CategoryStatsService pour la maintenance et la reconstruction.
+    """
+
+    category = models.OneToOneField(
+        'Category',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    active_count = models.PositiveIntegerField(default=0)
+    available_count = models.PositiveIntegerField(default=0)  # actifs et en stock
+    available_price_sum = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    # Vues des produits actifs, triées par ordre croissant
+    view_counts = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Statistiques de catégorie"
+        verbose_name_plural = "Statistiques de catégories"
+
+    def __str__(self):
+        return f"{self.category_id} : {self.active_count} actif(s), {self.available_count} en stock"
+
+    @property
+    def mean_price(self):
+        """Prix moyen des produits actifs en stock (None si aucun)."""
+        if not self.available_count:
+            return None
+        return self.available_price_sum / self.available_count
+
+    def count_views_above(self, view_count):
+        """Nombre de produits actifs ayant strictement plus de `view_count` vues."""
+        return len(self.view_counts) - bisect_right(self.view_counts, view_count)
+
+
+class ProductDailyStats(models.Model):
+    """
+    Vues et clics WhatsApp d'un produit pour une journée.
+
+    Alimentée par les flush de compteurs (voir EngagementHistoryService) et
+    purgée au-delà de ENGAGEMENT_HISTORY_DAYS : les fenêtres glissantes
+    (« vues des 30 derniers jours ») sont des sommes sur quelques lignes par
+    produit, servies par l'index unique (produit, date).
+    """
+
+    product = models.ForeignKey(
+        'Product',
+        on_delete=models.CASCADE,
+        related_name='daily_stats'
+    )
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    clicks = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Statistiques journalières produit"
+        verbose_name_plural = "Statistiques journalières produits"
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'date'], name='productdailystats_product_date'),
+        ]
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} {self.date} : {self.views} vue(s), {self.clicks} clic(s)"
@@ -0,0 +1,224 @@
+import base64
+import datetime
+import json
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.core.paginator import Paginator
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .constants import MAX_PAGE_SIZE
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination par curseur (keyset) sur l'ordre du queryset.
+
+    Le curseur, opaque, encode les valeurs des champs de tri de la dernière
+    ligne renvoyée (clé primaire incluse pour départager les égalités) ; la
+    page suivante est obtenue par une comparaison lexicographique sur ces
+    champs, sans COUNT(*) ni OFFSET. Les NULL sont ordonnés comme les plus
+    petites valeurs. Pagination vers l'avant uniquement (défilement infini).
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+    max_page_size = MAX_PAGE_SIZE
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        fields = [self.resolve_field(queryset, name) for name, _ in self.ordering]
+        values = self.decode_cursor(request, fields)
+        if values is not None:
+            queryset = queryset.filter(self.after(values))
+
+        queryset = queryset.order_by(*[
+            F(name).desc(nulls_last=True) if descending else F(name).asc(nulls_first=True)
+            for name, descending in self.ordering
+        ])
+        rows = list(queryset[:self.page_size + 1])
+        page = rows[:self.page_size]
+
+        self.next_values = None
+        if len(rows) > self.page_size:
+            last = page[-1]
+            self.next_values = [
+                self.serialize_value(value) for value in
+                (self.lookup_value(last, name) for name, _ in self.ordering)
+            ]
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': None,
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def get_ordering(self, queryset):
+        """Champs de tri [(nom, décroissant)] complétés par la clé primaire."""
+        terms = queryset.query.order_by or queryset.model._meta.ordering
+        ordering = []
+        for term in terms:
+            if not isinstance(term, str) or term == '?':
+                raise ValidationError({'cursor': 'Ordering not supported by cursor pagination'})
+            name = term.lstrip('-')
+            ordering.append(('id' if name == 'pk' else name, term.startswith('-')))
+
+        if not any(name == 'id' for name, _ in ordering):
+            descending = ordering[0][1] if ordering else False
+            ordering.append(('id', descending))
+        return ordering
+
+    @staticmethod
+    def resolve_field(queryset, path):
+        """Champ de modèle (éventuellement lié) ou annotation du queryset."""
+        if path in queryset.query.annotations:
+            return queryset.query.annotations[path].output_field
+        model = queryset.model
+        parts = path.split('__')
+        for part in parts[:-1]:
+            model = model._meta.get_field(part).related_model
+        try:
+            return model._meta.get_field(parts[-1])
+        except FieldDoesNotExist:
+            raise ValidationError({'cursor': 'Ordering not supported by cursor pagination'})
+
+    @staticmethod
+    def related_object(obj, path):
+        for part in path.split('__')[:-1]:
+            obj = getattr(obj, part)
+        return obj
+
+    @staticmethod
+    def serialize_value(value):
+        if value is None:
+            return None
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        return str(value)
+
+    def lookup_value(self, obj, path):
+        obj = self.related_object(obj, path)
+        return getattr(obj, path.split('__')[-1]) if obj is not None else None
+
+    def after(self, values):
+        """Condition « strictement après » la ligne décrite par le curseur."""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, values):
+            if value is None:
+                beyond = Q(pk__in=[]) if descending else Q(**{f'{name}__isnull': False})
+                same = Q(**{f'{name}__isnull': True})
+            elif descending:
+                beyond = Q(**{f'{name}__lt': value}) | Q(**{f'{name}__isnull': True})
+                same = Q(**{name: value})
+            else:
+                beyond = Q(**{f'{name}__gt': value})
+                same = Q(**{name: value})
+            condition |= equal & beyond
+            equal &= same
+        return condition
+
+    def encode_cursor(self, values):
+        payload = json.dumps({
+            'o': [('-' if descending else '') + name for name, descending in self.ordering],
+            'v': values,
+        }, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request, fields):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            signature = [('-' if descending else '') + name for name, descending in self.ordering]
+            if payload['o'] != signature or len(payload['v']) != len(fields):
+                raise ValueError
+            return [
+                field.to_python(value) if value is not None else None
+                for field, value in zip(fields, payload['v'])
+            ]
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if self.next_values is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_values))
+
+
+class CountedPaginator(Paginator):
+    """Paginator Django dont le nombre total de lignes peut être fourni (déjà calculé)."""
+
+    def __init__(self, *args, count=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if count is not None:
+            self.count = count
+
+
+class StandardPagination(PageNumberPagination):
+    """
+    Pagination par numéro de page ; taille ajustable via ?page_size= (bornée).
+
+    La présence du paramètre ?cursor= (même vide, pour la première page)
+    bascule la requête en pagination par curseur (KeysetPagination).
+
+    Si la vue a déjà compté les lignes du queryset (attribut queryset_count,
+    voir ConditionalGetMixin), ce total est réutilisé au lieu d'un COUNT(*).
+    """
+
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+    cursor_query_param = KeysetPagination.cursor_query_param
+
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        self.keyset = None
+        self.django_paginator_class = partial(
+            CountedPaginator, count=getattr(view, 'queryset_count', None)
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+    def counts_rows(self, request):
+        """Vrai si la page demandée a besoin du nombre total de lignes (pas en mode curseur)."""
+        return self.cursor_query_param not in request.query_params
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
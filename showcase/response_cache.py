@@ -0,0 +1,130 @@
+"""
+Cache des réponses GET anonymes des viewsets de l'API.
+
+La clé d'une réponse combine la vue, l'action, le chemin et les paramètres de
+requête normalisés ; l'entrée mémorise les générations des modèles dont la vue
+dépend (incrémentées par les signaux post_save / post_delete / m2m_changed).
+Une entrée dont une génération a changé, ou plus ancienne que
+RESPONSE_CACHE_FRESH_SECONDS, est périmée : une seule requête la recalcule
+pendant que les autres la reçoivent telle quelle (stale-while-revalidate,
+voir caching.single_flight). Sans entrée du tout, les autres requêtes
+attendent brièvement le résultat au lieu de le recalculer toutes.
+
+Les requêtes authentifiées ne passent jamais par le cache : leurs querysets
+diffèrent (produits inactifs, promotions programmées...).
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from .caching import get_model_generations, single_flight
+from .conditional import VALIDATOR_HEADERS, conditional_response
+from .constants import RESPONSE_CACHE_FRESH_SECONDS, RESPONSE_CACHE_TIMEOUT
+
+RESPONSE_KEY = 'showcase:response:{}:{}:{}'
+STATS_KEY = 'showcase:response-cache:stats:{}:{}'
+OUTCOMES = ('hit', 'stale', 'miss')
+
+
+def record_outcome(view_name, outcome):
+    key = STATS_KEY.format(view_name, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def response_cache_stats(reset=False):
+    """Compteurs {vue: {'hit', 'stale', 'miss', 'hit_ratio'}} de toutes les vues en cache."""
+    stats = {}
+    for view in CachedResponseMixin.__subclasses__():
+        keys = {outcome: STATS_KEY.format(view.__name__, outcome) for outcome in OUTCOMES}
+        values = cache.get_many(keys.values())
+        counts = {outcome: values.get(key, 0) for outcome, key in keys.items()}
+        total = sum(counts.values())
+        counts['hit_ratio'] = (counts['hit'] + counts['stale']) / total if total else None
+        stats[view.__name__] = counts
+        if reset:
+            cache.delete_many(keys.values())
+    return stats
+
+
+class CachedResponseMixin:
+    """
+    Met en cache les réponses GET anonymes des actions listées dans cache_actions.
+
+    cache_models énumère les modèles dont dépend le contenu des réponses ;
+    l'en-tête X-Cache indique HIT, STALE ou MISS. Les en-têtes ETag et
+    Last-Modified (ConditionalGetMixin) sont conservés avec l'entrée : une
+    requête conditionnelle servie par le cache peut recevoir un 304.
+    """
+
+    cache_actions = ('list', 'retrieve')
+    cache_models = ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.is_response_cacheable(request):
+            handler_name = request.method.lower()
+            setattr(self, handler_name, self.cached_handler(getattr(self, handler_name)))
+
+    def is_response_cacheable(self, request):
+        return (
+            getattr(settings, 'RESPONSE_CACHE_ENABLED', True)
+            and request.method == 'GET'
+            and self.action in self.cache_actions
+            and not request.user.is_authenticated
+        )
+
+    def get_response_cache_key(self, request):
+        params = sorted(
+            (name, sorted(values)) for name, values in request.query_params.lists()
+        )
+        digest = hashlib.md5(
+            repr((request.scheme, request.get_host(), request.path, params)).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return RESPONSE_KEY.format(type(self).__name__, self.action, digest)
+
+    def response_cache_hit(self, request, data):
+        """Appelé quand la réponse vient du cache (effets de bord de l'action à conserver)."""
+
+    def cached_handler(self, handler):
+        def wrapped(request, *args, **kwargs):
+            computed = {}
+
+            def compute():
+                response = computed['response'] = handler(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return None
+                return {
+                    'data': response.data,
+                    'headers': {
+                        name: response[name] for name in VALIDATOR_HEADERS if response.has_header(name)
+                    },
+                }
+
+            entry, outcome = single_flight(
+                self.get_response_cache_key(request), compute,
+                version=get_model_generations(self.cache_models),
+                max_age=RESPONSE_CACHE_FRESH_SECONDS,
+                timeout=RESPONSE_CACHE_TIMEOUT,
+            )
+            record_outcome(type(self).__name__, outcome)
+
+            if 'response' in computed:
+                response = computed['response']
+                response['X-Cache'] = 'MISS'
+                return response
+
+            headers = dict(entry['headers'], **{'X-Cache': outcome.upper()})
+            not_modified = conditional_response(request, headers)
+            if not_modified is not None:
+                return not_modified
+            self.response_cache_hit(request, entry['data'])
+            return Response(entry['data'], headers=headers)
+
+        return wrapped
@@ -13,6 +13,8 @@ class CategorySerializer(serializers.ModelSerializer):
     # Champs calculés (read-only)
     is_main_category = serializers.BooleanField(read_only=True)
     product_count = serializers.IntegerField(read_only=True)
+    active_product_count = serializers.IntegerField(read_only=True)
+    available_product_count = serializers.IntegerField(read_only=True)
     direct_product_count = serializers.IntegerField(read_only=True)
     full_path = serializers.SerializerMethodField()
     
@@ -27,6 +29,8 @@ class CategorySerializer(serializers.ModelSerializer):
             'level',
             'is_main_category',
             'product_count',
+            'active_product_count',
+            'available_product_count',
             'direct_product_count',
             'full_path',
             'created_at',
@@ -44,6 +48,8 @@ class CategoryTreeSerializer(serializers.ModelSerializer):
     
     children = serializers.SerializerMethodField()
     product_count = serializers.IntegerField(read_only=True)
+    active_product_count = serializers.IntegerField(read_only=True)
+    available_product_count = serializers.IntegerField(read_only=True)
     direct_product_count = serializers.IntegerField(read_only=True)
     
     class Meta:
@@ -54,6 +60,8 @@ class CategoryTreeSerializer(serializers.ModelSerializer):
             'slug',
             'level',
             'product_count',
+            'active_product_count',
+            'available_product_count',
             'direct_product_count',
             'children',
         ]
@@ -71,6 +79,8 @@ class CategoryListSerializer(serializers.ModelSerializer):
     
     parent_name = serializers.CharField(source='parent.name', read_only=True, allow_null=True)
     product_count = serializers.IntegerField(read_only=True)
+    active_product_count = serializers.IntegerField(read_only=True)
+    available_product_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Category
@@ -82,6 +92,8 @@ class CategoryListSerializer(serializers.ModelSerializer):
             'parent',
             'parent_name',
             'product_count',
+            'active_product_count',
+            'available_product_count',
         ]
 
 
@@ -96,6 +108,8 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
     # Champs calculés
     is_main_category = serializers.BooleanField(read_only=True)
     product_count = serializers.IntegerField(read_only=True)
+    active_product_count = serializers.IntegerField(read_only=True)
+    available_product_count = serializers.IntegerField(read_only=True)
     direct_product_count = serializers.IntegerField(read_only=True)
     full_path = serializers.SerializerMethodField()
     
@@ -112,6 +126,8 @@ class CategoryDetailSerializer(serializers.ModelSerializer):
             'level',
             'is_main_category',
             'product_count',
+            'active_product_count',
+            'available_product_count',
             'direct_product_count',
             'full_path',
             'created_at',
@@ -186,7 +202,7 @@ class ProductListSerializer(serializers.ModelSerializer):
         ]
     
     def get_main_image(self, obj):
-        main_img = obj.images.filter(is_primary=True).first()
+        main_img = obj.get_main_image()
         if main_img:
             request = self.context.get('request')
             if request:
@@ -195,10 +211,12 @@ class ProductListSerializer(serializers.ModelSerializer):
         return None
     
     def get_final_price(self, obj):
-        return obj.get_final_price()
+        if obj.effective_price is not None:
+            return obj.effective_price
+        return obj.effective_unit_price
     
     def get_has_discount(self, obj):
-        return obj.has_discount()
+        return bool(obj.has_discount)
 
     
 
@@ -217,8 +235,8 @@ class ProductDetailSerializer(serializers.ModelSerializer):
     is_featured = serializers.BooleanField(source='status.is_featured', read_only=True)
     is_recommended = serializers.BooleanField(source='status.is_recommended', read_only=True)
     featured_score = serializers.IntegerField(source='status.featured_score', read_only=True)
-    views_count = serializers.IntegerField(source='status.views_count', read_only=True)
-    clicks_count = serializers.IntegerField(source='status.clicks_count', read_only=True)
+    views_count = serializers.IntegerField(source='status.view_count', read_only=True)
+    clicks_count = serializers.IntegerField(source='status.whatsapp_click_count', read_only=True)
     
     class Meta:
         model = Product
@@ -238,16 +256,18 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'sku', 'slug', 'created_at', 'updated_at']
     
     def get_final_price(self, obj):
-        return obj.get_final_price()
+        if obj.effective_price is not None:
+            return obj.effective_price
+        return obj.effective_unit_price
     
     def get_discount_amount(self, obj):
-        return obj.get_discount_amount()
+        return obj.price - self.get_final_price(obj)
     
     def get_has_discount(self, obj):
-        return obj.has_discount()
+        return bool(obj.has_discount)
     
     def get_whatsapp_link(self, obj):
-        return obj.get_whatsapp_link()
+        return obj.whatsapp_link
 
     
 
@@ -265,12 +285,48 @@ class ProductMinimalSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'slug', 'price', 'main_image']
     
     def get_main_image(self, obj):
-        main_img = obj.images.filter(is_primary=True).first()
+        main_img = obj.get_main_image()
         if main_img:
             return main_img.image.url
         return None
 
 
+class ProductQuoteLineSerializer(serializers.Serializer):
+    """Ligne d'une demande de devis : produit (id ou slug) et quantité"""
+
+    id = serializers.IntegerField(required=False)
+    slug = serializers.SlugField(required=False)
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+    def validate(self, attrs):
+        if not attrs.get('id') and not attrs.get('slug'):
+            raise serializers.ValidationError("Indiquez l'id ou le slug du produit.")
+        return attrs
+
+
+class QuotePromotionSerializer(serializers.ModelSerializer):
+    """Promotion retenue pour une ligne de devis"""
+
+    class Meta:
+        model = Promotion
+        fields = ['id', 'name', 'slug', 'promotion_type', 'value', 'is_stackable']
+
+
+class ProductQuoteSerializer(serializers.Serializer):
+    """Résultat de tarification d'une ligne (voir PromotionService.calculate_prices_bulk)"""
+
+    id = serializers.IntegerField(source='product.id')
+    slug = serializers.SlugField(source='product.slug')
+    name = serializers.CharField(source='product.name')
+    quantity = serializers.IntegerField()
+    original_price = serializers.DecimalField(max_digits=12, decimal_places=2)
+    final_unit_price = serializers.DecimalField(max_digits=12, decimal_places=2)
+    discount_total = serializers.DecimalField(max_digits=12, decimal_places=2)
+    total = serializers.DecimalField(max_digits=12, decimal_places=2)
+    promotion = QuotePromotionSerializer(allow_null=True)
+    promotions = QuotePromotionSerializer(many=True)
+
+
 # ===== Promotion Serializers =====
 
 class PromotionListSerializer(serializers.ModelSerializer):
@@ -290,13 +346,15 @@ class PromotionListSerializer(serializers.ModelSerializer):
         ]
     
     def get_is_active_now(self, obj):
-        return obj.is_active_now()
+        return obj.is_active_now(usage_count=getattr(obj, 'usage_total', None))
     
     def get_products_count(self, obj):
-        return obj.products.count()
+        products_total = getattr(obj, 'products_total', None)
+        return products_total if products_total is not None else obj.products.count()
     
     def get_categories_count(self, obj):
-        return obj.categories.count()
+        categories_total = getattr(obj, 'categories_total', None)
+        return categories_total if categories_total is not None else obj.categories.count()
 
 
 class PromotionDetailSerializer(serializers.ModelSerializer):
@@ -320,10 +378,11 @@ class PromotionDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'slug', 'created_at', 'updated_at']
     
     def get_is_active_now(self, obj):
-        return obj.is_active_now()
+        return obj.is_active_now(usage_count=getattr(obj, 'usage_total', None))
     
     def get_usage_count(self, obj):
-        return obj.usage_count()
+        usage_total = getattr(obj, 'usage_total', None)
+        return usage_total if usage_total is not None else obj.usage_count()
 
 
 # ===== Newsletter Serializers =====
@@ -361,7 +420,8 @@ class NewsletterTemplateSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'slug', 'created_at', 'updated_at']
     
     def get_campaigns_count(self, obj):
-        return obj.campaigns.count()
+        campaigns_total = getattr(obj, 'campaigns_total', None)
+        return campaigns_total if campaigns_total is not None else obj.campaigns.count()
 
 
 class NewsletterCampaignListSerializer(serializers.ModelSerializer):
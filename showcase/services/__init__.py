@@ -1,9 +1,31 @@
 from .scoring_service import ScoringService
 from .promotion_service import PromotionService
 from .newsletter_service import NewsletterService
+from .promotion_index import PromotionIndex
+from .repricing_service import RepricingService
+from .counter_service import CounterService
+from .category_tree import CategoryTreeService
+from .search_service import SearchService
+from .autocomplete import AutocompleteIndex
+from .facets import FacetService
+from .whatsapp_links import WhatsAppLinkService
+from .category_stats import CategoryStatsService
+from .engagement_history import EngagementHistoryService
+from .shelves import ShelfService
 
 __all__ = [
     'ScoringService',
     'PromotionService',
     'NewsletterService',
+    'PromotionIndex',
+    'RepricingService',
+    'CounterService',
+    'CategoryTreeService',
+    'SearchService',
+    'AutocompleteIndex',
+    'FacetService',
+    'WhatsAppLinkService',
+    'CategoryStatsService',
+    'EngagementHistoryService',
+    'ShelfService',
 ]
@@ -0,0 +1,267 @@
+import bisect
+import threading
+import time
+from collections import Counter
+
+from ..caching import bump_generation, get_generation
+from ..constants import (
+    AUTOCOMPLETE_CHECK_INTERVAL, AUTOCOMPLETE_MIN_SIMILARITY, AUTOCOMPLETE_REBUILD_INTERVAL,
+)
+from ..utils import TOKEN_SPLIT_RE, normalize_text
+
+GENERATION_NAMESPACE = 'autocomplete'
+
+PRODUCT = 'product'
+BRAND = 'brand'
+CATEGORY = 'category'
+
+
+def split_words(text):
+    return [word for word in TOKEN_SPLIT_RE.split(normalize_text(text)) if word]
+
+
+def trigrams(word):
+    padded = f'  {word} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(first, second):
+    shared = len(first & second)
+    return shared / (len(first) + len(second) - shared) if shared else 0.0
+
+
+class AutocompleteIndex:
+    """
+    Index de préfixes des noms de produits actifs, marques et catégories.
+
+    Chaque libellé est découpé en mots normalisés (sans accents) ; les mots
+    distincts sont gardés triés pour une recherche de préfixe par bisect, avec
+    un index de trigrammes pour retrouver les mots proches d'une saisie
+    fautive. L'index se met à jour entrée par entrée (set_product,
+    set_category...) sans reconstruction.
+    """
+
+    def __init__(self, generation=None):
+        self.generation = generation
+        self.built_at = time.monotonic()
+        self.entries = {}
+        self._entry_words = {}
+        self._postings = {}
+        self._words = []
+        self._trigrams = {}
+        self._product_brands = {}
+        self._brand_counts = Counter()
+
+    @classmethod
+    def build(cls, generation=None):
+        from ..models import Category, Product
+
+        index = cls(generation=generation)
+        counts = Category.objects.subtree_counts()
+        for category_id, name, slug in Category.objects.values_list('id', 'name', 'slug'):
+            active = counts.get(category_id, {}).get('active', 0)
+            index.set_category(category_id, name, slug, score=active)
+
+        products = Product.objects.filter(is_active=True).values_list(
+            'id', 'name', 'slug', 'brand', 'status__view_count', 'status__whatsapp_click_count'
+        )
+        for product_id, name, slug, brand, views, clicks in products:
+            index.set_product(product_id, name, slug, brand, score=(views or 0) + 3 * (clicks or 0))
+        return index
+
+    # Entrées
+
+    def _add(self, key, label, score, **extra):
+        self._remove(key)
+        words = tuple(dict.fromkeys(split_words(label)))
+        if not words:
+            return
+        self.entries[key] = dict(extra, label=label, normalized=' '.join(words), score=score)
+        self._entry_words[key] = words
+        for word in words:
+            keys = self._postings.get(word)
+            if keys is None:
+                keys = self._postings[word] = set()
+                bisect.insort(self._words, word)
+                for trigram in trigrams(word):
+                    self._trigrams.setdefault(trigram, set()).add(word)
+            keys.add(key)
+
+    def _remove(self, key):
+        self.entries.pop(key, None)
+        for word in self._entry_words.pop(key, ()):
+            keys = self._postings[word]
+            keys.discard(key)
+            if not keys:
+                del self._postings[word]
+                del self._words[bisect.bisect_left(self._words, word)]
+                for trigram in trigrams(word):
+                    self._trigrams[trigram].discard(word)
+
+    def set_product(self, product_id, name, slug, brand, score=None, is_active=True):
+        key = (PRODUCT, product_id)
+        if score is None:
+            score = self.entries.get(key, {}).get('score', 0)
+        self.remove_product(product_id)
+        if not is_active:
+            return
+        self._add(key, name, score, id=product_id, slug=slug)
+        if brand and split_words(brand):
+            brand_key = (BRAND, ' '.join(split_words(brand)))
+            self._product_brands[product_id] = brand_key
+            self._brand_counts[brand_key] += 1
+            if brand_key not in self.entries:
+                self._add(brand_key, brand, 0)
+            self.entries[brand_key]['score'] = self._brand_counts[brand_key]
+
+    def remove_product(self, product_id):
+        self._remove((PRODUCT, product_id))
+        brand_key = self._product_brands.pop(product_id, None)
+        if brand_key is not None:
+            self._brand_counts[brand_key] -= 1
+            if self._brand_counts[brand_key] <= 0:
+                del self._brand_counts[brand_key]
+                self._remove(brand_key)
+            else:
+                self.entries[brand_key]['score'] = self._brand_counts[brand_key]
+
+    def set_category(self, category_id, name, slug, score=None):
+        key = (CATEGORY, category_id)
+        if score is None:
+            score = self.entries.get(key, {}).get('score', 0)
+        self._add(key, name, score, id=category_id, slug=slug)
+
+    def remove_category(self, category_id):
+        self._remove((CATEGORY, category_id))
+
+    # Recherche
+
+    def prefixed_words(self, prefix):
+        start = bisect.bisect_left(self._words, prefix)
+        end = bisect.bisect_left(self._words, prefix + '\uffff')
+        return self._words[start:end]
+
+    def similar_words(self, word):
+        """Mots de l'index proches de `word` (ou dont le début l'est), par similarité de trigrammes."""
+        query = trigrams(word)
+        candidates = set()
+        for trigram in query:
+            candidates |= self._trigrams.get(trigram, set())
+        return [
+            candidate for candidate in candidates
+            if max(
+                similarity(query, trigrams(candidate)),
+                similarity(query, trigrams(candidate[:len(word)])),
+            ) >= AUTOCOMPLETE_MIN_SIMILARITY
+        ]
+
+    def suggest(self, query, limit):
+        """
+        Retourne jusqu'à `limit` suggestions par type pour une saisie partielle.
+
+        Chaque mot saisi doit être le début d'un mot du libellé ; à défaut de
+        correspondance exacte, un mot d'au moins 3 lettres est rapproché des
+        mots de l'index par trigrammes.
+        """
+        words = split_words(query)
+        matches = None
+        for word in words:
+            candidates = self.prefixed_words(word)
+            if not candidates and len(word) >= 3:
+                candidates = self.similar_words(word)
+            keys = set()
+            for candidate in candidates:
+                keys |= self._postings[candidate]
+            matches = keys if matches is None else matches & keys
+            if not matches:
+                break
+
+        results = {PRODUCT: [], BRAND: [], CATEGORY: []}
+        if not matches:
+            return results
+
+        normalized = ' '.join(words)
+        ranked = sorted(
+            matches,
+            key=lambda key: (
+                not self.entries[key]['normalized'].startswith(normalized),
+                -self.entries[key]['score'],
+                self.entries[key]['normalized'],
+            )
+        )
+        for key in ranked:
+            bucket = results[key[0]]
+            if len(bucket) < limit:
+                bucket.append(self.entries[key])
+        return results
+
+
+_lock = threading.Lock()
+_state = {'index': None, 'checked_at': 0.0}
+
+
+def get_autocomplete_index():
+    """
+    Retourne l'index du processus, reconstruit si la génération partagée a changé.
+
+    Comme pour l'index des promotions, la génération n'est relue qu'au plus
+    toutes les AUTOCOMPLETE_CHECK_INTERVAL secondes ; l'index est aussi
+    reconstruit périodiquement pour rafraîchir la popularité des produits.
+    """
+    index = _state['index']
+    now = time.monotonic()
+    if index is not None and now - index.built_at >= AUTOCOMPLETE_REBUILD_INTERVAL:
+        index = None
+    if index is not None and now - _state['checked_at'] < AUTOCOMPLETE_CHECK_INTERVAL:
+        return index
+
+    generation = get_generation(GENERATION_NAMESPACE)
+    if index is not None and index.generation == generation:
+        _state['checked_at'] = now
+        return index
+
+    with _lock:
+        index = _state['index']
+        if (
+            index is None or index.generation != generation
+            or now - index.built_at >= AUTOCOMPLETE_REBUILD_INTERVAL
+        ):
+            index = AutocompleteIndex.build(generation=generation)
+            _state['index'] = index
+        _state['checked_at'] = now
+    return index
+
+
+def autocomplete(query, limit):
+    """Suggestions pour une saisie partielle (voir AutocompleteIndex.suggest)."""
+    index = get_autocomplete_index()
+    with _lock:
+        return index.suggest(query, limit)
+
+
+def update_autocomplete_index(change):
+    """
+    Applique une modification à l'index du processus et en informe les autres.
+
+    La génération partagée est incrémentée : les autres processus
+    reconstruiront leur index. L'index local, s'il était à jour, reçoit la
+    modification directement et prend la nouvelle génération.
+    """
+    with _lock:
+        index = _state['index']
+        generation = bump_generation(GENERATION_NAMESPACE)
+        if index is None:
+            return
+        if index.generation is not None and generation == index.generation + 1:
+            change(index)
+            index.generation = generation
+        else:
+            _state['index'] = None
+
+
+def invalidate_autocomplete_index():
+    """Invalide l'index localement et dans les autres processus (modifications groupées)."""
+    with _lock:
+        _state['index'] = None
+        _state['checked_at'] = 0.0
+    bump_generation(GENERATION_NAMESPACE)
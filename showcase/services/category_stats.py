@@ -0,0 +1,205 @@
+from bisect import bisect_left, insort
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from ..formatting import to_decimal
+
+STATS_FIELDS = ['active_count', 'available_count', 'available_price_sum', 'view_counts', 'updated_at']
+
+
+def contributions(state, view_count):
+    """Contribution d'un produit aux statistiques de sa catégorie : [] s'il est inactif."""
+    category_id, is_active, in_stock, price = state
+    if not is_active:
+        return []
+    return [(category_id, in_stock, to_decimal(price), view_count)]
+
+
+class CategoryStatsService:
+    """
+    Maintenance de CategoryStats.
+
+    Chaque changement de catégorie, d'activité, de stock ou de prix d'un
+    produit retire son ancienne contribution et ajoute la nouvelle (lignes
+    verrouillées, vues insérées à leur place dans la liste triée) ; les flush
+    de compteurs déplacent les vues des produits concernés. Une ligne absente
+    ou incohérente est reconstruite par agrégat, comme le fait rebuild() pour
+    tout le catalogue (commande rebuild_category_stats).
+    """
+
+    @staticmethod
+    def compute(category_ids=None):
+        """{category_id: CategoryStats} calculées par agrégat (non sauvegardées)."""
+        from ..models import Category, CategoryStats, Product
+
+        products = Product.objects.all()
+        if category_ids is None:
+            category_ids = Category.objects.values_list('pk', flat=True)
+        else:
+            products = products.filter(category_id__in=category_ids)
+        stats = {category_id: CategoryStats(category_id=category_id) for category_id in category_ids}
+
+        for row in (
+            products.filter(is_active=True, in_stock=True)
+            .values('category_id')
+            .annotate(total=Sum('price'), count=Count('id'))
+        ):
+            category_stats = stats[row['category_id']]
+            category_stats.available_count = row['count']
+            category_stats.available_price_sum = row['total']
+
+        for category_id, view_count in products.filter(is_active=True).values_list(
+            'category_id', 'status__view_count'
+        ):
+            category_stats = stats[category_id]
+            category_stats.active_count += 1
+            if view_count is not None:
+                category_stats.view_counts.append(view_count)
+        for category_stats in stats.values():
+            category_stats.view_counts.sort()
+        return stats
+
+    @staticmethod
+    def rebuild(category_ids=None):
+        """Recalcule les statistiques (toutes, ou celles des catégories données). Retourne le dict."""
+        from ..models import CategoryStats
+
+        if category_ids is not None:
+            category_ids = set(category_ids)
+            if not category_ids:
+                return {}
+        stats = CategoryStatsService.compute(category_ids)
+        CategoryStats.objects.bulk_create(
+            stats.values(),
+            update_conflicts=True,
+            unique_fields=['category'],
+            update_fields=STATS_FIELDS,
+        )
+        return stats
+
+    @staticmethod
+    def for_categories(category_ids):
+        """{category_id: CategoryStats} ; les lignes manquantes sont construites à la volée."""
+        from ..models import CategoryStats
+
+        category_ids = set(category_ids)
+        stats = CategoryStats.objects.in_bulk(category_ids)
+        missing = category_ids - stats.keys()
+        if missing:
+            stats.update(CategoryStatsService.rebuild(missing))
+        return stats
+
+    @staticmethod
+    def get(category_id):
+        return CategoryStatsService.for_categories([category_id])[category_id]
+
+    @staticmethod
+    def apply(removed=(), added=()):
+        """
+        Retire puis ajoute des contributions (category_id, en stock, prix, vues) de produits actifs.
+
+        Une contribution à retirer introuvable (statistiques périmées) entraîne
+        la reconstruction de la catégorie.
+        """
+        from ..models import CategoryStats
+
+        category_ids = {entry[0] for entry in (*removed, *added)}
+        if not category_ids:
+            return
+        with transaction.atomic(savepoint=False):
+            # Verrous pris dans l'ordre des clés : deux mises à jour concurrentes
+            # sur les mêmes catégories ne peuvent pas s'interbloquer
+            stats = {
+                category_stats.pk: category_stats
+                for category_stats in CategoryStats.objects.select_for_update()
+                .filter(pk__in=category_ids).order_by('pk')
+            }
+            stale = category_ids - stats.keys()
+
+            for category_id, in_stock, price, view_count in removed:
+                category_stats = stats.get(category_id)
+                if category_stats is None or category_id in stale:
+                    continue
+                views = category_stats.view_counts
+                if view_count is not None:
+                    index = bisect_left(views, view_count)
+                    if index == len(views) or views[index] != view_count:
+                        stale.add(category_id)
+                        continue
+                    del views[index]
+                if not category_stats.active_count or (in_stock and not category_stats.available_count):
+                    stale.add(category_id)
+                    continue
+                category_stats.active_count -= 1
+                if in_stock:
+                    category_stats.available_count -= 1
+                    category_stats.available_price_sum -= price
+
+            for category_id, in_stock, price, view_count in added:
+                category_stats = stats.get(category_id)
+                if category_stats is None or category_id in stale:
+                    continue
+                if view_count is not None:
+                    insort(category_stats.view_counts, view_count)
+                category_stats.active_count += 1
+                if in_stock:
+                    category_stats.available_count += 1
+                    category_stats.available_price_sum += price
+
+            changed = [category_stats for category_id, category_stats in stats.items() if category_id not in stale]
+            if changed:
+                now = timezone.now()
+                for category_stats in changed:
+                    category_stats.updated_at = now
+                CategoryStats.objects.bulk_update(changed, STATS_FIELDS)
+            CategoryStatsService.rebuild(stale)
+
+    @staticmethod
+    def product_saved(product, created=False):
+        """Répercute une sauvegarde de produit (appelé au post_save)."""
+        from ..models import ProductStatus
+
+        old = None if created else getattr(product, '_stats_state', None)
+        new = product.stats_state()
+        product._stats_state = new
+
+        if new is None or (old is None and not created):
+            # État précédent ou courant inconnu (instance partielle ou construite à la main)
+            CategoryStatsService.rebuild({product.category_id, *([old[0]] if old else [])})
+            return
+        if old == new:
+            return
+
+        view_count = 0
+        if not created:
+            view_count = ProductStatus.objects.filter(product_id=product.pk).values_list(
+                'view_count', flat=True
+            ).first()
+        CategoryStatsService.apply(
+            removed=contributions(old, view_count) if old else [],
+            added=contributions(new, view_count),
+        )
+
+    @staticmethod
+    def product_deleted(product):
+        """Répercute une suppression de produit (le statut, et donc ses vues, est déjà supprimé)."""
+        state = getattr(product, '_stats_state', None)
+        if state is None or state[1]:
+            CategoryStatsService.rebuild([product.category_id])
+
+    @staticmethod
+    def apply_view_deltas(view_deltas):
+        """Déplace les vues des produits actifs après un flush : {product_id: vues ajoutées}."""
+        from ..models import Product
+
+        moved = Product.objects.filter(pk__in=list(view_deltas), is_active=True).order_by().values_list(
+            'pk', 'category_id', 'in_stock', 'price', 'status__view_count'
+        )
+        removed, added = [], []
+        for product_id, category_id, in_stock, price, view_count in moved:
+            if view_count is None:
+                continue
+            removed.append((category_id, in_stock, price, view_count - view_deltas[product_id]))
+            added.append((category_id, in_stock, price, view_count))
+        CategoryStatsService.apply(removed=removed, added=added)
@@ -0,0 +1,58 @@
+from ..caching import CATALOG_NAMESPACE, get_generation, single_flight
+from ..constants import CATALOG_CACHE_TIMEOUT
+from ..managers import EMPTY_SUBTREE_COUNTS
+
+TREE_CACHE_KEY = 'showcase:category-tree'
+
+
+class CategoryTreeService:
+    """
+    Arborescence complète des catégories, servie depuis le cache.
+
+    L'arbre est construit en une seule requête ordonnée (tree_id, lft) ; les
+    compteurs de produits par sous-arbre viennent de
+    Category.objects.subtree_counts(). Le résultat sérialisé est mis en cache
+    pour la génération « catalog », incrémentée à chaque modification de
+    catégorie ou de produit ; une seule requête à la fois le reconstruit
+    (single_flight), les autres servent l'arbre précédent.
+    """
+
+    @staticmethod
+    def build():
+        from ..models import Category
+
+        counts = Category.objects.subtree_counts()
+        rows = Category.objects.order_by('tree_id', 'lft').values_list(
+            'id', 'name', 'slug', 'level', 'parent_id'
+        )
+
+        nodes = {}
+        roots = []
+        for category_id, name, slug, level, parent_id in rows:
+            category_counts = counts.get(category_id, EMPTY_SUBTREE_COUNTS)
+            node = {
+                'id': category_id,
+                'name': name,
+                'slug': slug,
+                'level': level,
+                'product_count': category_counts['total'],
+                'active_product_count': category_counts['active'],
+                'available_product_count': category_counts['available'],
+                'direct_product_count': category_counts['direct'],
+                'children': [],
+            }
+            nodes[category_id] = node
+            if parent_id is None:
+                roots.append(node)
+            else:
+                nodes[parent_id]['children'].append(node)
+        return roots
+
+    @staticmethod
+    def get_tree():
+        """Retourne l'arborescence sérialisée, reconstruite si la génération a changé."""
+        tree, _ = single_flight(
+            TREE_CACHE_KEY, CategoryTreeService.build,
+            version=get_generation(CATALOG_NAMESPACE), timeout=CATALOG_CACHE_TIMEOUT,
+        )
+        return tree
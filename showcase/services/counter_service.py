@@ -0,0 +1,202 @@
+import atexit
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, DateTimeField, F, FloatField, IntegerField, Value, When
+
+from ..constants import COUNTER_FLUSH_INTERVAL, COUNTER_FLUSH_CHUNK_SIZE, COUNTER_SHARDS
+
+VIEWS_KEY = 'showcase:counters:views'
+CLICKS_KEY = 'showcase:counters:clicks'
+LAST_VIEWED_KEY = 'showcase:counters:last_viewed'
+
+
+class RedisCounterBackend:
+    """Compteurs partagés entre workers : HINCRBY dans des hash Redis, vidés par Celery beat."""
+
+    def __init__(self):
+        from django_redis import get_redis_connection
+        self.client = get_redis_connection('default')
+
+    def add(self, product_id, views=0, clicks=0, viewed_at=None):
+        pipe = self.client.pipeline(transaction=False)
+        if views:
+            pipe.hincrby(VIEWS_KEY, product_id, views)
+        if clicks:
+            pipe.hincrby(CLICKS_KEY, product_id, clicks)
+        if viewed_at:
+            pipe.hset(LAST_VIEWED_KEY, product_id, viewed_at)
+        pipe.execute()
+
+    def drain(self):
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hgetall(VIEWS_KEY)
+        pipe.hgetall(CLICKS_KEY)
+        pipe.hgetall(LAST_VIEWED_KEY)
+        pipe.delete(VIEWS_KEY, CLICKS_KEY, LAST_VIEWED_KEY)
+        views, clicks, last_viewed, _ = pipe.execute()
+
+        deltas = {}
+        for raw_id, value in views.items():
+            deltas.setdefault(int(raw_id), [0, 0, None])[0] = int(value)
+        for raw_id, value in clicks.items():
+            deltas.setdefault(int(raw_id), [0, 0, None])[1] = int(value)
+        for raw_id, value in last_viewed.items():
+            deltas.setdefault(int(raw_id), [0, 0, None])[2] = float(value)
+        return deltas
+
+    def flush_due(self):
+        # Vidé par la tâche périodique flush_engagement_counters
+        return False
+
+
+class LocalCounterBackend:
+    """
+    Compteurs en mémoire du processus, répartis sur plusieurs verrous.
+
+    Les workers Celery ne voient pas cette mémoire : le processus web vide
+    lui-même ses compteurs dès que l'intervalle de flush est écoulé.
+    """
+
+    def __init__(self, shards=COUNTER_SHARDS):
+        self._counters = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._last_flush = time.monotonic()
+
+    def add(self, product_id, views=0, clicks=0, viewed_at=None):
+        shard = product_id % len(self._locks)
+        with self._locks[shard]:
+            entry = self._counters[shard].setdefault(product_id, [0, 0, None])
+            entry[0] += views
+            entry[1] += clicks
+            if viewed_at:
+                entry[2] = max(entry[2] or 0, viewed_at)
+
+    def drain(self):
+        deltas = {}
+        for shard, lock in enumerate(self._locks):
+            with lock:
+                counters, self._counters[shard] = self._counters[shard], {}
+            deltas.update(counters)
+        self._last_flush = time.monotonic()
+        return deltas
+
+    def flush_due(self):
+        return time.monotonic() - self._last_flush >= COUNTER_FLUSH_INTERVAL
+
+
+class CounterService:
+    """
+    Tampon d'ingestion des vues et clics WhatsApp.
+
+    Chaque événement incrémente un compteur rapide (Redis si le cache par défaut
+    est django-redis, mémoire locale sinon) ; flush() applique les deltas
+    accumulés à ProductStatus en un UPDATE groupé, ce qui évite un verrou de
+    ligne par page vue sur les produits les plus consultés. Les vues ajoutées
+    sont reportées dans la même transaction sur CategoryStats, vues et clics
+    sur l'historique journalier (ProductDailyStats) et sur le score de tendance.
+    """
+
+    _backend = None
+    _backend_lock = threading.Lock()
+    _flush_lock = threading.Lock()
+
+    @classmethod
+    def backend(cls):
+        if cls._backend is None:
+            with cls._backend_lock:
+                if cls._backend is None:
+                    cache_backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+                    if cache_backend.startswith('django_redis'):
+                        cls._backend = RedisCounterBackend()
+                    else:
+                        cls._backend = LocalCounterBackend()
+                        atexit.register(cls._flush_at_exit)
+        return cls._backend
+
+    @classmethod
+    def _flush_at_exit(cls):
+        # La base peut déjà être indisponible à l'arrêt du processus
+        try:
+            cls.flush()
+        except Exception:
+            pass
+
+    @classmethod
+    def record_view(cls, product_id):
+        cls.backend().add(product_id, views=1, viewed_at=time.time())
+        cls._flush_if_due()
+
+    @classmethod
+    def record_click(cls, product_id):
+        cls.backend().add(product_id, clicks=1)
+        cls._flush_if_due()
+
+    @classmethod
+    def _flush_if_due(cls):
+        if cls.backend().flush_due() and cls._flush_lock.acquire(blocking=False):
+            try:
+                cls.flush()
+            finally:
+                cls._flush_lock.release()
+
+    @classmethod
+    def flush(cls):
+        """Applique les deltas en attente à ProductStatus. Retourne le nombre de produits touchés."""
+        from ..models import ProductStatus
+        from .category_stats import CategoryStatsService
+        from .engagement_history import EngagementHistoryService
+        from .trending import TrendingService
+
+        flushed_at = time.time()
+        deltas = cls.backend().drain()
+        items = [(product_id, delta) for product_id, delta in deltas.items() if any(delta)]
+
+        for start in range(0, len(items), COUNTER_FLUSH_CHUNK_SIZE):
+            chunk = items[start:start + COUNTER_FLUSH_CHUNK_SIZE]
+            updates = {}
+
+            view_cases = [When(product_id=pid, then=Value(d[0])) for pid, d in chunk if d[0]]
+            if view_cases:
+                updates['view_count'] = F('view_count') + Case(
+                    *view_cases, default=Value(0), output_field=IntegerField()
+                )
+
+            click_cases = [When(product_id=pid, then=Value(d[1])) for pid, d in chunk if d[1]]
+            if click_cases:
+                updates['whatsapp_click_count'] = F('whatsapp_click_count') + Case(
+                    *click_cases, default=Value(0), output_field=IntegerField()
+                )
+
+            viewed_cases = [
+                When(product_id=pid, then=Value(datetime.fromtimestamp(d[2], tz=dt_timezone.utc)))
+                for pid, d in chunk if d[2]
+            ]
+            if viewed_cases:
+                updates['last_viewed_at'] = Case(
+                    *viewed_cases, default=F('last_viewed_at'), output_field=DateTimeField()
+                )
+
+            with transaction.atomic(savepoint=False):
+                trending = TrendingService.advance(
+                    {pid: (d[0], d[1]) for pid, d in chunk if d[0] or d[1]}, at=flushed_at
+                )
+                if trending:
+                    updates['trending_score'] = Case(
+                        *[When(product_id=pid, then=Value(score)) for pid, score in trending.items()],
+                        default=F('trending_score'), output_field=FloatField()
+                    )
+
+                if updates:
+                    ProductStatus.objects.filter(
+                        product_id__in=[pid for pid, _ in chunk]
+                    ).update(**updates)
+
+                view_deltas = {pid: d[0] for pid, d in chunk if d[0]}
+                if view_deltas:
+                    CategoryStatsService.apply_view_deltas(view_deltas)
+                EngagementHistoryService.record({pid: (d[0], d[1]) for pid, d in chunk})
+
+        return len(items)
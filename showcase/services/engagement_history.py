@@ -0,0 +1,90 @@
+from datetime import timedelta
+from django.db.models import Case, F, IntegerField, Sum, Value, When
+from django.utils import timezone
+
+from ..constants import ENGAGEMENT_HISTORY_DAYS
+
+
+class EngagementHistoryService:
+    """
+    Historique journalier des vues et clics (ProductDailyStats).
+
+    Les deltas de chaque flush de compteurs sont ajoutés au compartiment du
+    jour ; les totaux sur une fenêtre de N jours, pour un ou plusieurs
+    produits, sont obtenus en une requête agrégée.
+    """
+
+    @staticmethod
+    def record(deltas, day=None):
+        """Ajoute {product_id: (vues, clics)} au compartiment du jour."""
+        from ..models import Product, ProductDailyStats
+
+        deltas = {product_id: delta for product_id, delta in deltas.items() if any(delta)}
+        if not deltas:
+            return
+        day = day or timezone.localdate()
+        rows = ProductDailyStats.objects.filter(date=day)
+
+        product_ids = set(rows.filter(product_id__in=list(deltas)).values_list('product_id', flat=True))
+        missing = [product_id for product_id in deltas if product_id not in product_ids]
+        if missing:
+            # Produits supprimés depuis l'événement : pas de ligne orpheline
+            created = list(Product.objects.filter(pk__in=missing).order_by().values_list('pk', flat=True))
+            # Lignes créées à zéro puis incrémentées comme les autres : si un autre
+            # processus insère le même compartiment en parallèle, le conflit est
+            # ignoré sans perdre les deltas de ce flush
+            ProductDailyStats.objects.bulk_create([
+                ProductDailyStats(product_id=product_id, date=day) for product_id in created
+            ], ignore_conflicts=True)
+            product_ids.update(created)
+        if not product_ids:
+            return
+
+        updates = {}
+        for field, position in (('views', 0), ('clicks', 1)):
+            cases = [
+                When(product_id=product_id, then=Value(deltas[product_id][position]))
+                for product_id in product_ids if deltas[product_id][position]
+            ]
+            if cases:
+                updates[field] = F(field) + Case(*cases, default=Value(0), output_field=IntegerField())
+        rows.filter(product_id__in=product_ids).update(**updates)
+
+    @staticmethod
+    def window_start(days, now=None):
+        """Premier jour d'une fenêtre de `days` jours se terminant aujourd'hui (inclus)."""
+        return timezone.localdate(now) - timedelta(days=days - 1)
+
+    @staticmethod
+    def totals(product_ids=None, days=30, now=None):
+        """{product_id: (vues, clics)} sur les `days` derniers jours ; les produits sans activité sont absents."""
+        from ..models import ProductDailyStats
+
+        rows = ProductDailyStats.objects.filter(date__gte=EngagementHistoryService.window_start(days, now))
+        if product_ids is not None:
+            rows = rows.filter(product_id__in=list(product_ids))
+        return {
+            product_id: (views, clicks)
+            for product_id, views, clicks in rows.values('product_id').annotate(
+                total_views=Sum('views'), total_clicks=Sum('clicks'),
+            ).values_list('product_id', 'total_views', 'total_clicks')
+        }
+
+    @staticmethod
+    def engagement_queryset(days=30, now=None):
+        """Produits ayant eu de l'activité sur la fenêtre, annotés de `engagement` (vues + clics)."""
+        from ..models import ProductDailyStats
+
+        return ProductDailyStats.objects.filter(
+            date__gte=EngagementHistoryService.window_start(days, now)
+        ).values('product_id').annotate(engagement=Sum('views') + Sum('clicks'))
+
+    @staticmethod
+    def prune(keep_days=ENGAGEMENT_HISTORY_DAYS, now=None):
+        """Supprime les compartiments sortis de l'historique. Retourne le nombre de lignes supprimées."""
+        from ..models import ProductDailyStats
+
+        deleted, _ = ProductDailyStats.objects.filter(
+            date__lt=EngagementHistoryService.window_start(keep_days, now)
+        ).delete()
+        return deleted
@@ -0,0 +1,162 @@
+import hashlib
+import json
+
+from django.db.models import Count, Q
+
+from ..caching import CATALOG_NAMESPACE, get_generation, single_flight
+from ..constants import FACETS_CACHE_TIMEOUT, FACETS_STALE_TIMEOUT, PRICE_BUCKETS
+from .category_tree import CategoryTreeService
+
+FACETS_CACHE_KEY = 'showcase:facets:{}:{}'
+
+# Paramètres de ProductFilter propres à chaque facette : ils sont ignorés pour
+# compter les valeurs de cette facette (le choix d'une marque ne masque pas les autres)
+FACET_PARAMS = {
+    'brands': ('brand',),
+    'categories': ('category', 'category_slug'),
+    'price_ranges': ('min_price', 'max_price', 'price_range_min', 'price_range_max'),
+    'stock': ('in_stock', 'min_stock'),
+    'discount': ('has_discount',),
+}
+IGNORED_PARAMS = ('ordering',)
+
+
+class FacetService:
+    """
+    Compteurs de facettes pour l'ensemble de filtres courant de ProductFilter.
+
+    Chaque facette est comptée avec tous les filtres sauf les siens, en une
+    requête groupée (soit cinq requêtes), et le résultat est mis en cache par
+    jeu de filtres canonique pour la génération « catalog ». Passé
+    FACETS_CACHE_TIMEOUT, une seule requête le recalcule pendant que les
+    autres reçoivent les compteurs précédents (single_flight).
+    """
+
+    @staticmethod
+    def canonical_params(params):
+        """Filtres reconnus, triés, sans valeur vide : {nom: [valeurs]}."""
+        from django_filters import RangeFilter
+        from ..api_filters import ProductFilter
+
+        names = set()
+        for name, field in ProductFilter.base_filters.items():
+            if isinstance(field, RangeFilter):
+                names.update((f'{name}_min', f'{name}_max'))
+            else:
+                names.add(name)
+        canonical = {}
+        for name in sorted(names - set(IGNORED_PARAMS)):
+            values = sorted(value.strip() for value in params.getlist(name) if value.strip())
+            if values:
+                canonical[name] = values
+        return canonical
+
+    @staticmethod
+    def filtered(queryset, params, excluded=()):
+        from django.http import QueryDict
+        from ..api_filters import ProductFilter
+
+        data = QueryDict(mutable=True)
+        for name, values in params.items():
+            if name not in excluded:
+                data.setlist(name, values)
+        return ProductFilter(data, queryset=queryset).qs.order_by().prefetch_related(None)
+
+    @staticmethod
+    def compute(queryset, params):
+        def scoped(facet):
+            return FacetService.filtered(queryset, params, FACET_PARAMS[facet])
+
+        brands = scoped('brands').exclude(brand__isnull=True).exclude(brand='').values(
+            'brand'
+        ).annotate(count=Count('id')).order_by('-count', 'brand')
+
+        direct_counts = dict(
+            scoped('categories').values('category_id').annotate(
+                count=Count('id')
+            ).values_list('category_id', 'count')
+        )
+
+        price_ranges = scoped('price_ranges').aggregate(**{
+            key: Count('id', filter=FacetService.price_bucket_filter(min_price, max_price))
+            for key, _, min_price, max_price in PRICE_BUCKETS
+        })
+
+        stock = scoped('stock').aggregate(
+            total=Count('id'), in_stock=Count('id', filter=Q(in_stock=True))
+        )
+        discount = scoped('discount').aggregate(
+            total=Count('id'),
+            with_discount=Count('id', filter=Q(compare_at_price__gt=0)),
+        )
+
+        return {
+            'brands': [{'name': row['brand'], 'count': row['count']} for row in brands],
+            'categories': FacetService.category_counts(direct_counts),
+            'price_ranges': [
+                {
+                    'key': key, 'label': label,
+                    'min_price': min_price, 'max_price': max_price,
+                    'count': price_ranges[key],
+                }
+                for key, label, min_price, max_price in PRICE_BUCKETS
+            ],
+            'stock': {
+                'in_stock': stock['in_stock'],
+                'out_of_stock': stock['total'] - stock['in_stock'],
+            },
+            'discount': {
+                'with_discount': discount['with_discount'],
+                'without_discount': discount['total'] - discount['with_discount'],
+            },
+        }
+
+    @staticmethod
+    def price_bucket_filter(min_price, max_price):
+        condition = Q()
+        if min_price is not None:
+            condition &= Q(effective_price__gte=min_price)
+        if max_price is not None:
+            condition &= Q(effective_price__lt=max_price)
+        return condition
+
+    @staticmethod
+    def category_counts(direct_counts):
+        """Cumule les comptages directs par sous-arbre sur l'arborescence en cache."""
+        results = []
+
+        def walk(node, parent_id):
+            entry = {
+                'id': node['id'], 'name': node['name'], 'slug': node['slug'],
+                'parent_id': parent_id, 'level': node['level'], 'count': 0,
+            }
+            results.append(entry)
+            entry['count'] = direct_counts.get(node['id'], 0) + sum(
+                walk(child, node['id']) for child in node['children']
+            )
+            return entry['count']
+
+        for root in CategoryTreeService.get_tree():
+            walk(root, None)
+        return [entry for entry in results if entry['count']]
+
+    @staticmethod
+    def get_facets(queryset, params, scope='public'):
+        """
+        Retourne les facettes pour les paramètres de requête donnés.
+
+        `scope` distingue les querysets de base (produits actifs seulement pour
+        le public) dans la clé de cache.
+        """
+        canonical = FacetService.canonical_params(params)
+        digest = hashlib.md5(
+            json.dumps(canonical, sort_keys=True).encode(), usedforsecurity=False
+        ).hexdigest()
+        facets, _ = single_flight(
+            FACETS_CACHE_KEY.format(scope, digest),
+            lambda: FacetService.compute(queryset, canonical),
+            version=get_generation(CATALOG_NAMESPACE),
+            max_age=FACETS_CACHE_TIMEOUT,
+            timeout=FACETS_STALE_TIMEOUT,
+        )
+        return facets
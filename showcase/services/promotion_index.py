@@ -0,0 +1,144 @@
+import bisect
+import threading
+import time
+from django.db.models import Sum
+from django.utils import timezone
+
+from ..caching import get_generation, bump_generation
+from ..constants import PROMOTION_INDEX_CHECK_INTERVAL
+
+GENERATION_NAMESPACE = 'promotions'
+
+
+class PromotionIndex:
+    """
+    Instantané compilé des promotions actives.
+
+    Les cibles de chaque promotion (produits, sous-arbres de catégories MPTT,
+    « tous les produits ») sont résolues une fois à la construction ; la
+    résolution pour un produit se fait ensuite en mémoire, sans requête.
+    Seule la fenêtre temporelle est évaluée à l'appel, ce qui permet à une
+    promotion programmée de démarrer sans reconstruire l'index.
+    """
+
+    def __init__(self, promotions, product_map, category_map, generation=None):
+        self.promotions = promotions
+        self.generation = generation
+        self._rank = {promo.pk: rank for rank, promo in enumerate(promotions)}
+        self._global = [promo for promo in promotions if promo.applies_to_all]
+        self._by_product = product_map
+        self._by_category = category_map
+
+    @classmethod
+    def build(cls, generation=None):
+        from ..models import Category, Promotion, PromotionUsage
+
+        now = timezone.now()
+        candidates = list(
+            Promotion.objects.filter(active=True).exclude(end_at__lt=now)
+        )
+        promo_ids = [promo.pk for promo in candidates]
+
+        usage_totals = dict(
+            PromotionUsage.objects.filter(promotion_id__in=promo_ids)
+            .values('promotion_id')
+            .annotate(total=Sum('count'))
+            .values_list('promotion_id', 'total')
+        )
+        promotions = [
+            promo for promo in candidates
+            if promo.usage_limit is None or (usage_totals.get(promo.pk) or 0) < promo.usage_limit
+        ]
+        by_id = {promo.pk: promo for promo in promotions}
+
+        product_map = {}
+        product_links = Promotion.products.through.objects.filter(
+            promotion_id__in=by_id.keys()
+        ).values_list('promotion_id', 'product_id')
+        for promo_id, product_id in product_links:
+            product_map.setdefault(product_id, []).append(by_id[promo_id])
+
+        category_map = {}
+        category_links = list(
+            Promotion.categories.through.objects.filter(
+                promotion_id__in=by_id.keys()
+            ).values_list('promotion_id', 'category__tree_id', 'category__lft', 'category__rght')
+        )
+        if category_links:
+            nodes = list(
+                Category.objects.order_by('tree_id', 'lft').values_list('tree_id', 'lft', 'id')
+            )
+            keys = [(tree_id, lft) for tree_id, lft, _ in nodes]
+            for promo_id, tree_id, lft, rght in category_links:
+                start = bisect.bisect_left(keys, (tree_id, lft))
+                end = bisect.bisect_right(keys, (tree_id, rght))
+                for _, _, category_id in nodes[start:end]:
+                    bucket = category_map.setdefault(category_id, [])
+                    if by_id[promo_id] not in bucket:
+                        bucket.append(by_id[promo_id])
+
+        return cls(promotions, product_map, category_map, generation=generation)
+
+    @staticmethod
+    def _is_live(promo, now):
+        if promo.start_at and now < promo.start_at:
+            return False
+        if promo.end_at and now > promo.end_at:
+            return False
+        return True
+
+    def for_product(self, product, now=None):
+        """Retourne les promotions applicables au produit, dans l'ordre par défaut des promotions."""
+        if not product:
+            return []
+
+        now = now or timezone.now()
+        found = {}
+        for promo in self._global:
+            found[promo.pk] = promo
+        for promo in self._by_product.get(product.pk, ()):
+            found[promo.pk] = promo
+        for promo in self._by_category.get(product.category_id, ()):
+            found[promo.pk] = promo
+
+        applicable = [promo for promo in found.values() if self._is_live(promo, now)]
+        applicable.sort(key=lambda promo: self._rank[promo.pk])
+        return applicable
+
+
+_lock = threading.Lock()
+_state = {'index': None, 'checked_at': 0.0}
+
+
+def get_promotion_index():
+    """
+    Retourne l'index du processus, reconstruit si la génération partagée a changé.
+
+    La génération n'est relue qu'au plus toutes les PROMOTION_INDEX_CHECK_INTERVAL
+    secondes afin de ne pas solliciter le cache pour chaque produit d'une liste.
+    """
+    index = _state['index']
+    now = time.monotonic()
+    if index is not None and now - _state['checked_at'] < PROMOTION_INDEX_CHECK_INTERVAL:
+        return index
+
+    generation = get_generation(GENERATION_NAMESPACE)
+    if index is not None and index.generation == generation:
+        _state['checked_at'] = now
+        return index
+
+    with _lock:
+        index = _state['index']
+        if index is None or index.generation != generation:
+            index = PromotionIndex.build(generation=generation)
+            _state['index'] = index
+        _state['checked_at'] = now
+    return index
+
+
+def invalidate_promotion_index():
+    """Invalide l'index localement et dans les autres processus."""
+    with _lock:
+        _state['index'] = None
+        _state['checked_at'] = 0.0
+    bump_generation(GENERATION_NAMESPACE)
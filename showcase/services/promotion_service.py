@@ -2,16 +2,14 @@ from decimal import Decimal
 from django.utils import timezone
 from django.db.models import F
 
+from .promotion_index import get_promotion_index
+
 
 class PromotionService:
 
     @staticmethod
     def get_applicable_promotions(product):
-        from ..models import Promotion
-
-        now_qs = Promotion.objects.filter(active=True)
-        applicable = [p for p in now_qs if p.is_active_now() and p.applies_to_product(product)]
-        return applicable
+        return get_promotion_index().for_product(product)
 
     @staticmethod
     def get_best_promotion(product, quantity=1):
@@ -20,7 +18,7 @@ class PromotionService:
         best_final = product.price
 
         for promo in promos:
-            disc, final_unit = promo.get_discount_amount(product, quantity=1)
+            disc, final_unit = promo.compute_discount(product, quantity=1)
             if final_unit < best_final:
                 best_final = final_unit
                 best = (promo, disc, final_unit)
@@ -29,12 +27,56 @@ class PromotionService:
 
     @staticmethod
     def calculate_price_with_promotions(product, quantity=1):
+        applicable = PromotionService.get_applicable_promotions(product)
+        total_discount, final_unit, _ = PromotionService.resolve_price(product, applicable, quantity)
+        return total_discount, final_unit
+
+    @staticmethod
+    def calculate_prices_bulk(products, quantities=None):
+        """
+        Calcule le prix de plusieurs lignes (produit, quantité) en une passe.
+
+        Les promotions sont résolues via l'index en mémoire : le nombre de requêtes
+        ne dépend pas du nombre de lignes.
+        """
+        if quantities is None:
+            quantities = [1] * len(products)
+
+        index = get_promotion_index()
+        now = timezone.now()
+        quotes = []
+
+        for product, quantity in zip(products, quantities):
+            qty = max(1, int(quantity))
+            applicable = index.for_product(product, now=now)
+            discount_total, final_unit, promotions = PromotionService.resolve_price(
+                product, applicable, qty
+            )
+            quotes.append({
+                'product': product,
+                'quantity': qty,
+                'original_price': product.price,
+                'final_unit_price': final_unit,
+                'total': (final_unit * qty).quantize(Decimal('0.01')),
+                'discount_total': discount_total,
+                'promotion': promotions[0] if promotions else None,
+                'promotions': promotions,
+            })
+
+        return quotes
+
+    @staticmethod
+    def resolve_price(product, applicable, quantity=1):
+        """
+        Applique les règles d'empilement aux promotions applicables.
+
+        Retourne (remise totale, prix unitaire final, promotions retenues).
+        """
         qty = max(1, int(quantity))
         original = product.price
-        applicable = PromotionService.get_applicable_promotions(product)
 
         if not applicable:
-            return Decimal('0.00'), original
+            return Decimal('0.00'), original, []
 
         stackable = [p for p in applicable if p.is_stackable]
         non_stackable = [p for p in applicable if not p.is_stackable]
@@ -45,9 +87,15 @@ class PromotionService:
             p.value for p in stackable
             if p.promotion_type == 'set_price' and p.value is not None
         ]
+        stack_winners = []
         if set_prices:
             try:
                 unit_price_stack = min([Decimal(v) for v in set_prices])
+                stack_winners.append(next(
+                    p for p in stackable
+                    if p.promotion_type == 'set_price' and p.value is not None
+                    and Decimal(p.value) == unit_price_stack
+                ))
             except Exception:
                 pass
 
@@ -56,6 +104,7 @@ class PromotionService:
             if p.promotion_type == 'amount' and p.value:
                 try:
                     amount_total += Decimal(p.value)
+                    stack_winners.append(p)
                 except Exception:
                     pass
         unit_price_stack = max(Decimal('0.00'), unit_price_stack - amount_total)
@@ -64,6 +113,10 @@ class PromotionService:
             Decimal(p.value) for p in stackable
             if p.promotion_type == 'percent' and p.value is not None
         ]
+        stack_winners.extend(
+            p for p in stackable
+            if p.promotion_type == 'percent' and p.value is not None
+        )
         for pct in percent_values:
             try:
                 unit_price_stack = (
@@ -75,11 +128,13 @@ class PromotionService:
         final_unit_stack = unit_price_stack.quantize(Decimal('0.01'))
 
         best_non_stack_final = original
+        best_non_stack = None
         for p in non_stackable:
             try:
-                _, final = p.get_discount_amount(product, quantity=1)
+                _, final = p.compute_discount(product, quantity=1)
                 if final < best_non_stack_final:
                     best_non_stack_final = final
+                    best_non_stack = p
             except Exception:
                 continue
 
@@ -87,10 +142,17 @@ class PromotionService:
         if candidate_unit is None:
             candidate_unit = original
 
+        if final_unit_stack < original and final_unit_stack <= best_non_stack_final:
+            winners = stack_winners
+        elif best_non_stack is not None:
+            winners = [best_non_stack]
+        else:
+            winners = []
+
         candidate_unit = Decimal(candidate_unit).quantize(Decimal('0.01'))
         total_discount = (original - candidate_unit) * qty
 
-        return total_discount.quantize(Decimal('0.01')), candidate_unit
+        return total_discount.quantize(Decimal('0.01')), candidate_unit, winners
 
     @staticmethod
     def redeem_promotion(promotion, user=None, increment=1):
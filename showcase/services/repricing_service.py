@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ..caching import bump_model_generation
+from ..constants import REPRICE_CHUNK_SIZE, REPRICE_DEBOUNCE_SECONDS
+from .promotion_service import PromotionService
+
+PENDING_KEY = 'showcase:reprice:pending'
+LAST_CHECK_KEY = 'showcase:reprice:last_check'
+
+
+class RepricingService:
+    """Maintient les colonnes dénormalisées Product.effective_price / best_promotion."""
+
+    @staticmethod
+    def reprice(product_ids=None, chunk_size=REPRICE_CHUNK_SIZE):
+        """
+        Recalcule le prix effectif des produits (tout le catalogue par défaut).
+
+        Les produits sont traités par lots ; seules les lignes modifiées sont
+        réécrites avec bulk_update. Retourne le nombre de produits mis à jour.
+        """
+        from ..models import Product
+
+        qs = Product.objects.only(
+            'id', 'price', 'category_id',
+            'effective_price', 'best_promotion_id', 'effective_discount_percent'
+        ).order_by('pk')
+        if product_ids is not None:
+            qs = qs.filter(pk__in=list(product_ids))
+
+        updated = 0
+        last_pk = 0
+        while True:
+            batch = list(qs.filter(pk__gt=last_pk)[:chunk_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            quotes = PromotionService.calculate_prices_bulk(batch)
+            changed = [
+                product for product, quote in zip(batch, quotes)
+                if product.refresh_effective_price(quote)
+            ]
+            if changed:
+                Product.objects.bulk_update(changed, Product.EFFECTIVE_PRICE_FIELDS)
+                updated += len(changed)
+
+        if updated:
+            bump_model_generation(Product)
+        return updated
+
+    @staticmethod
+    def schedule_catalog_reprice():
+        """
+        Planifie un recalcul complet après le commit courant.
+
+        Les demandes rapprochées (sauvegarde d'une promotion puis de ses M2M,
+        actions groupées de l'admin) sont fusionnées en une seule tâche.
+        """
+        from ..tasks import reprice_products
+
+        if cache.add(PENDING_KEY, True, timeout=REPRICE_DEBOUNCE_SECONDS):
+            transaction.on_commit(
+                lambda: reprice_products.apply_async(countdown=REPRICE_DEBOUNCE_SECONDS)
+            )
+
+    @staticmethod
+    def reprice_due_promotions():
+        """
+        Recalcule le catalogue si une promotion a démarré ou expiré depuis le dernier passage.
+
+        Traite aussi les produits jamais tarifés (créés via bulk_create par exemple).
+        """
+        from ..models import Product, Promotion
+
+        now = timezone.now()
+        last_check = cache.get(LAST_CHECK_KEY) or now
+        cache.set(LAST_CHECK_KEY, now, timeout=None)
+
+        boundary_crossed = Promotion.objects.filter(active=True).filter(
+            Q(start_at__gt=last_check, start_at__lte=now) |
+            Q(end_at__gte=last_check, end_at__lt=now)
+        ).exists()
+        if boundary_crossed:
+            return RepricingService.reprice()
+
+        unpriced = list(
+            Product.objects.filter(effective_price__isnull=True).values_list('pk', flat=True)
+        )
+        if unpriced:
+            return RepricingService.reprice(unpriced)
+        return 0
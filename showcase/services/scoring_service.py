@@ -1,14 +1,24 @@
 from datetime import timedelta
 from decimal import Decimal
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 
+from ..caching import bump_model_generation
 from ..constants import (
     SCORE_WEIGHTS,
     RECOMMENDATION_WEIGHTS,
     FEATURED_SCORE_THRESHOLD,
-    RECOMMENDATION_SCORE_THRESHOLD
+    RECOMMENDATION_SCORE_THRESHOLD,
+    RESCORE_BATCH_SIZE,
+    RESCORE_DEBOUNCE_SECONDS,
 )
+from .category_stats import CategoryStatsService
+from .engagement_history import EngagementHistoryService
+from .shelves import ShelfService
+
+SCORE_FIELDS = ['is_featured', 'featured_score', 'is_recommended', 'recommendation_score']
+RESCORE_PENDING_KEY = 'showcase:rescore:pending'
 
 
 class ScoringService:
@@ -16,6 +26,19 @@ class ScoringService:
     @staticmethod
     def calculate_featured_score(product_status):
         product = product_status.product
+        stats = CategoryStatsService.get(product.category_id)
+
+        return ScoringService.featured_score_from(product_status, product, stats.mean_price)
+
+    @staticmethod
+    def featured_score_from(product_status, product, category_avg_price, now=None, recent_engagement=None):
+        """
+        Score vedette à partir du prix moyen (actifs, en stock) de la catégorie.
+
+        recent_engagement : (vues, clics) des 30 derniers jours ; lu dans
+        l'historique journalier s'il n'est pas fourni.
+        """
+        now = now or timezone.now()
 
         if product_status.exclude_from_featured:
             return False, Decimal('0.0')
@@ -25,15 +48,17 @@ class ScoringService:
 
         score = Decimal('0.0')
 
-        views_last_30_days = product_status.get_views_last_n_days(30)
-        score += min(views_last_30_days / 100 * SCORE_WEIGHTS['views'], SCORE_WEIGHTS['views'])
+        if recent_engagement is None:
+            recent_engagement = product_status.get_engagement_last_n_days(30, now=now)
+        views_last_30_days, clicks_last_30_days = recent_engagement
+        score += min(Decimal(views_last_30_days) / 100 * SCORE_WEIGHTS['views'], SCORE_WEIGHTS['views'])
 
         score += min(
-            product_status.whatsapp_click_count / 50 * SCORE_WEIGHTS['whatsapp_clicks'],
+            Decimal(clicks_last_30_days) / 50 * SCORE_WEIGHTS['whatsapp_clicks'],
             SCORE_WEIGHTS['whatsapp_clicks']
         )
 
-        days_since_creation = (timezone.now() - product.created_at).days
+        days_since_creation = (now - product.created_at).days
         if days_since_creation <= 7:
             novelty_score = 10
         elif days_since_creation <= 30:
@@ -54,9 +79,7 @@ class ScoringService:
             stock_score = 0
         score += stock_score
 
-        avg_price = product.category.products.filter(
-            is_active=True, in_stock=True
-        ).aggregate(avg=Avg('price'))['avg'] or product.price
+        avg_price = category_avg_price or product.price
 
         if product.price <= avg_price * Decimal('0.8'):
             price_score = 10
@@ -88,6 +111,21 @@ class ScoringService:
     @staticmethod
     def calculate_recommendation_score(product_status):
         product = product_status.product
+        stats = CategoryStatsService.get(product.category_id)
+
+        return ScoringService.recommendation_score_from(
+            product_status, product, stats.count_views_above(product_status.view_count), stats.active_count
+        )
+
+    @staticmethod
+    def recommendation_score_from(product_status, product, products_above, total_products, now=None):
+        """
+        Score de recommandation à partir du rang de vues dans la catégorie.
+
+        products_above : produits actifs de la catégorie ayant strictement plus de vues
+        total_products : produits actifs de la catégorie
+        """
+        now = now or timezone.now()
 
         if product_status.exclude_from_recommended:
             return False, Decimal('0.0')
@@ -99,7 +137,7 @@ class ScoringService:
 
         total_engagement = product_status.view_count + (product_status.whatsapp_click_count * 3)
         score += min(
-            total_engagement / 200 * RECOMMENDATION_WEIGHTS['engagement'],
+            Decimal(total_engagement) / 200 * RECOMMENDATION_WEIGHTS['engagement'],
             RECOMMENDATION_WEIGHTS['engagement']
         )
 
@@ -115,12 +153,7 @@ class ScoringService:
             else:
                 score += 5
 
-        category_products = product.category.products.filter(is_active=True)
-        if category_products.exists():
-            products_above = category_products.filter(
-                status__view_count__gt=product_status.view_count
-            ).count()
-            total_products = category_products.count()
+        if total_products:
             percentile = (1 - products_above / max(total_products, 1)) * 100
 
             if percentile >= 80:
@@ -148,7 +181,7 @@ class ScoringService:
             score += 7
 
         if product_status.last_viewed_at:
-            days_since_view = (timezone.now() - product_status.last_viewed_at).days
+            days_since_view = (now - product_status.last_viewed_at).days
             if days_since_view <= 7:
                 score += 10
             elif days_since_view <= 30:
@@ -162,3 +195,110 @@ class ScoringService:
         is_recommended = final_score >= RECOMMENDATION_SCORE_THRESHOLD
 
         return is_recommended, final_score
+
+    @staticmethod
+    def rescore_catalog(product_ids=None, batch_size=RESCORE_BATCH_SIZE):
+        """
+        Recalcule les scores de tout le catalogue (ou d'un sous-ensemble) en une passe.
+
+        Les statistiques de catégorie (prix moyen, vues triées des produits
+        actifs) sont lues dans CategoryStats en une requête, les vues et clics
+        des 30 derniers jours dans l'historique journalier en une autre ; le
+        rang de chaque produit est obtenu par recherche dichotomique dans les
+        vues triées. Les scores sont identiques à ceux du calcul unitaire.
+        Retourne le nombre de statuts modifiés.
+        """
+        from ..models import ProductStatus
+
+        statuses = ProductStatus.objects.select_related('product')
+        if product_ids is not None:
+            statuses = statuses.filter(product_id__in=list(product_ids))
+        statuses = list(statuses)
+        if not statuses:
+            return 0
+
+        now = timezone.now()
+        category_stats = CategoryStatsService.for_categories(
+            {status.product.category_id for status in statuses}
+        )
+        recent_engagement = EngagementHistoryService.totals(
+            [status.product_id for status in statuses] if product_ids is not None else None, days=30, now=now
+        )
+
+        changed = []
+        for status in statuses:
+            product = status.product
+            stats = category_stats[product.category_id]
+
+            is_featured, featured_score = ScoringService.featured_score_from(
+                status, product, stats.mean_price, now=now,
+                recent_engagement=recent_engagement.get(status.product_id, (0, 0)),
+            )
+            is_recommended, recommendation_score = ScoringService.recommendation_score_from(
+                status, product, stats.count_views_above(status.view_count), stats.active_count, now=now
+            )
+
+            new_values = (is_featured, float(featured_score), is_recommended, float(recommendation_score))
+            old_values = (
+                status.is_featured, float(status.featured_score),
+                status.is_recommended, float(status.recommendation_score),
+            )
+            if new_values != old_values:
+                (status.is_featured, status.featured_score,
+                 status.is_recommended, status.recommendation_score) = new_values
+                changed.append(status)
+
+        if changed:
+            ProductStatus.objects.bulk_update(changed, SCORE_FIELDS, batch_size=batch_size)
+            bump_model_generation(ProductStatus)
+            ShelfService.schedule_materialize()
+        return len(changed)
+
+    @staticmethod
+    def mark_dirty(product_ids):
+        """
+        Marque les scores des produits à recalculer et planifie la tâche groupée.
+
+        Un produit déjà marqué n'est pas réécrit : les demandes répétées se
+        confondent jusqu'au prochain passage de rescore_dirty.
+        """
+        from ..models import ProductStatus
+
+        count = ProductStatus.objects.filter(
+            product_id__in=product_ids, scores_dirty=False
+        ).update(scores_dirty=True)
+        ScoringService.schedule_rescore()
+        return count
+
+    @staticmethod
+    def schedule_rescore():
+        """Planifie rescore_dirty après le commit courant, une fois par fenêtre de RESCORE_DEBOUNCE_SECONDS."""
+        from ..tasks import rescore_dirty_products
+
+        if cache.add(RESCORE_PENDING_KEY, True, timeout=RESCORE_DEBOUNCE_SECONDS):
+            transaction.on_commit(
+                lambda: rescore_dirty_products.apply_async(countdown=RESCORE_DEBOUNCE_SECONDS)
+            )
+
+    @staticmethod
+    def rescore_dirty(batch_size=RESCORE_BATCH_SIZE):
+        """
+        Recalcule par lots les scores des produits marqués (scores_dirty).
+
+        Le marqueur est levé avant le calcul : un produit modifié pendant le
+        passage est de nouveau marqué et sera traité au suivant. Retourne le
+        nombre de produits recalculés.
+        """
+        from ..models import ProductStatus
+
+        rescored = 0
+        while True:
+            product_ids = list(
+                ProductStatus.objects.filter(scores_dirty=True)
+                .order_by('product_id').values_list('product_id', flat=True)[:batch_size]
+            )
+            if not product_ids:
+                return rescored
+            ProductStatus.objects.filter(product_id__in=product_ids).update(scores_dirty=False)
+            ScoringService.rescore_catalog(product_ids, batch_size=batch_size)
+            rescored += len(product_ids)
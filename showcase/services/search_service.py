@@ -0,0 +1,151 @@
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import Count, F, FloatField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce, Ln
+
+from ..constants import REPRICE_CHUNK_SIZE, SEARCH_FIELD_WEIGHTS, SEARCH_POPULARITY_BOOST
+from ..utils import TOKEN_SPLIT_RE, normalize_text, tokenize
+
+# Champs dont la forme compacte (« HP-15S/01 » -> « hp15s01 ») est aussi indexée
+COMPACT_FIELDS = ('sku', 'barcode')
+MAX_TOKEN_LENGTH = 64
+
+
+class SearchService:
+    """
+    Recherche plein texte des produits, avec classement par pertinence.
+
+    Les textes sont normalisés côté Python (minuscules, sans accents, sans
+    mots vides, pluriels simples ramenés au singulier) puis indexés :
+
+    - PostgreSQL : Product.search_vector (config 'simple', poids A-D par champ,
+      index GIN) interrogé par SearchQuery / SearchRank ;
+    - autres bases (SQLite, tests) : index inversé ProductSearchToken, un jeton
+      par produit avec la somme des poids des champs où il apparaît.
+
+    Le rang est pondéré par la popularité (vues, clics WhatsApp de ProductStatus).
+    L'index est tenu à jour par le signal post_save de Product.
+    """
+
+    @staticmethod
+    def uses_postgres():
+        return connection.vendor == 'postgresql'
+
+    @staticmethod
+    def field_tokens(product, field):
+        value = getattr(product, field) or ''
+        tokens = tokenize(value)
+        if field in COMPACT_FIELDS:
+            compact = ''.join(TOKEN_SPLIT_RE.split(normalize_text(value)))
+            if compact and compact not in tokens:
+                tokens.append(compact)
+        return [token[:MAX_TOKEN_LENGTH] for token in tokens]
+
+    @staticmethod
+    def document_tokens(product):
+        """Retourne {jeton: poids cumulé} pour les champs indexés du produit."""
+        weights = defaultdict(int)
+        for field, (weight, _) in SEARCH_FIELD_WEIGHTS.items():
+            for token in set(SearchService.field_tokens(product, field)):
+                weights[token] += weight
+        return dict(weights)
+
+    @staticmethod
+    def search_vector(product):
+        """Expression SearchVector du produit (PostgreSQL)."""
+        from django.contrib.postgres.search import SearchVector
+
+        vector = None
+        for field, (_, letter) in SEARCH_FIELD_WEIGHTS.items():
+            text = ' '.join(SearchService.field_tokens(product, field))
+            part = SearchVector(Value(text), weight=letter, config='simple')
+            vector = part if vector is None else vector + part
+        return vector
+
+    @staticmethod
+    def index_products(products):
+        """Réindexe les produits donnés (instances avec les champs de SEARCH_FIELD_WEIGHTS chargés)."""
+        from ..models import Product, ProductSearchToken
+
+        products = list(products)
+        if not products:
+            return
+
+        if SearchService.uses_postgres():
+            for product in products:
+                product.search_vector = SearchService.search_vector(product)
+            Product.objects.bulk_update(products, ['search_vector'])
+            return
+
+        ProductSearchToken.objects.filter(product__in=[product.pk for product in products]).delete()
+        ProductSearchToken.objects.bulk_create([
+            ProductSearchToken(product_id=product.pk, token=token, weight=weight)
+            for product in products
+            for token, weight in SearchService.document_tokens(product).items()
+        ], batch_size=1000)
+
+    @staticmethod
+    def rebuild_index(chunk_size=REPRICE_CHUNK_SIZE):
+        """Réindexe tout le catalogue par lots ; retourne le nombre de produits traités."""
+        from ..models import Product
+
+        qs = Product.objects.only('id', *SEARCH_FIELD_WEIGHTS).order_by('pk')
+        indexed = 0
+        last_pk = 0
+        while True:
+            batch = list(qs.filter(pk__gt=last_pk)[:chunk_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            SearchService.index_products(batch)
+            indexed += len(batch)
+        return indexed
+
+    @staticmethod
+    def popularity_boost():
+        """1 + boost × ln(1 + vues + 3 × clics WhatsApp)."""
+        popularity = (
+            Coalesce(F('status__view_count'), 0)
+            + 3 * Coalesce(F('status__whatsapp_click_count'), 0)
+            + 1
+        )
+        return Value(1.0) + Value(SEARCH_POPULARITY_BOOST) * Ln(Cast(popularity, FloatField()))
+
+    @staticmethod
+    def search(queryset, query):
+        """
+        Filtre le queryset sur les produits contenant tous les termes de la requête.
+
+        Annote search_rank (pertinence × popularité) et trie par rang décroissant.
+        """
+        from ..models import ProductSearchToken
+
+        tokens = list(dict.fromkeys(
+            token[:MAX_TOKEN_LENGTH] for token in tokenize(query)
+        ))
+        if not tokens:
+            return queryset.none()
+
+        if SearchService.uses_postgres():
+            from django.contrib.postgres.search import SearchQuery, SearchRank
+
+            search_query = SearchQuery(' '.join(tokens), config='simple')
+            queryset = queryset.filter(search_vector=search_query).annotate(
+                search_relevance=SearchRank(F('search_vector'), search_query)
+            )
+        else:
+            matches = ProductSearchToken.objects.filter(token__in=tokens).order_by()
+            matching_ids = matches.values('product').annotate(
+                matched=Count('pk')
+            ).filter(matched=len(tokens)).values('product')
+            scores = matches.filter(product=OuterRef('pk')).values('product').annotate(
+                score=Sum('weight')
+            ).values('score')
+            queryset = queryset.filter(pk__in=matching_ids).annotate(
+                search_relevance=Cast(Subquery(scores), FloatField())
+            )
+
+        return queryset.annotate(
+            search_rank=F('search_relevance') * SearchService.popularity_boost()
+        ).order_by('-search_rank', '-id')
@@ -0,0 +1,81 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from ..caching import get_model_generations, single_flight, store
+from ..constants import CATALOG_CACHE_TIMEOUT, SHELF_DEBOUNCE_SECONDS, SHELF_FRESH_SECONDS, SHELF_MAX_SIZE
+
+SHELF_KEY = 'showcase:shelf:{}'
+SHELVES_PENDING_KEY = 'showcase:shelves:pending'
+
+# Définition de chaque rayon : filtre et ordre appliqués à un queryset de produits
+SHELVES = {
+    'featured': lambda products: products.filter(status__is_featured=True).order_by(
+        '-status__featured_score', '-created_at'
+    ),
+    'recommended': lambda products: products.filter(status__is_recommended=True).order_by('-created_at'),
+    'new_arrivals': lambda products: products.new_arrivals().order_by('-created_at'),
+    'trending': lambda products: products.trending(),
+    'best_sellers': lambda products: products.best_sellers(),
+}
+
+
+def shelf_models():
+    from ..models import Product, ProductStatus
+    return (Product, ProductStatus)
+
+
+class ShelfService:
+    """
+    Rayons de la page d'accueil précalculés sous forme de listes d'identifiants.
+
+    Chaque rayon (SHELVES) est une liste ordonnée d'au plus SHELF_MAX_SIZE
+    identifiants de produits actifs, gardée en cache sous la génération des
+    produits et de leurs statuts. Elle est réécrite après chaque passe de
+    scores et chaque modification du catalogue (tâche différée), et recalculée
+    par une seule requête à la fois si elle est absente ou périmée. Une page
+    de rayon coûte alors une lecture de produits par identifiants, quelle que
+    soit la taille du catalogue.
+    """
+
+    @staticmethod
+    def compute(name):
+        from ..models import Product
+
+        products = SHELVES[name](Product.objects.filter(is_active=True))
+        return list(products.prefetch_related(None).values_list('pk', flat=True)[:SHELF_MAX_SIZE])
+
+    @staticmethod
+    def get_ids(name):
+        ids, _ = single_flight(
+            SHELF_KEY.format(name),
+            lambda: ShelfService.compute(name),
+            version=get_model_generations(shelf_models()),
+            max_age=SHELF_FRESH_SECONDS,
+            timeout=CATALOG_CACHE_TIMEOUT,
+        )
+        return ids
+
+    @staticmethod
+    def materialize(names=None):
+        """Recalcule et écrit les rayons donnés (tous par défaut). Retourne le nombre de rayons."""
+        names = list(names or SHELVES)
+        version = get_model_generations(shelf_models())
+        for name in names:
+            store(SHELF_KEY.format(name), ShelfService.compute(name), version, CATALOG_CACHE_TIMEOUT)
+        return len(names)
+
+    @staticmethod
+    def schedule_materialize():
+        """Planifie materialize() après le commit courant, une fois par fenêtre de SHELF_DEBOUNCE_SECONDS."""
+        from ..tasks import materialize_shelves
+
+        if cache.add(SHELVES_PENDING_KEY, True, timeout=SHELF_DEBOUNCE_SECONDS):
+            transaction.on_commit(
+                lambda: materialize_shelves.apply_async(countdown=SHELF_DEBOUNCE_SECONDS)
+            )
+
+    @staticmethod
+    def fetch(ids, queryset):
+        """Produits du queryset dont l'identifiant figure dans `ids`, dans l'ordre de `ids`."""
+        products = queryset.in_bulk(ids)
+        return [products[pk] for pk in ids if pk in products]
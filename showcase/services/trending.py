@@ -0,0 +1,73 @@
+import math
+import time
+
+from ..constants import TRENDING_EPOCH, TRENDING_HALF_LIFE_HOURS, TRENDING_MIN_SCORE, TRENDING_WEIGHTS
+
+DECAY_RATE = math.log(2) / (TRENDING_HALF_LIFE_HOURS * 3600)  # par seconde
+
+
+class TrendingService:
+    """
+    Score de tendance à décroissance exponentielle (« forward decay »).
+
+    Un événement de poids w survenu à l'instant t vaut w·e^(-λ(now - t)).
+    Plutôt que de faire décroître tous les scores à chaque instant, on stocke
+    ln(Σ w·e^(λ(t - origine))) : tous les produits décroissent du même
+    facteur, l'ordre des valeurs stockées est donc celui des scores courants.
+    Le flush des compteurs met à jour le score des seuls produits touchés et
+    la lecture des tendances suit l'index de ProductStatus.trending_score.
+    """
+
+    @staticmethod
+    def log_weight(views=0, clicks=0, at=None):
+        """Valeur stockée (logarithmique) d'un lot de vues et de clics survenus à `at`."""
+        weight = views * TRENDING_WEIGHTS['views'] + clicks * TRENDING_WEIGHTS['whatsapp_clicks']
+        if weight <= 0:
+            return None
+        at = time.time() if at is None else at
+        return math.log(weight) + DECAY_RATE * (at - TRENDING_EPOCH)
+
+    @staticmethod
+    def combine(stored, log_weight):
+        """Ajoute un lot à une valeur stockée (log(e^a + e^b) sans dépassement)."""
+        if stored is None:
+            return log_weight
+        if log_weight is None:
+            return stored
+        high, low = max(stored, log_weight), min(stored, log_weight)
+        return high + math.log1p(math.exp(low - high))
+
+    @staticmethod
+    def current_score(stored, now=None):
+        """Score décroissant courant (vues équivalentes) d'une valeur stockée."""
+        if stored is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return math.exp(stored - DECAY_RATE * (now - TRENDING_EPOCH))
+
+    @staticmethod
+    def threshold(min_score=TRENDING_MIN_SCORE, now=None):
+        """Valeur stockée correspondant à `min_score` à l'instant courant."""
+        now = time.time() if now is None else now
+        return math.log(min_score) + DECAY_RATE * (now - TRENDING_EPOCH)
+
+    @staticmethod
+    def advance(deltas, at=None):
+        """
+        Nouvelles valeurs stockées pour {product_id: (vues, clics)} survenus à `at`.
+
+        Les statuts sont verrouillés jusqu'à la fin de la transaction courante,
+        dans laquelle l'appelant écrit les valeurs retournées.
+        """
+        from ..models import ProductStatus
+
+        if not deltas:
+            return {}
+        # Verrous pris dans l'ordre des clés, comme pour CategoryStats
+        stored = ProductStatus.objects.select_for_update().filter(
+            product_id__in=list(deltas)
+        ).order_by('product_id').values_list('product_id', 'trending_score')
+        return {
+            product_id: TrendingService.combine(score, TrendingService.log_weight(*deltas[product_id], at=at))
+            for product_id, score in stored
+        }
@@ -0,0 +1,70 @@
+import threading
+from collections import OrderedDict
+
+from ..constants import WHATSAPP_LINK_CACHE_SIZE
+from ..utils import WHATSAPP_GREETINGS, build_whatsapp_link, build_whatsapp_message, whatsapp_greeting
+
+_lock = threading.Lock()
+_links = OrderedDict()
+
+
+class WhatsAppLinkService:
+    """
+    Liens WhatsApp des produits, précalculés par processus.
+
+    Pour chaque produit, le lien est construit une fois par salutation
+    (WHATSAPP_GREETINGS) et gardé en mémoire sous une empreinte des champs
+    qui composent le message (nom, marque, prix, prix barré, slug) et des
+    paramètres du site : toute modification de l'un d'eux produit une
+    nouvelle empreinte, donc un nouveau calcul. À la requête, seule la
+    salutation est choisie selon l'heure.
+    """
+
+    @staticmethod
+    def fingerprint(product, settings_obj):
+        return (
+            product.pk, product.name, product.brand, product.price, product.compare_at_price,
+            product.slug, settings_obj.company_name, settings_obj.whatsapp_number,
+        )
+
+    @staticmethod
+    def build_links(product, settings_obj):
+        """{salutation: lien} pour les deux variantes du message."""
+        try:
+            return {
+                salutation: build_whatsapp_link(
+                    settings_obj.whatsapp_number,
+                    build_whatsapp_message(product, settings_obj, salutation),
+                )
+                for salutation in WHATSAPP_GREETINGS
+            }
+        except Exception:
+            fallback = f"https://wa.me/{settings_obj.whatsapp_number}"
+            return dict.fromkeys(WHATSAPP_GREETINGS, fallback)
+
+    @staticmethod
+    def get_links(product, settings_obj):
+        key = WhatsAppLinkService.fingerprint(product, settings_obj)
+        with _lock:
+            links = _links.get(key)
+            if links is not None:
+                _links.move_to_end(key)
+                return links
+
+        links = WhatsAppLinkService.build_links(product, settings_obj)
+        with _lock:
+            _links[key] = links
+            while len(_links) > WHATSAPP_LINK_CACHE_SIZE:
+                _links.popitem(last=False)
+        return links
+
+    @staticmethod
+    def link_for(product, settings_obj):
+        """Lien WhatsApp du produit avec la salutation de l'heure courante."""
+        return WhatsAppLinkService.get_links(product, settings_obj)[whatsapp_greeting()]
+
+    @staticmethod
+    def clear():
+        """Vide la table du processus (changement du domaine du site)."""
+        with _lock:
+            _links.clear()
@@ -1,9 +1,21 @@
 import os
-from django.db.models.signals import pre_delete, post_save
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.db.models.signals import pre_delete, post_save, post_delete, m2m_changed
 from django.dispatch import receiver
-from showcase.models import ProductImage, Category, Product, ProductStatus
+from showcase.caching import bump_model_generation, invalidate_catalog
+from showcase.constants import SEARCH_FIELD_WEIGHTS
+from showcase.models import (
+    ProductImage, Category, Product, ProductStatus, Promotion, PromotionUsage, SiteSettings, SocialLink,
+)
 from showcase.services.scoring_service import ScoringService
-from showcase.tasks import recalculate_product_scores
+from showcase.services.autocomplete import update_autocomplete_index
+from showcase.services.category_stats import CategoryStatsService
+from showcase.services.promotion_index import invalidate_promotion_index
+from showcase.services.repricing_service import RepricingService
+from showcase.services.search_service import SearchService
+from showcase.services.shelves import ShelfService
+from showcase.services.whatsapp_links import WhatsAppLinkService
 
 
 @receiver(pre_delete, sender=ProductImage)
@@ -28,10 +40,115 @@ def create_product_status(sender, instance, created, **kwargs):
         ProductStatus.objects.get_or_create(product=instance)
 
 
+@receiver(post_save, sender=Product)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or set(update_fields) & set(SEARCH_FIELD_WEIGHTS):
+        SearchService.index_products([instance])
+
+
+@receiver(post_save, sender=Product)
+def update_category_stats(sender, instance, created, **kwargs):
+    CategoryStatsService.product_saved(instance, created=created)
+
+
+@receiver(post_delete, sender=Product)
+def remove_category_stats(sender, instance, **kwargs):
+    CategoryStatsService.product_deleted(instance)
+
 
 @receiver(post_save, sender=ProductStatus)
 def update_product_scores(sender, instance, created, **kwargs):
     if not created and not kwargs.get('update_fields'):
-        # Déclenche la tâche Celery asynchrone
-        recalculate_product_scores.delay(instance.id)
+        # Recalcul groupé et différé (voir ScoringService.rescore_dirty)
+        ScoringService.mark_dirty([instance.product_id])
+
+
+@receiver(post_save, sender=Promotion)
+@receiver(post_delete, sender=Promotion)
+@receiver(post_save, sender=PromotionUsage)
+@receiver(post_delete, sender=PromotionUsage)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def refresh_promotion_index(sender, **kwargs):
+    # Après le commit : un autre processus reconstruirait sinon l'index à partir
+    # des lignes encore visibles avant la transaction et le garderait
+    transaction.on_commit(invalidate_promotion_index)
+    RepricingService.schedule_catalog_reprice()
+
+
+@receiver(m2m_changed, sender=Promotion.products.through)
+@receiver(m2m_changed, sender=Promotion.categories.through)
+def refresh_promotion_index_targets(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        transaction.on_commit(invalidate_promotion_index)
+        RepricingService.schedule_catalog_reprice()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def refresh_catalog_caches(sender, **kwargs):
+    transaction.on_commit(invalidate_catalog)
+    ShelfService.schedule_materialize()
+
+
+@receiver(post_save, sender=Product)
+def refresh_autocomplete_product(sender, instance, **kwargs):
+    product_id, name, slug, brand, is_active = (
+        instance.pk, instance.name, instance.slug, instance.brand, instance.is_active
+    )
+    transaction.on_commit(lambda: update_autocomplete_index(
+        lambda index: index.set_product(product_id, name, slug, brand, is_active=is_active)
+    ))
+
+
+@receiver(post_delete, sender=Product)
+def remove_autocomplete_product(sender, instance, **kwargs):
+    product_id = instance.pk
+    transaction.on_commit(lambda: update_autocomplete_index(lambda index: index.remove_product(product_id)))
+
+
+@receiver(post_save, sender=Category)
+def refresh_autocomplete_category(sender, instance, **kwargs):
+    category_id, name, slug = instance.pk, instance.name, instance.slug
+    transaction.on_commit(lambda: update_autocomplete_index(
+        lambda index: index.set_category(category_id, name, slug)
+    ))
+
+
+@receiver(post_delete, sender=Category)
+def remove_autocomplete_category(sender, instance, **kwargs):
+    category_id = instance.pk
+    transaction.on_commit(lambda: update_autocomplete_index(lambda index: index.remove_category(category_id)))
+
+
+@receiver(post_save, sender=SocialLink)
+@receiver(post_delete, sender=SocialLink)
+@receiver(m2m_changed, sender=SiteSettings.social_links.through)
+def invalidate_site_settings(sender, **kwargs):
+    SiteSettings.invalidate_cache()
+
+
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def clear_whatsapp_links(sender, **kwargs):
+    # Comme SITE_CACHE de Django : effacé dans le processus qui modifie le site
+    WhatsAppLinkService.clear()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def refresh_model_generation(sender, **kwargs):
+    if sender._meta.app_label == 'showcase':
+        transaction.on_commit(lambda: bump_model_generation(sender))
+
 
+@receiver(m2m_changed)
+def refresh_m2m_generations(sender, instance, action, model, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        changed = {
+            related for related in (type(instance), model)
+            if related._meta.app_label == 'showcase'
+        }
+        transaction.on_commit(lambda: bump_model_generation(*changed))
@@ -1,31 +1,48 @@
 from celery import shared_task
 from showcase.models import ProductStatus
 from showcase.services.scoring_service import ScoringService
+from showcase.services.repricing_service import RepricingService
+from showcase.services.counter_service import CounterService
+from showcase.services.engagement_history import EngagementHistoryService
+from showcase.services.shelves import ShelfService
 
 @shared_task
 def recalculate_product_scores(product_status_id):
-    try:
-        instance = ProductStatus.objects.get(pk=product_status_id)
-        is_featured, featured_score = ScoringService.calculate_featured_score(instance)
-        is_recommended, recommendation_score = ScoringService.calculate_recommendation_score(instance)
-
-        update_needed = (
-            instance.is_featured != is_featured or
-            instance.featured_score != featured_score or
-            instance.is_recommended != is_recommended or
-            instance.recommendation_score != recommendation_score
-        )
-
-        if update_needed:
-            instance.is_featured = is_featured
-            instance.featured_score = featured_score
-            instance.is_recommended = is_recommended
-            instance.recommendation_score = recommendation_score
-            instance.save(update_fields=[
-                'is_featured',
-                'featured_score',
-                'is_recommended',
-                'recommendation_score'
-            ])
-    except ProductStatus.DoesNotExist:
-        pass
+    # Messages encore en file d'une version précédente : recalcul groupé
+    product_ids = ProductStatus.objects.filter(pk=product_status_id).values_list('product_id', flat=True)
+    ScoringService.mark_dirty(product_ids)
+
+
+@shared_task
+def reprice_products(product_ids=None):
+    return RepricingService.reprice(product_ids)
+
+
+@shared_task
+def reprice_due_promotions():
+    return RepricingService.reprice_due_promotions()
+
+
+@shared_task
+def rescore_catalog(product_ids=None):
+    return ScoringService.rescore_catalog(product_ids)
+
+
+@shared_task
+def flush_engagement_counters():
+    return CounterService.flush()
+
+
+@shared_task
+def rescore_dirty_products():
+    return ScoringService.rescore_dirty()
+
+
+@shared_task
+def prune_engagement_history():
+    return EngagementHistoryService.prune()
+
+
+@shared_task
+def materialize_shelves():
+    return ShelfService.materialize()
@@ -0,0 +1,104 @@
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models import Category, Product
+from ...services.autocomplete import AutocompleteIndex, invalidate_autocomplete_index
+from ..utils import execute_on_commit
+
+
+class AutocompleteIndexTests(TestCase):
+    def setUp(self):
+        self.index = AutocompleteIndex()
+        self.index.set_category(1, 'Écrans', 'ecrans')
+        self.index.set_product(1, 'Écran incurvé 27 pouces', 'ecran', 'Samsung', score=10)
+        self.index.set_product(2, 'Ordinateur portable', 'ordinateur', 'HP', score=50)
+        self.index.set_product(3, 'Imprimante laser', 'imprimante', 'HP', score=5)
+
+    def labels(self, results, kind):
+        return [entry['label'] for entry in results[kind]]
+
+    def test_prefix_match_ignores_accents_and_case(self):
+        results = self.index.suggest('ECR', 5)
+        self.assertEqual(self.labels(results, 'product'), ['Écran incurvé 27 pouces'])
+        self.assertEqual(self.labels(results, 'category'), ['Écrans'])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.labels(self.index.suggest('ecran 27', 5), 'product'), ['Écran incurvé 27 pouces'])
+        self.assertEqual(self.labels(self.index.suggest('ecran laser', 5), 'product'), [])
+
+    def test_typo_falls_back_to_trigrams(self):
+        self.assertEqual(self.labels(self.index.suggest('ordinatuer', 5), 'product'), ['Ordinateur portable'])
+        self.assertEqual(self.labels(self.index.suggest('imprimnte', 5), 'product'), ['Imprimante laser'])
+
+    def test_brands_are_counted_and_ranked_by_popularity(self):
+        results = self.index.suggest('h', 5)
+        self.assertEqual(results['brand'], [{'label': 'HP', 'normalized': 'hp', 'score': 2}])
+
+        self.index.remove_product(2)
+        self.assertEqual(self.index.suggest('hp', 5)['brand'][0]['score'], 1)
+        self.index.set_product(3, 'Imprimante laser', 'imprimante', 'Canon')
+        self.assertEqual(self.index.suggest('hp', 5)['brand'], [])
+        self.assertEqual(self.index.suggest('imprimante', 5)['product'][0]['score'], 5)
+
+    def test_inactive_product_is_removed(self):
+        self.index.set_product(1, 'Écran incurvé 27 pouces', 'ecran', 'Samsung', is_active=False)
+        self.assertEqual(self.labels(self.index.suggest('ecran', 5), 'product'), [])
+        self.assertEqual(self.index.suggest('samsung', 5)['brand'], [])
+
+
+class AutocompleteAPITests(TestCase):
+    def setUp(self):
+        invalidate_autocomplete_index()
+        self.client = APIClient()
+        self.url = reverse('showcase:product-autocomplete')
+        self.category = Category.objects.create(name='Téléphones')
+        self.phone = Product.objects.create(
+            name='Samsung Galaxy A15', brand='Samsung', category=self.category, price=Decimal('95000'),
+        )
+
+    def tearDown(self):
+        invalidate_autocomplete_index()
+
+    def test_suggestions_are_served_from_memory(self):
+        self.client.get(self.url, {'q': 'gal'})
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, {'q': 'gal'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(response.data['products'], [
+            {'id': self.phone.pk, 'name': 'Samsung Galaxy A15', 'slug': self.phone.slug}
+        ])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.client.get(self.url, {'q': 'tel'})
+
+        self.category.name = 'Smartphones'
+        with execute_on_commit(self):
+            self.category.save()
+        self.assertEqual(self.client.get(self.url, {'q': 'tel'}).data['categories'], [])
+        self.assertEqual(self.client.get(self.url, {'q': 'smart'}).data['categories'][0]['name'], 'Smartphones')
+
+        self.phone.is_active = False
+        with execute_on_commit(self):
+            self.phone.save()
+        response = self.client.get(self.url, {'q': 'samsung'})
+        self.assertEqual(response.data['products'], [])
+        self.assertEqual(response.data['brands'], [])
+
+        self.phone.is_active = True
+        with execute_on_commit(self):
+            self.phone.save()
+        self.assertEqual(self.client.get(self.url, {'q': 'samsung'}).data['brands'], [
+            {'name': 'Samsung', 'product_count': 1}
+        ])
+        with execute_on_commit(self):
+            self.phone.delete()
+        self.assertEqual(self.client.get(self.url, {'q': 'samsung'}).data['products'], [])
+
+    def test_invalid_limit(self):
+        response = self.client.get(self.url, {'q': 'sam', 'limit': 'abc'})
+        self.assertEqual(response.status_code, 400)
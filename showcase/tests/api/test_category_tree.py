@@ -0,0 +1,74 @@
+from decimal import Decimal
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models import Category, Product
+from ..utils import execute_on_commit
+
+
+class CategoryTreeAPITests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('showcase:category-tree')
+        with execute_on_commit(self):
+            self.computers = Category.objects.create(name='Informatique')
+            self.laptops = Category.objects.create(name='Portables', parent=self.computers)
+            self.gaming = Category.objects.create(name='Gaming', parent=self.laptops)
+            self.printers = Category.objects.create(name='Imprimantes')
+            for category, name in [
+                (self.laptops, 'ThinkPad'), (self.gaming, 'ROG'), (self.gaming, 'Legion'),
+                (self.printers, 'LaserJet'),
+            ]:
+                Product.objects.create(
+                    name=name, brand='Marque', category=category,
+                    price=Decimal('100000'), stock_quantity=5, description='Description',
+                )
+
+    def test_tree_is_built_from_two_queries_then_cached(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        printers, computers = response.data
+        self.assertEqual(computers['slug'], self.computers.slug)
+        self.assertEqual((computers['product_count'], computers['direct_product_count']), (3, 0))
+        laptops = computers['children'][0]
+        self.assertEqual((laptops['product_count'], laptops['direct_product_count']), (3, 1))
+        self.assertEqual(laptops['children'][0]['product_count'], 2)
+        self.assertEqual(printers['product_count'], 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url).data, response.data)
+
+    def test_product_changes_invalidate_tree(self):
+        self.client.get(self.url)
+        with execute_on_commit(self):
+            Product.objects.create(
+                name='EcoTank', brand='Epson', category=self.printers,
+                price=Decimal('150000'), description='Description',
+            )
+        printers = self.client.get(self.url).data[0]
+        self.assertEqual(printers['product_count'], 2)
+
+    def test_subtree_counts(self):
+        Product.objects.filter(name='Legion').update(is_active=False)
+        Product.objects.filter(name='ROG').update(in_stock=False)
+        counts = Category.objects.compute_subtree_counts()
+        self.assertEqual(
+            counts[self.computers.pk], {'total': 3, 'active': 2, 'available': 1, 'direct': 0}
+        )
+        self.assertEqual(
+            counts[self.gaming.pk], {'total': 2, 'active': 1, 'available': 0, 'direct': 2}
+        )
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_category_list_uses_cached_counts(self):
+        url = reverse('showcase:category-list')
+        self.client.get(url)
+        # Validateurs (ETag) et comptage, page, enfants préchargés : aucune requête par catégorie
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        counts = {row['slug']: row['product_count'] for row in response.data['results']}
+        self.assertEqual(counts[self.computers.slug], 3)
+        self.assertEqual(counts[self.laptops.slug], 3)
@@ -0,0 +1,88 @@
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models import Category, Product, ProductImage, SiteSettings
+from ...services.counter_service import CounterService
+from ..utils import execute_on_commit
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        SiteSettings.load()
+        self.client = APIClient()
+        self.category = Category.objects.create(name='Téléphones')
+        self.product = Product.objects.create(
+            name='Galaxy A15', brand='Samsung', category=self.category, price=Decimal('95000'),
+        )
+        self.list_url = reverse('showcase:product-list')
+        self.detail_url = reverse('showcase:product-detail', args=[self.product.slug])
+
+    def tearDown(self):
+        CounterService.backend().drain()
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_detail_strong_etag_and_not_modified(self):
+        response = self.client.get(self.detail_url)
+        etag = response['ETag']
+        self.assertFalse(etag.startswith('W/'))
+        self.assertIn('Last-Modified', response)
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse(response.content)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_list_weak_etag_changes_with_data(self):
+        etag = self.client.get(self.list_url)['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        self.assertEqual(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertNotEqual(self.client.get(self.list_url, {'brand': 'apple'})['ETag'], etag)
+
+        self.product.name = 'Galaxy A16'
+        self.product.save()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_related_model_change_invalidates_etag(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        with execute_on_commit(self):
+            ProductImage.objects.create(product=self.product, image='products/a15.jpg')
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE='Mon, 01 Jan 2001 00:00:00 GMT'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_not_modified_from_response_cache(self):
+        etag = self.client.get(self.list_url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_authenticated_requests_get_validators(self):
+        user = get_user_model().objects.create_user('admin', password='secret', is_staff=True)
+        self.client.force_authenticate(user)
+        response = self.client.get(self.list_url)
+        self.assertNotIn('X-Cache', response)
+        self.assertEqual(
+            self.client.get(self.list_url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304
+        )
+
+    def test_missing_object_returns_404(self):
+        response = self.client.get(reverse('showcase:product-detail', args=['inconnu']))
+        self.assertEqual(response.status_code, 404)
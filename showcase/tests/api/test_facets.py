@@ -0,0 +1,83 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models import Category, Product
+from ..utils import execute_on_commit
+
+
+class ProductFacetsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('showcase:product-facets')
+        self.computers = Category.objects.create(name='Informatique')
+        self.laptops = Category.objects.create(name='Portables', parent=self.computers)
+        self.printers = Category.objects.create(name='Imprimantes')
+
+        self.create_product('ProBook', 'HP', self.laptops, '450000', compare_at_price='500000')
+        self.create_product('LaserJet', 'HP', self.printers, '8000', stock_quantity=0, in_stock=False)
+        self.create_product('EcoTank', 'Epson', self.printers, '65000')
+        self.create_product('Latitude', 'Dell', self.laptops, '30000', is_active=False)
+
+    def create_product(self, name, brand, category, price, stock_quantity=5, **kwargs):
+        with execute_on_commit(self):
+            return Product.objects.create(
+                name=name, brand=brand, category=category, price=Decimal(price),
+                stock_quantity=stock_quantity, **kwargs
+            )
+
+    def get_facets(self, params=None):
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_counts_for_active_products(self):
+        facets = self.get_facets()
+
+        self.assertEqual(facets['brands'], [{'name': 'HP', 'count': 2}, {'name': 'Epson', 'count': 1}])
+        counts = {entry['name']: entry['count'] for entry in facets['categories']}
+        self.assertEqual(counts, {'Informatique': 1, 'Portables': 1, 'Imprimantes': 2})
+        self.assertEqual(
+            [bucket['count'] for bucket in facets['price_ranges']], [1, 0, 1, 1]
+        )
+        self.assertEqual(facets['stock'], {'in_stock': 2, 'out_of_stock': 1})
+        self.assertEqual(facets['discount'], {'with_discount': 1, 'without_discount': 2})
+
+    def test_facet_ignores_its_own_filter(self):
+        facets = self.get_facets({'brand': 'HP', 'in_stock': 'true'})
+
+        # Les autres marques restent proposées, comptées avec le filtre de stock
+        self.assertEqual(facets['brands'], [{'name': 'Epson', 'count': 1}, {'name': 'HP', 'count': 1}])
+        # Le stock est compté pour HP seulement
+        self.assertEqual(facets['stock'], {'in_stock': 1, 'out_of_stock': 1})
+        counts = {entry['name']: entry['count'] for entry in facets['categories']}
+        self.assertEqual(counts, {'Informatique': 1, 'Portables': 1})
+
+    def test_with_search(self):
+        facets = self.get_facets({'search': 'laserjet'})
+        self.assertEqual(facets['brands'], [{'name': 'HP', 'count': 1}])
+
+    def test_fixed_query_count_and_cache(self):
+        self.get_facets()
+        with CaptureQueriesContext(connection) as context:
+            self.get_facets({'brand': 'HP', 'has_discount': 'false', 'page': '2'})
+        self.assertEqual(len(context.captured_queries), 5)
+
+        # Même jeu de filtres, paramètres dans un autre ordre : servi depuis le cache
+        with CaptureQueriesContext(connection) as context:
+            self.get_facets({'page': '3', 'has_discount': 'false', 'brand': 'HP'})
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_cache_follows_catalog_changes(self):
+        self.assertEqual(self.get_facets()['stock']['in_stock'], 2)
+        self.create_product('Stylus', 'Epson', self.printers, '70000')
+        self.assertEqual(self.get_facets()['stock']['in_stock'], 3)
+
+    def test_invalid_filter(self):
+        response = self.client.get(self.url, {'min_price': 'beaucoup'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ...models import Category, NewsletterSubscriber, Product
+from ..utils import execute_on_commit
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('showcase:product-list')
+        category = Category.objects.create(name='Stockage')
+        created_at = timezone.now() - timedelta(days=1)
+        with execute_on_commit(self):
+            for i in range(7):
+                Product.objects.create(
+                    name=f'SSD {i}', brand='Samsung', category=category,
+                    price=Decimal('50000') if i % 3 else Decimal('90000'),
+                    description='Disque SSD',
+                )
+        # Dates identiques pour vérifier le départage par la clé primaire
+        Product.objects.filter(name__in=['SSD 2', 'SSD 3', 'SSD 4']).update(created_at=created_at)
+
+    def walk(self, params):
+        ids, url, data = [], self.url, dict(params, cursor='', page_size=3)
+        while url:
+            response = self.client.get(url, data)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            ids.extend(row['id'] for row in response.data['results'])
+            url, data = response.data['next'], None
+        return ids
+
+    def test_cursor_walk_matches_ordering(self):
+        expected = list(Product.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(self.walk({}), expected)
+
+    def test_cursor_walk_with_filter_ordering(self):
+        expected = list(Product.objects.order_by('-price', '-id').values_list('id', flat=True))
+        self.assertEqual(self.walk({'ordering': '-price'}), expected)
+        expected = list(Product.objects.order_by('effective_price', 'id').values_list('id', flat=True))
+        self.assertEqual(self.walk({'ordering': 'final_price'}), expected)
+
+    def test_cursor_page_skips_count_query(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url, {'cursor': '', 'page_size': 3})
+        self.assertFalse(any('COUNT(' in query['sql'] for query in context.captured_queries))
+
+    def test_page_number_remains_the_default(self):
+        response = self.client.get(self.url, {'page_size': 3})
+        self.assertEqual(response.data['count'], 7)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'cursor': 'invalide'})
+        self.assertEqual(response.status_code, 404)
+        next_url = self.client.get(self.url, {'cursor': '', 'page_size': 3}).data['next']
+        # Curseur émis pour un autre tri
+        response = self.client.get(f'{next_url}&ordering=price')
+        self.assertEqual(response.status_code, 404)
+
+    def test_subscribers_cursor(self):
+        NewsletterSubscriber.objects.bulk_create([
+            NewsletterSubscriber(email=f'client{i}@example.com', confirmation_token=f't{i}') for i in range(5)
+        ])
+        self.client.force_authenticate(User.objects.create_superuser(username='admin', password='pass'))
+        response = self.client.get(
+            reverse('showcase:newsletter-subscriber-list'), {'cursor': '', 'page_size': 2}
+        )
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNotNone(response.data['next'])
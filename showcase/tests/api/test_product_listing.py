@@ -0,0 +1,58 @@
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models import Category, Product, ProductImage, ProductStatus
+from ..utils import execute_on_commit
+
+
+class ProductListingQueryTests(TestCase):
+    """Le nombre de requêtes des listes ne dépend pas du nombre de produits."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.category = Category.objects.create(name='Téléphones')
+
+    def add_products(self, count):
+        start = Product.objects.count()
+        with execute_on_commit(self):
+            for i in range(start, start + count):
+                product = Product.objects.create(
+                    name=f'Téléphone {i}', brand='Marque', category=self.category,
+                    price=Decimal('100000'), compare_at_price=Decimal('120000'),
+                    stock_quantity=3, description='Description',
+                )
+                ProductImage.objects.bulk_create([
+                    ProductImage(product=product, image=f'products/{i}-a.jpg', order=1),
+                    ProductImage(product=product, image=f'products/{i}-b.jpg', order=0, is_primary=True),
+                ])
+        ProductStatus.objects.update(is_featured=True, is_recommended=True)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response
+
+    def test_listing_query_count_is_independent_of_page_size(self):
+        urls = [
+            reverse('showcase:product-list'),
+            reverse('showcase:product-featured'),
+            reverse('showcase:product-recommended'),
+            reverse('showcase:product-on-sale'),
+            reverse('showcase:category-products', args=[self.category.slug]),
+        ]
+        self.add_products(2)
+        small = {url: self.count_queries(url)[0] for url in urls}
+        self.add_products(8)
+        for url in urls:
+            queries, _ = self.count_queries(url)
+            self.assertEqual(queries, small[url], url)
+
+    def test_main_image_is_the_primary_one(self):
+        self.add_products(1)
+        _, response = self.count_queries(reverse('showcase:product-list'))
+        self.assertTrue(response.data['results'][0]['main_image'].endswith('/products/0-b.jpg'))
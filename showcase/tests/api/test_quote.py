@@ -0,0 +1,65 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models import Category, Product, Promotion
+from ...services.promotion_index import get_promotion_index, invalidate_promotion_index
+from ..utils import execute_on_commit
+
+
+class ProductQuoteAPITests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.category = Category.objects.create(name='Audio')
+        self.products = [
+            Product.objects.create(
+                name=f'Casque {i}',
+                brand='Sony',
+                category=self.category,
+                price=Decimal('10000'),
+                description='Casque sans fil',
+            )
+            for i in range(5)
+        ]
+        with execute_on_commit(self):
+            self.promo = Promotion.objects.create(
+                name='Soldes audio', promotion_type=Promotion.PERCENT, value=Decimal('10')
+            )
+            self.promo.categories.add(self.category)
+        self.url = reverse('showcase:product-quote')
+
+    def tearDown(self):
+        invalidate_promotion_index()
+
+    def test_quote_lines(self):
+        response = self.client.post(self.url, {'lines': [
+            {'slug': self.products[0].slug, 'quantity': 3},
+            {'id': self.products[1].id},
+        ]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        first = response.data['lines'][0]
+        self.assertEqual(first['original_price'], '10000.00')
+        self.assertEqual(first['final_unit_price'], '9000.00')
+        self.assertEqual(first['total'], '27000.00')
+        self.assertEqual(first['promotion']['slug'], self.promo.slug)
+        self.assertEqual(response.data['total'], '36000.00')
+
+    def test_query_count_independent_of_line_count(self):
+        get_promotion_index()
+        with self.assertNumQueries(1):
+            self.client.post(self.url, [{'id': self.products[0].id}], format='json')
+        with self.assertNumQueries(1):
+            self.client.post(
+                self.url, [{'id': product.id, 'quantity': 2} for product in self.products], format='json'
+            )
+
+    def test_unknown_product(self):
+        response = self.client.post(self.url, [{'slug': 'inconnu'}], format='json')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data['missing'], ['inconnu'])
+
+    def test_malformed_body(self):
+        for body in ('abc', 5, {'lines': 5}, {'lines': 'abc'}, []):
+            response = self.client.post(self.url, body, format='json')
+            self.assertEqual(response.status_code, 400, body)
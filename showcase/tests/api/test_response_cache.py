@@ -0,0 +1,96 @@
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from unittest import mock
+
+from ...models import Category, Product, Service, SiteSettings
+from ...response_cache import response_cache_stats
+from ...services.counter_service import CounterService
+from ...services.repricing_service import RepricingService
+from ..utils import execute_on_commit
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        SiteSettings.load()
+        self.client = APIClient()
+        self.category = Category.objects.create(name='Téléphones')
+        self.product = Product.objects.create(
+            name='Galaxy A15', brand='Samsung', category=self.category, price=Decimal('95000'),
+        )
+        self.url = reverse('showcase:product-list')
+
+    def tearDown(self):
+        CounterService.backend().drain()
+
+    def test_hit_after_miss_without_queries(self):
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(response.data['results'][0]['name'], 'Galaxy A15')
+
+    def test_query_params_are_normalized(self):
+        self.client.get(self.url, {'brand': 'samsung', 'in_stock': 'true'})
+        response = self.client.get(f'{self.url}?in_stock=true&brand=samsung')
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(self.client.get(self.url, {'brand': 'apple'})['X-Cache'], 'MISS')
+
+    def test_model_changes_invalidate(self):
+        self.client.get(self.url)
+        self.product.name = 'Galaxy A16'
+        with execute_on_commit(self):
+            self.product.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['name'], 'Galaxy A16')
+
+        # Les écritures groupées sans signal invalident aussi (retarification)
+        Product.objects.update(effective_price=None)
+        RepricingService.reprice()
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+
+    def test_unrelated_model_keeps_entries(self):
+        self.client.get(self.url)
+        Service.objects.create(title='Maintenance', description='Réparations')
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'HIT')
+
+    def test_stale_entry_is_served_while_another_request_revalidates(self):
+        self.client.get(self.url)
+        self.product.name = 'Galaxy A16'
+        with execute_on_commit(self):
+            self.product.save()
+
+        # Une autre requête détient déjà le verrou de recalcul
+        add = cache.add
+        with mock.patch.object(cache, 'add', side_effect=lambda key, *args, **kwargs: (
+            False if key.endswith(':lock') else add(key, *args, **kwargs)
+        )):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'STALE')
+        self.assertEqual(response.data['results'][0]['name'], 'Galaxy A15')
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+
+    def test_authenticated_requests_bypass_cache(self):
+        self.client.get(self.url)
+        user = get_user_model().objects.create_user('staff', password='secret')
+        self.client.force_authenticate(user)
+        response = self.client.get(self.url)
+        self.assertNotIn('X-Cache', response)
+
+    def test_cached_detail_still_counts_views(self):
+        url = reverse('showcase:product-detail', args=[self.product.slug])
+        self.client.get(url)
+        self.assertEqual(self.client.get(url)['X-Cache'], 'HIT')
+        self.assertEqual(CounterService.backend().drain()[self.product.pk][0], 2)
+
+    def test_stats(self):
+        self.client.get(self.url)
+        self.client.get(self.url)
+        stats = response_cache_stats(reset=True)['ProductViewSet']
+        self.assertEqual((stats['hit'], stats['miss'], stats['hit_ratio']), (1, 1, 0.5))
+        self.assertEqual(response_cache_stats()['ProductViewSet']['miss'], 0)
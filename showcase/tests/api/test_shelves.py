@@ -0,0 +1,68 @@
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from unittest import mock
+
+from ...models import Category, Product, ProductStatus
+from ...services.scoring_service import ScoringService
+from ...services.shelves import SHELVES_PENDING_KEY, ShelfService
+from ..utils import execute_on_commit
+
+
+class ShelfTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        category = Category.objects.create(name='Casques')
+        self.headsets = [
+            Product.objects.create(
+                name=f'Casque {i}', brand='JBL', category=category,
+                price=Decimal('30000'), stock_quantity=5, description='Description',
+            )
+            for i in range(4)
+        ]
+        for score, headset in zip((50, 90, 70), self.headsets):
+            ProductStatus.objects.filter(product=headset).update(is_featured=True, featured_score=score)
+
+    def featured_slugs(self, **params):
+        response = self.client.get(reverse('showcase:product-featured'), params)
+        self.assertEqual(response.status_code, 200)
+        return [product['slug'] for product in response.data['results']]
+
+    def test_featured_shelf_keeps_score_order(self):
+        first, second, third, _ = self.headsets
+        self.assertEqual(ShelfService.get_ids('featured'), [second.pk, third.pk, first.pk])
+        self.assertEqual(self.featured_slugs(page_size=2), [second.slug, third.slug])
+
+    def test_materialized_shelf_is_read_without_ranking_query(self):
+        ShelfService.materialize()
+        with self.assertNumQueries(0):
+            ids = ShelfService.get_ids('featured')
+        # Produits de la page par identifiants, puis images
+        with self.assertNumQueries(2):
+            products = ShelfService.fetch(ids, Product.objects.prefetch_related('images'))
+        self.assertEqual(products[0], self.headsets[1])
+
+    def test_catalog_change_refreshes_shelf(self):
+        ShelfService.materialize()
+        first, second, third, _ = self.headsets
+        second.is_active = False
+        with execute_on_commit(self):
+            second.save()
+        self.assertEqual(ShelfService.get_ids('featured'), [third.pk, first.pk])
+
+    def test_staff_reads_live_queryset(self):
+        Product.objects.filter(pk=self.headsets[0].pk).update(is_active=False)
+        staff = get_user_model().objects.create_user('staff', password='secret', is_staff=True)
+        self.client.force_authenticate(staff)
+        self.assertIn(self.headsets[0].slug, self.featured_slugs())
+
+    def test_rescore_schedules_materialization(self):
+        cache.delete(SHELVES_PENDING_KEY)  # posée par les créations du setUp
+        with mock.patch('showcase.tasks.materialize_shelves.apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                ScoringService.rescore_catalog()
+        apply_async.assert_called_once()
@@ -0,0 +1,57 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models import Category, Product, ProductStatus
+from ...services.counter_service import CounterService
+
+
+class TrendingEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        CounterService.backend().drain()
+        self.client = APIClient()
+        category = Category.objects.create(name='Montres')
+        self.watches = [
+            Product.objects.create(
+                name=f'Montre {i}', brand='Casio', category=category,
+                price=Decimal('25000'), stock_quantity=5, description='Description',
+            )
+            for i in range(4)
+        ]
+
+    def trending_slugs(self):
+        response = self.client.get(reverse('showcase:product-trending'))
+        self.assertEqual(response.status_code, 200)
+        return [product['slug'] for product in response.data['results']]
+
+    def test_ranks_by_flushed_activity(self):
+        quiet, popular, clicked, hidden = self.watches
+        quiet.status.increment_view_count()
+        for _ in range(5):
+            popular.status.increment_view_count()
+        for _ in range(3):
+            clicked.status.increment_whatsapp_count()
+        hidden.status.increment_view_count()
+        Product.objects.filter(pk=hidden.pk).update(is_active=False)
+        CounterService.flush()
+
+        self.assertEqual(self.trending_slugs(), [clicked.slug, popular.slug, quiet.slug])
+
+    def test_later_flushes_accumulate(self):
+        first, second = self.watches[:2]
+        for _ in range(2):
+            first.status.increment_view_count()
+        second.status.increment_view_count()
+        CounterService.flush()
+        second.status.increment_view_count()
+        second.status.increment_view_count()
+        CounterService.flush()
+
+        scores = dict(ProductStatus.objects.values_list('product_id', 'trending_score'))
+        self.assertGreater(scores[second.pk], scores[first.pk])
+        self.assertIsNone(scores[self.watches[3].pk])
+        self.assertEqual(self.trending_slugs(), [second.slug, first.slug])
+        self.assertEqual(list(Product.objects.best_sellers()), [second, first])
@@ -0,0 +1,61 @@
+import threading
+import time
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from unittest import mock
+
+from ..caching import single_flight
+
+KEY = 'showcase:test:single-flight'
+
+
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def compute(self, value='valeur', delay=0):
+        def compute():
+            self.calls += 1
+            time.sleep(delay)
+            return value
+        return compute
+
+    def test_miss_then_hit(self):
+        self.assertEqual(single_flight(KEY, self.compute(), version=1), ('valeur', 'miss'))
+        self.assertEqual(single_flight(KEY, self.compute(), version=1), ('valeur', 'hit'))
+        self.assertEqual(self.calls, 1)
+
+    def test_new_version_or_age_recomputes(self):
+        single_flight(KEY, self.compute('v1'), version=1)
+        self.assertEqual(single_flight(KEY, self.compute('v2'), version=2), ('v2', 'miss'))
+        with mock.patch('showcase.caching.time.time', return_value=time.time() + 120):
+            self.assertEqual(single_flight(KEY, self.compute('v3'), version=2, max_age=60), ('v3', 'miss'))
+
+    def test_stale_value_served_while_locked(self):
+        single_flight(KEY, self.compute('v1'), version=1)
+        cache.add(f'{KEY}:lock', True)
+        self.assertEqual(single_flight(KEY, self.compute('v2'), version=2), ('v1', 'stale'))
+        self.assertEqual(self.calls, 1)
+
+    def test_none_is_not_cached(self):
+        single_flight(KEY, self.compute(None))
+        single_flight(KEY, self.compute(None))
+        self.assertEqual(self.calls, 2)
+        self.assertIsNone(cache.get(f'{KEY}:lock'))
+
+    def test_concurrent_misses_compute_once(self):
+        results = []
+        compute = self.compute('arbre', delay=0.2)
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight(KEY, compute, version=1)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual([value for value, _ in results], ['arbre'] * 8)
+        self.assertEqual(sorted(outcome for _, outcome in results), ['hit'] * 7 + ['miss'])
@@ -0,0 +1,108 @@
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase
+from unittest import mock
+
+from ..admin.actions import ProductActions
+from ..models import Category, CategoryStats, Product
+from ..services.category_stats import CategoryStatsService
+from ..services.counter_service import CounterService
+
+FIELDS = ('active_count', 'available_count', 'available_price_sum', 'view_counts')
+
+
+class CategoryStatsTests(TestCase):
+    def setUp(self):
+        CounterService.backend().drain()
+        self.phones = Category.objects.create(name='Téléphones')
+        self.tablets = Category.objects.create(name='Tablettes')
+        self.products = [
+            Product.objects.create(
+                name=f'Téléphone {i}', brand='Tecno', category=self.phones,
+                price=Decimal(price), in_stock=in_stock, description='Description',
+            )
+            for i, (price, in_stock) in enumerate([('85000', True), ('120000', True), ('60000', False)])
+        ]
+
+    def assertMatchesRebuild(self):
+        stored = {stats.pk: stats for stats in CategoryStats.objects.all()}
+        expected = CategoryStatsService.compute()
+        for category_id, stats in expected.items():
+            self.assertEqual(
+                tuple(getattr(stored[category_id], field) for field in FIELDS),
+                tuple(getattr(stats, field) for field in FIELDS),
+            )
+
+    def test_created_products_are_counted(self):
+        stats = CategoryStatsService.get(self.phones.pk)
+        self.assertEqual(stats.active_count, 3)
+        self.assertEqual(stats.available_count, 2)
+        self.assertEqual(stats.mean_price, Decimal('102500'))
+        self.assertEqual(stats.view_counts, [0, 0, 0])
+
+    def test_incremental_updates_match_rebuild(self):
+        CategoryStatsService.rebuild()
+        first, second, third = self.products
+
+        for _ in range(3):
+            first.status.increment_view_count()
+        second.status.increment_view_count()
+        CounterService.flush()
+
+        first.price = Decimal('90000')
+        first.save()
+        second.category = self.tablets
+        second.save()
+        third.in_stock = True
+        third.save()
+        Product.objects.get(pk=first.pk).save()
+        self.assertMatchesRebuild()
+
+        first.is_active = False
+        first.save()
+        third.delete()
+        self.assertMatchesRebuild()
+
+        stats = CategoryStatsService.get(self.tablets.pk)
+        self.assertEqual((stats.active_count, stats.view_counts), (1, [1]))
+        self.assertEqual(CategoryStatsService.get(self.phones.pk).active_count, 0)
+
+    def test_unchanged_save_does_not_query_stats(self):
+        product = Product.objects.get(pk=self.products[0].pk)
+        product.name = 'Téléphone renommé'
+        with self.assertNumQueries(0):
+            CategoryStatsService.product_saved(product)
+
+    def test_stale_row_is_rebuilt(self):
+        CategoryStats.objects.filter(pk=self.phones.pk).update(view_counts=[], active_count=0)
+        product = self.products[0]
+        product.is_active = False
+        product.save()
+
+        stats = CategoryStatsService.get(self.phones.pk)
+        self.assertEqual((stats.active_count, stats.view_counts), (2, [0, 0]))
+
+    def test_views_rank(self):
+        stats = CategoryStats(view_counts=[0, 4, 4, 9])
+        self.assertEqual(stats.count_views_above(4), 1)
+        self.assertEqual(stats.count_views_above(0), 3)
+        self.assertIsNone(stats.mean_price)
+
+    def test_admin_action_on_filtered_queryset(self):
+        """Le queryset de la liste filtre sur is_active : il est vide après l'update."""
+        Product.objects.filter(category=self.phones).update(is_active=False)
+        CategoryStatsService.rebuild()
+
+        with mock.patch('showcase.admin.actions.messages'):
+            ProductActions.activate(None, RequestFactory().get('/'), Product.objects.filter(is_active=False))
+
+        self.assertEqual(CategoryStatsService.get(self.phones.pk).active_count, 3)
+        self.assertMatchesRebuild()
+
+    def test_rebuild_command(self):
+        CategoryStats.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_category_stats', stdout=out)
+        self.assertIn('2 catégorie(s)', out.getvalue())
+        self.assertMatchesRebuild()
@@ -0,0 +1,44 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ..models import Category, Product, ProductStatus
+from ..services.counter_service import CounterService
+
+
+class CounterServiceTests(TestCase):
+    def setUp(self):
+        CounterService.backend().drain()
+        category = Category.objects.create(name='Écrans')
+        self.monitor = Product.objects.create(
+            name='UltraSharp', brand='Dell', category=category,
+            price=Decimal('210000'), description='Écran 27 pouces',
+        )
+        self.other = Product.objects.create(
+            name='ProArt', brand='Asus', category=category,
+            price=Decimal('350000'), description='Écran 32 pouces',
+        )
+
+    def test_flush_applies_buffered_deltas_in_one_update(self):
+        client = APIClient()
+        for _ in range(3):
+            response = client.post(reverse('showcase:product-track-click', args=[self.monitor.slug]))
+            self.assertEqual(response.status_code, 200)
+        self.monitor.status.increment_view_count()
+        self.monitor.status.increment_view_count()
+        self.other.status.increment_view_count()
+
+        # Scores tendance verrouillés + UPDATE groupé des statuts
+        # + report des vues sur CategoryStats (lecture, verrou, mise à jour)
+        # + compartiments du jour dans l'historique (lecture, produits existants,
+        #   insertion à zéro, incrément)
+        with self.assertNumQueries(9):
+            self.assertEqual(CounterService.flush(), 2)
+
+        status = ProductStatus.objects.get(product=self.monitor)
+        self.assertEqual(status.view_count, 2)
+        self.assertEqual(status.whatsapp_click_count, 3)
+        self.assertIsNotNone(status.last_viewed_at)
+        self.assertEqual(ProductStatus.objects.get(product=self.other).view_count, 1)
+        self.assertEqual(CounterService.flush(), 0)
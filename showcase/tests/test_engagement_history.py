@@ -0,0 +1,110 @@
+from datetime import timedelta
+from decimal import Decimal
+from importlib import import_module
+from django.apps import apps
+from django.contrib.admin.sites import site
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from unittest import mock
+
+from ..admin.filters import EngagementFilter
+from ..models import Category, Product, ProductDailyStats, ProductStatus
+from ..services.counter_service import CounterService
+from ..services.engagement_history import EngagementHistoryService
+from ..services.scoring_service import ScoringService
+
+
+class EngagementHistoryTests(TestCase):
+    def setUp(self):
+        CounterService.backend().drain()
+        category = Category.objects.create(name='Imprimantes')
+        self.printer, self.scanner = [
+            Product.objects.create(
+                name=name, brand='Epson', category=category,
+                price=Decimal('95000'), description='Description',
+            )
+            for name in ('EcoTank', 'Perfection')
+        ]
+        self.today = timezone.localdate()
+
+    def test_flushes_accumulate_in_daily_bucket(self):
+        for _ in range(2):
+            self.printer.status.increment_view_count()
+            self.printer.status.increment_whatsapp_count()
+            CounterService.flush()
+
+        bucket = ProductDailyStats.objects.get(product=self.printer)
+        self.assertEqual((bucket.date, bucket.views, bucket.clicks), (self.today, 2, 2))
+
+    def test_concurrent_insert_keeps_both_deltas(self):
+        bulk_create = ProductDailyStats.objects.bulk_create
+
+        def racing_bulk_create(objs, **kwargs):
+            # Un autre processus crée le compartiment entre la lecture et l'insertion
+            ProductDailyStats.objects.create(product=self.printer, date=self.today, views=3)
+            return bulk_create(objs, **kwargs)
+
+        with mock.patch.object(ProductDailyStats.objects, 'bulk_create', racing_bulk_create):
+            EngagementHistoryService.record({self.printer.pk: (2, 1)})
+
+        bucket = ProductDailyStats.objects.get(product=self.printer)
+        self.assertEqual((bucket.views, bucket.clicks), (5, 1))
+
+    def test_totals_cover_window_only(self):
+        ProductDailyStats.objects.bulk_create([
+            ProductDailyStats(product=self.printer, date=self.today, views=5, clicks=1),
+            ProductDailyStats(product=self.printer, date=self.today - timedelta(days=29), views=7),
+            ProductDailyStats(product=self.printer, date=self.today - timedelta(days=30), views=100),
+            ProductDailyStats(product=self.scanner, date=self.today - timedelta(days=3), views=4, clicks=2),
+        ])
+
+        with self.assertNumQueries(1):
+            totals = EngagementHistoryService.totals([self.printer.pk, self.scanner.pk], days=30)
+        self.assertEqual(totals, {self.printer.pk: (12, 1), self.scanner.pk: (4, 2)})
+        self.assertEqual(self.printer.status.get_views_last_n_days(7), 5)
+
+    def test_featured_score_uses_recent_views(self):
+        status = self.printer.status
+        baseline = ScoringService.calculate_featured_score(status)[1]
+        ProductDailyStats.objects.create(product=self.printer, date=self.today - timedelta(days=90), views=500)
+        self.assertEqual(ScoringService.calculate_featured_score(status)[1], baseline)
+
+        ProductDailyStats.objects.create(product=self.printer, date=self.today, views=50)
+        self.assertGreater(ScoringService.calculate_featured_score(status)[1], baseline)
+
+    def test_seeded_history_keeps_featured_products(self):
+        """Un produit vedette avant l'historique journalier le reste après la migration."""
+        ProductStatus.objects.filter(product=self.printer).update(
+            view_count=500, whatsapp_click_count=60,
+            last_viewed_at=timezone.now() - timedelta(days=2), is_featured=True,
+        )
+        Product.objects.filter(pk=self.printer.pk).update(stock_quantity=25)
+
+        import_module('showcase.migrations.0009_seed_product_daily_stats').seed_daily_stats(apps, None)
+        ScoringService.rescore_catalog()
+
+        self.printer.status.refresh_from_db()
+        self.assertTrue(self.printer.status.is_featured)
+        self.assertEqual(self.printer.status.get_engagement_last_n_days(30), (500, 60))
+
+    def test_prune_drops_old_buckets(self):
+        ProductDailyStats.objects.bulk_create([
+            ProductDailyStats(product=self.printer, date=self.today - timedelta(days=days), views=1)
+            for days in (0, 89, 90, 200)
+        ])
+        self.assertEqual(EngagementHistoryService.prune(keep_days=90), 2)
+        self.assertEqual(ProductDailyStats.objects.count(), 2)
+
+    def test_admin_engagement_filter(self):
+        ProductDailyStats.objects.create(product=self.printer, date=self.today, views=90, clicks=15)
+        ProductDailyStats.objects.create(product=self.scanner, date=self.today - timedelta(days=60), views=500)
+        model_admin = site._registry[Product]
+
+        def filtered(value):
+            request = RequestFactory().get('/', {'engagement': value})
+            engagement_filter = EngagementFilter(request, {'engagement': value}, Product, model_admin)
+            return set(engagement_filter.queryset(request, Product.objects.all()))
+
+        self.assertEqual(filtered('high'), {self.printer})
+        self.assertEqual(filtered('none'), {self.scanner})
+        self.assertEqual(filtered('low'), set())
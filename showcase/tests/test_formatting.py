@@ -0,0 +1,53 @@
+from decimal import Decimal
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from unittest import mock
+
+from ..formatting import format_fcfa, format_prices
+from ..models import Category, Product
+from ..utils import format_price
+
+
+class FormatFcfaTests(TestCase):
+    def test_groups_thousands_with_narrow_no_break_space(self):
+        self.assertEqual(format_fcfa(1999), '1\u202f999\u00a0FCFA')
+        self.assertEqual(format_fcfa(Decimal('1250000.00')), '1\u202f250\u202f000\u00a0FCFA')
+        self.assertEqual(format_fcfa(-4500), '-4\u202f500\u00a0FCFA')
+
+    def test_decimals_without_float(self):
+        self.assertEqual(format_fcfa(Decimal('1999.505'), with_decimals=True), '1\u202f999,51\u00a0FCFA')
+        self.assertEqual(format_fcfa(Decimal('0.5')), '1\u00a0FCFA')
+        self.assertEqual(
+            format_fcfa('12345678901234567890.5', with_decimals=True),
+            '12\u202f345\u202f678\u202f901\u202f234\u202f567\u202f890,50\u00a0FCFA',
+        )
+
+    def test_none_and_invalid(self):
+        self.assertEqual(format_fcfa(None), '—')
+        self.assertEqual(format_fcfa(None, display_mode=False), '0\u00a0FCFA')
+        self.assertEqual(format_fcfa('n/a'), 'n/a\u00a0FCFA')
+
+    def test_format_prices(self):
+        self.assertEqual(
+            format_prices([1000, None, Decimal('1000')]),
+            ['1\u202f000\u00a0FCFA', '—', '1\u202f000\u00a0FCFA'],
+        )
+
+    def test_format_price_never_touches_locale(self):
+        with mock.patch('locale.setlocale') as setlocale:
+            self.assertEqual(format_price(Decimal('95000'), use_locale=True), '95\u202f000\u00a0FCFA')
+        setlocale.assert_not_called()
+
+    def test_admin_changelist_formats_page_prices(self):
+        category = Category.objects.create(name='Téléphones')
+        Product.objects.create(
+            name='Galaxy A15', category=category, price=Decimal('95000'), compare_at_price=Decimal('110000'),
+        )
+        request = RequestFactory().get('/admin/showcase/product/')
+        request.user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'secret')
+        model_admin = admin.site._registry[Product]
+
+        product = model_admin.get_changelist_instance(request).result_list[0]
+        self.assertEqual(product.formatted_prices, ('95\u202f000\u00a0FCFA', '110\u202f000\u00a0FCFA'))
+        self.assertIn('110\u202f000\u00a0FCFA', model_admin.formatted_price(product))
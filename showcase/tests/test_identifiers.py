@@ -0,0 +1,44 @@
+from decimal import Decimal
+from django.test import TestCase
+
+from ..models import Category, Product, SkuSequence
+from ..utils import generate_sku, generate_unique_slug
+
+
+class SlugAllocationTests(TestCase):
+    def test_next_free_suffix_in_one_query(self):
+        for name in ('Routeur', 'Routeur', 'Routeur', 'Routeur Pro', 'Routeur 4G 300 Mbps'):
+            Category.objects.create(name=name)
+        Category.objects.filter(slug='routeur-1').update(slug='routeur-7')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(generate_unique_slug(Category, 'Routeur'), 'routeur-8')
+        self.assertEqual(generate_unique_slug(Category, 'Switch'), 'switch')
+
+
+class SkuSequenceTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Informatique')
+
+    def create_product(self, **kwargs):
+        return Product.objects.create(category=self.category, price=Decimal('1000'), **kwargs)
+
+    def test_sequence_is_seeded_from_existing_skus(self):
+        self.create_product(name='Ancien', sku='INF-00041')
+        self.assertEqual(self.create_product(name='Nouveau').sku, 'INF-00042')
+        self.assertEqual(self.create_product(name='Suivant').sku, 'INF-00043')
+        self.assertEqual(SkuSequence.objects.get(prefix='INF').last_value, 43)
+
+    def test_constant_queries(self):
+        generate_sku('informatique', Product)
+        with self.assertNumQueries(3):
+            self.assertEqual(generate_sku('informatique', Product), 'INF-00002')
+
+    def test_manual_sku_resyncs_sequence(self):
+        self.create_product(name='Premier')
+        self.create_product(name='Manuel', sku='INF-00002')
+        self.assertEqual(self.create_product(name='Suivant').sku, 'INF-00003')
+
+    def test_allocate_range(self):
+        self.assertEqual(SkuSequence.allocate('BLK', count=100), 1)
+        self.assertEqual(SkuSequence.allocate('BLK'), 101)
@@ -0,0 +1,93 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Category, Product, Promotion, PromotionUsage
+from ..services.promotion_index import get_promotion_index, invalidate_promotion_index
+from ..services.promotion_service import PromotionService
+from .utils import execute_on_commit
+
+
+class PromotionIndexTests(TestCase):
+    def setUp(self):
+        with execute_on_commit(self):
+            self.parent = Category.objects.create(name='Informatique')
+            self.child = Category.objects.create(name='Portables', parent=self.parent)
+            self.other = Category.objects.create(name='Audio')
+            self.product = Product.objects.create(
+                name='Latitude 5420',
+                brand='Dell',
+                category=self.child,
+                price=Decimal('500000'),
+                description='Portable professionnel',
+            )
+            self.unrelated = Product.objects.create(
+                name='WH-1000XM4',
+                brand='Sony',
+                category=self.other,
+                price=Decimal('185000'),
+                description='Casque',
+            )
+
+            self.category_promo = Promotion.objects.create(
+                name='Rentrée', promotion_type=Promotion.PERCENT, value=Decimal('10')
+            )
+            self.category_promo.categories.add(self.parent)
+
+            self.product_promo = Promotion.objects.create(
+                name='Déstockage', promotion_type=Promotion.AMOUNT, value=Decimal('20000')
+            )
+            self.product_promo.products.add(self.product)
+
+            self.scheduled = Promotion.objects.create(
+                name='Black Friday',
+                promotion_type=Promotion.PERCENT,
+                value=Decimal('30'),
+                applies_to_all=True,
+                start_at=timezone.now() + timedelta(days=3),
+            )
+
+            self.exhausted = Promotion.objects.create(
+                name='Flash', promotion_type=Promotion.PERCENT, value=Decimal('50'),
+                applies_to_all=True, usage_limit=1,
+            )
+            PromotionUsage.objects.create(promotion=self.exhausted, count=1)
+
+    def legacy_applicable(self, product):
+        product = Product.objects.select_related('category').get(pk=product.pk)
+        return [
+            promo for promo in Promotion.objects.filter(active=True)
+            if promo.is_active_now() and promo.applies_to_product(product)
+        ]
+
+    def test_matches_per_promotion_checks(self):
+        for product in (self.product, self.unrelated):
+            self.assertEqual(
+                PromotionService.get_applicable_promotions(product),
+                self.legacy_applicable(product),
+            )
+
+    def test_resolution_runs_without_queries(self):
+        get_promotion_index()
+        with self.assertNumQueries(0):
+            promotions = PromotionService.get_applicable_promotions(self.product)
+            PromotionService.calculate_price_with_promotions(self.product, quantity=2)
+        self.assertEqual(set(promotions), {self.category_promo, self.product_promo})
+
+    def test_scheduled_promotion_starts_without_rebuild(self):
+        index = get_promotion_index()
+        later = timezone.now() + timedelta(days=4)
+        self.assertIn(self.scheduled, index.for_product(self.unrelated, now=later))
+
+    def test_index_rebuilt_when_targets_change(self):
+        self.assertEqual(PromotionService.get_applicable_promotions(self.unrelated), [])
+        with execute_on_commit(self):
+            self.category_promo.categories.add(self.other)
+        self.assertEqual(
+            PromotionService.get_applicable_promotions(self.unrelated),
+            [self.category_promo],
+        )
+
+    def tearDown(self):
+        invalidate_promotion_index()
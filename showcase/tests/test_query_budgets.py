@@ -0,0 +1,33 @@
+from django.test import TestCase
+
+from ..benchmark import ENDPOINTS, run_benchmark, seed_catalog
+from ..services.counter_service import CounterService
+from ..services.promotion_index import invalidate_promotion_index
+
+
+class QueryBudgetTests(TestCase):
+    """Chaque endpoint respecte son budget de requêtes SQL, quelle que soit la taille de page."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.catalog = seed_catalog(categories=30, products=150, promotions=6, subscribers=60)
+
+    def tearDown(self):
+        CounterService.backend().drain()
+        invalidate_promotion_index()
+
+    def test_endpoints_stay_within_query_budget(self):
+        rows = run_benchmark(self.catalog, page_sizes=(5, 50))
+        self.assertEqual({row['endpoint'] for row in rows}, set(ENDPOINTS))
+
+        queries_by_endpoint = {}
+        for row in rows:
+            endpoint = row['endpoint']
+            with self.subTest(endpoint=endpoint.name, page_size=row['page_size']):
+                self.assertEqual(row['status'], 200)
+                self.assertLessEqual(row['queries'], endpoint.max_queries)
+            queries_by_endpoint.setdefault(endpoint.name, set()).add(row['queries'])
+
+        for name, counts in queries_by_endpoint.items():
+            with self.subTest(endpoint=name):
+                self.assertEqual(len(counts), 1, f'{name}: {sorted(counts)}')
@@ -0,0 +1,50 @@
+from decimal import Decimal
+from django.test import TestCase
+
+from ..api_filters import ProductFilter
+from ..models import Category, Product, Promotion
+from ..services.promotion_index import invalidate_promotion_index
+from ..services.repricing_service import RepricingService
+from .utils import execute_on_commit
+
+
+class RepricingTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Imprimantes')
+        self.cheap = Product.objects.create(
+            name='LaserJet', brand='HP', category=self.category,
+            price=Decimal('80000'), description='Imprimante laser',
+        )
+        self.expensive = Product.objects.create(
+            name='EcoTank', brand='Epson', category=self.category,
+            price=Decimal('150000'), description='Imprimante jet d\'encre',
+        )
+
+    def tearDown(self):
+        invalidate_promotion_index()
+
+    def test_save_sets_effective_price(self):
+        self.assertEqual(self.cheap.effective_price, Decimal('80000'))
+        self.assertIsNone(self.cheap.best_promotion_id)
+
+    def test_reprice_applies_promotions(self):
+        with execute_on_commit(self):
+            promo = Promotion.objects.create(
+                name='Promo impression', promotion_type=Promotion.PERCENT, value=Decimal('50')
+            )
+            promo.products.add(self.expensive)
+
+        self.assertEqual(RepricingService.reprice(), 1)
+        self.expensive.refresh_from_db()
+        self.assertEqual(self.expensive.effective_price, Decimal('75000.00'))
+        self.assertEqual(self.expensive.best_promotion_id, promo.pk)
+        self.assertEqual(self.expensive.effective_discount_percent, 50)
+        self.assertEqual(RepricingService.reprice(), 0)
+
+        qs = Product.objects.all()
+        on_sale = ProductFilter({'on_sale': 'true'}, queryset=qs).qs
+        self.assertEqual(list(on_sale), [self.expensive])
+        by_final_price = ProductFilter({'ordering': 'final_price'}, queryset=qs).qs
+        self.assertEqual(list(by_final_price), [self.expensive, self.cheap])
+        under_budget = ProductFilter({'max_price': '78000'}, queryset=qs).qs
+        self.assertEqual(list(under_budget), [self.expensive])
@@ -0,0 +1,103 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from unittest import mock
+
+from ..admin.actions import ProductActions
+from ..models import Category, Product, ProductStatus
+from ..services.category_stats import CategoryStatsService
+from ..services.scoring_service import ScoringService
+
+
+class RescoreCatalogTests(TestCase):
+    def setUp(self):
+        laptops = Category.objects.create(name='Portables')
+        printers = Category.objects.create(name='Imprimantes')
+        specs = [
+            (laptops, '450000', '300000', 25, 120, 40, True),
+            (laptops, '520000', None, 12, 15, 2, True),
+            (laptops, '300000', '280000', 0, 0, 0, True),
+            (laptops, '610000', None, 3, 15, 9, False),
+            (printers, '80000', '40000', 30, 400, 60, True),
+            (printers, '150000', None, 5, 2, 0, True),
+        ]
+        for i, (category, price, cost, stock, views, clicks, active) in enumerate(specs):
+            product = Product.objects.create(
+                name=f'Produit {i}', brand='Marque', category=category,
+                price=Decimal(price), cost_price=Decimal(cost) if cost else None,
+                compare_at_price=Decimal(price) * 2 if i % 2 else None,
+                stock_quantity=stock, in_stock=stock > 0, is_active=active,
+                description='Description',
+            )
+            ProductStatus.objects.filter(product=product).update(
+                view_count=views,
+                whatsapp_click_count=clicks,
+                last_viewed_at=timezone.now() - timedelta(days=i * 5) if views else None,
+            )
+        # Vues écrites directement en base, hors flush des compteurs
+        CategoryStatsService.rebuild()
+
+    def test_matches_per_product_scores(self):
+        expected = {}
+        for status in ProductStatus.objects.select_related('product'):
+            expected[status.pk] = (
+                ScoringService.calculate_featured_score(status),
+                ScoringService.calculate_recommendation_score(status),
+            )
+
+        ScoringService.rescore_catalog()
+
+        for status in ProductStatus.objects.all():
+            (is_featured, featured), (is_recommended, recommendation) = expected[status.pk]
+            self.assertEqual(status.is_featured, is_featured)
+            self.assertAlmostEqual(status.featured_score, float(featured))
+            self.assertEqual(status.is_recommended, is_recommended)
+            self.assertAlmostEqual(status.recommendation_score, float(recommendation))
+
+    def test_rescore_is_idempotent(self):
+        ScoringService.rescore_catalog()
+        self.assertEqual(ScoringService.rescore_catalog(), 0)
+
+
+class DirtyRescoreTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        category = Category.objects.create(name='Portables')
+        self.products = [
+            Product.objects.create(
+                name=f'Portable {i}', category=category, price=Decimal('450000'),
+                stock_quantity=10, description='Description',
+            )
+            for i in range(3)
+        ]
+
+    def test_full_saves_collapse_into_one_scheduled_task(self):
+        with mock.patch('showcase.tasks.rescore_dirty_products.apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                for product in self.products:
+                    status = ProductStatus.objects.get(product=product)
+                    status.view_count = 500
+                    status.save()
+                    status.save()
+        apply_async.assert_called_once()
+        self.assertEqual(ProductStatus.objects.filter(scores_dirty=True).count(), 3)
+
+    def test_rescore_dirty_in_batches(self):
+        ProductStatus.objects.update(view_count=500, whatsapp_click_count=100)
+        ScoringService.mark_dirty([product.pk for product in self.products[:2]])
+
+        self.assertEqual(ScoringService.rescore_dirty(batch_size=1), 2)
+        self.assertFalse(ProductStatus.objects.filter(scores_dirty=True).exists())
+        scores = dict(ProductStatus.objects.values_list('product_id', 'featured_score'))
+        self.assertGreater(scores[self.products[0].pk], scores[self.products[2].pk])
+        self.assertEqual(ScoringService.rescore_dirty(), 0)
+
+    def test_admin_action_marks_filtered_selection_dirty(self):
+        ProductStatus.objects.update(scores_dirty=False)
+        with mock.patch('showcase.admin.actions.messages'), \
+                mock.patch.object(ScoringService, 'schedule_rescore'):
+            ProductActions.mark_out_of_stock(None, RequestFactory().get('/'), Product.objects.filter(in_stock=True))
+
+        self.assertEqual(ProductStatus.objects.filter(scores_dirty=True).count(), 3)
@@ -0,0 +1,90 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ..models import Category, Product, ProductSearchToken, ProductStatus
+from ..services.search_service import SearchService
+from ..utils import tokenize
+
+
+class TokenizeTests(TestCase):
+    def test_folds_accents_case_plurals_and_stopwords(self):
+        self.assertEqual(
+            tokenize('Écrans incurvés pour les Jeux de Bureau'),
+            ['ecran', 'incurve', 'jeu', 'bureau'],
+        )
+
+    def test_keeps_digits(self):
+        self.assertEqual(tokenize('Disque 2 To'), ['disque', '2', 'to'])
+
+
+class ProductSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.category = Category.objects.create(name='Informatique')
+        self.monitor = self.create_product(
+            name='Écran incurvé 27 pouces', brand='Samsung', sku='SAM-C27F390',
+            description='Moniteur de bureau',
+        )
+        self.laptop = self.create_product(
+            name='Ordinateur portable', brand='HP', sku='HP-15S',
+            description='Livré avec un écran Full HD',
+        )
+        self.printer = self.create_product(
+            name='Imprimante laser', brand='HP', sku='HP-M110',
+            description='Impression rapide',
+        )
+
+    def create_product(self, **kwargs):
+        return Product.objects.create(category=self.category, price=Decimal('100000'), **kwargs)
+
+    def search(self, query):
+        return list(SearchService.search(Product.objects.all(), query))
+
+    def test_index_is_kept_in_sync_on_save(self):
+        self.assertTrue(ProductSearchToken.objects.filter(product=self.monitor, token='ecran').exists())
+
+        self.monitor.name = 'Moniteur courbe'
+        self.monitor.save()
+        tokens = set(self.monitor.search_tokens.values_list('token', flat=True))
+        self.assertIn('courbe', tokens)
+        self.assertNotIn('incurve', tokens)
+
+    def test_accent_and_plural_insensitive(self):
+        self.assertEqual(self.search('ECRANS INCURVES'), [self.monitor])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.search('hp laser'), [self.printer])
+        self.assertEqual(self.search('samsung laser'), [])
+
+    def test_sku_matches_with_or_without_separators(self):
+        self.assertEqual(self.search('c27f390'), [self.monitor])
+        self.assertEqual(self.search('hpm110'), [self.printer])
+
+    def test_name_ranks_above_description(self):
+        self.assertEqual(self.search('écran'), [self.monitor, self.laptop])
+
+    def test_popularity_boosts_rank(self):
+        self.assertEqual(self.search('hp'), [self.printer, self.laptop])
+
+        ProductStatus.objects.filter(product=self.laptop).update(view_count=500, whatsapp_click_count=50)
+        self.assertEqual(self.search('hp'), [self.laptop, self.printer])
+
+    def test_stopwords_only_query_returns_nothing(self):
+        self.assertEqual(self.search('de la'), [])
+
+    def test_rebuild_index(self):
+        ProductSearchToken.objects.all().delete()
+        self.assertEqual(SearchService.rebuild_index(), 3)
+        self.assertEqual(self.search('imprimante'), [self.printer])
+
+    def test_api_search_with_cursor_pagination(self):
+        url = reverse('showcase:product-list')
+        response = self.client.get(url, {'search': 'hp', 'page_size': 1, 'cursor': ''})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in response.data['results']], [self.printer.pk])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual([item['id'] for item in response.data['results']], [self.laptop.pk])
+        self.assertIsNone(response.data['next'])
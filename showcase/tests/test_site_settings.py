@@ -0,0 +1,45 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import TestCase
+
+from ..models import Category, Product, SiteSettings, SocialLink
+
+
+class SiteSettingsCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        SiteSettings.invalidate_cache()
+
+    def test_load_is_served_from_process_copy(self):
+        SiteSettings.load()
+        with self.assertNumQueries(0):
+            settings = SiteSettings.load()
+            list(settings.social_links.all())
+        self.assertEqual(settings.pk, 1)
+
+    def test_save_invalidates(self):
+        settings = SiteSettings.load()
+        settings.whatsapp_number = '22990000000'
+        settings.save()
+        self.assertEqual(SiteSettings.load().whatsapp_number, '22990000000')
+
+    def test_social_links_changes_invalidate(self):
+        settings = SiteSettings.load()
+        link = SocialLink.objects.create(name='facebook', url='https://facebook.com/niasotac')
+        settings.social_links.add(link)
+        self.assertEqual(list(SiteSettings.load().social_links.all()), [link])
+
+        link.url = 'https://facebook.com/niasotac.bj'
+        link.save()
+        self.assertEqual(SiteSettings.load().social_links.get().url, 'https://facebook.com/niasotac.bj')
+
+    def test_whatsapp_links_do_not_query_settings(self):
+        SiteSettings.load()
+        category = Category.objects.create(name='Téléphones')
+        products = [
+            Product.objects.create(name=f'Téléphone {i}', category=category, price=Decimal('50000'))
+            for i in range(5)
+        ]
+        with self.assertNumQueries(0):
+            links = [product.whatsapp_link for product in products]
+        self.assertTrue(all(link.startswith('https://wa.me/229XXXXXXXXX') for link in links))
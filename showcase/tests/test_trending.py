@@ -0,0 +1,31 @@
+import math
+import time
+from django.test import SimpleTestCase
+
+from ..services.trending import TrendingService
+
+HOUR = 3600
+
+
+class TrendingScoreTests(SimpleTestCase):
+    def test_score_halves_every_half_life(self):
+        now = time.time()
+        stored = TrendingService.log_weight(views=8, at=now)
+        self.assertAlmostEqual(TrendingService.current_score(stored, now=now), 8)
+        self.assertAlmostEqual(TrendingService.current_score(stored, now=now + 24 * HOUR), 4)
+
+    def test_combine_adds_decayed_weights(self):
+        now = time.time()
+        stored = TrendingService.log_weight(views=10, at=now - 48 * HOUR)
+        stored = TrendingService.combine(stored, TrendingService.log_weight(clicks=1, at=now))
+        self.assertAlmostEqual(TrendingService.current_score(stored, now=now), 10 / 4 + 3)
+        self.assertEqual(TrendingService.combine(None, stored), stored)
+        self.assertIsNone(TrendingService.log_weight())
+
+    def test_recent_activity_outranks_older_volume(self):
+        now = time.time()
+        old_hit = TrendingService.log_weight(views=500, at=now - 30 * 24 * HOUR)
+        today = TrendingService.log_weight(views=20, at=now)
+        self.assertGreater(today, old_hit)
+        self.assertLess(old_hit, TrendingService.threshold(now=now))
+        self.assertTrue(math.isfinite(TrendingService.log_weight(views=1, at=now + 10 * 365 * 24 * HOUR)))
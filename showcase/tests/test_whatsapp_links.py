@@ -0,0 +1,47 @@
+from decimal import Decimal
+from django.core.cache import cache
+from django.test import TestCase
+from unittest import mock
+
+from ..models import Category, Product, SiteSettings
+from ..services.whatsapp_links import WhatsAppLinkService
+from ..utils import build_whatsapp_message
+
+
+class WhatsAppLinkTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        SiteSettings.invalidate_cache()
+        WhatsAppLinkService.clear()
+        self.category = Category.objects.create(name='Téléphones')
+        self.product = Product.objects.create(
+            name='Galaxy A15', brand='Samsung', category=self.category, price=Decimal('95000'),
+        )
+
+    def test_links_are_built_once_per_product(self):
+        with mock.patch(
+            'showcase.services.whatsapp_links.build_whatsapp_message', wraps=build_whatsapp_message
+        ) as build:
+            first = self.product.whatsapp_link
+            self.assertEqual(self.product.whatsapp_link, first)
+        # Une construction par salutation, au premier appel seulement
+        self.assertEqual(build.call_count, 2)
+        self.assertIn('Galaxy%20A15', first)
+
+    def test_greeting_is_chosen_at_request_time(self):
+        with mock.patch('showcase.services.whatsapp_links.whatsapp_greeting', return_value='Bonjour'):
+            self.assertIn('Bonjour', self.product.whatsapp_link)
+        with mock.patch('showcase.services.whatsapp_links.whatsapp_greeting', return_value='Bonsoir'):
+            self.assertIn('Bonsoir', self.product.whatsapp_link)
+
+    def test_product_and_settings_changes_refresh_link(self):
+        link = self.product.whatsapp_link
+        self.product.price = Decimal('89000')
+        self.product.save()
+        self.assertNotEqual(self.product.whatsapp_link, link)
+        self.assertIn('89%E2%80%AF000', self.product.whatsapp_link)
+
+        settings = SiteSettings.load()
+        settings.whatsapp_number = '22990000000'
+        settings.save()
+        self.assertTrue(self.product.whatsapp_link.startswith('https://wa.me/22990000000?'))
@@ -2,8 +2,10 @@
 Utilitaires pour les tests de showcase
 """
 import tempfile
+from contextlib import contextmanager
 from PIL import Image
 from django.core.files.uploadedfile import SimpleUploadedFile
+from unittest import mock
 
 
 def generate_image_file(filename='test.jpg', size=(100, 100), format='JPEG'):
@@ -17,3 +19,15 @@ def generate_image_file(filename='test.jpg', size=(100, 100), format='JPEG'):
         tmp_file.read(),
         content_type=f'image/{format.lower()}'
     )
+
+
+@contextmanager
+def execute_on_commit(test_case):
+    """
+    Exécute les callbacks transaction.on_commit du bloc (invalidations de caches).
+
+    Un TestCase ne valide jamais sa transaction ; les tâches Celery planifiées
+    au passage ne sont pas envoyées.
+    """
+    with mock.patch('celery.app.task.Task.apply_async'), test_case.captureOnCommitCallbacks(execute=True):
+        yield
@@ -1,83 +1,81 @@
+import re
+import unicodedata
 import urllib.parse
 from datetime import datetime
 from decimal import Decimal
-import locale
 import pytz
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.utils.text import slugify
 
+from .constants import SEARCH_MIN_TOKEN_LENGTH, SEARCH_STOPWORDS
+from .formatting import format_fcfa
+
 
 def format_price(price, with_decimals=False, display_mode=True, use_locale=False):
     """
-    Formate un prix en FCFA avec gestion des cas None et gratuité.
+    Formate un prix en FCFA avec gestion des cas None et gratuité (voir formatting.format_fcfa).
 
-    :param price: Decimal, float ou int représentant le prix
-    :param with_decimals: bool, True pour afficher 2 décimales
-    :param display_mode: bool, True pour affichage utilisateur ("—" si None),
-                         False pour logique interne ("0 FCFA" si None)
-    :param use_locale: bool, True pour utiliser la locale française si disponible
+    :param use_locale: ignoré, conservé pour compatibilité ; la locale n'est plus utilisée
     :return: str formaté, ex: "1 999 FCFA" ou "1 999,50 FCFA"
     """
-    # Gestion du cas None
-    if price is None:
-        return "—" if display_mode else "0 FCFA"
-
-    try:
-        if use_locale:
-            try:
-                locale.setlocale(locale.LC_ALL, 'fr_FR.UTF-8')
-            except locale.Error:
-                use_locale = False
-
-        if with_decimals:
-            if use_locale:
-                formatted = locale.format_string('%.2f', float(price), grouping=True)
-            else:
-                formatted = f"{float(price):,.2f}".replace(',', ' ')
-        else:
-            if use_locale:
-                formatted = locale.format_string('%d', int(round(price)), grouping=True)
-            else:
-                formatted = f"{int(round(price)):,}".replace(',', ' ')
-        
-        return f"{formatted} FCFA"
-    except Exception:
-        return str(price) + " FCFA"
+    return format_fcfa(price, with_decimals, display_mode)
 
 def generate_unique_slug(model_class, base_text, max_length=180, slug_field='slug'):
+    """
+    Slug libre dérivé de base_text, en une requête.
+
+    Seuls les slugs existants égaux à la base ou de la forme « base-N » sont
+    lus ; le suffixe retenu suit le plus grand N déjà pris.
+    """
     base_slug = slugify(base_text)[:max_length-10]
-    slug = base_slug
-    counter = 1
+    prefix = f"{base_slug}-"
+    taken = model_class.objects.filter(
+        **{f"{slug_field}__regex": rf"^{re.escape(base_slug)}(-[0-9]+)?$"}
+    ).values_list(slug_field, flat=True)
+
+    base_taken = False
+    last_suffix = 0
+    for slug in taken:
+        if slug == base_slug:
+            base_taken = True
+        else:
+            last_suffix = max(last_suffix, int(slug[len(prefix):]))
 
-    while model_class.objects.filter(**{slug_field: slug}).exists():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
+    if not base_taken:
+        return base_slug
+    return f"{prefix}{last_suffix + 1}"
 
-    return slug
+def sku_prefix(category_slug, prefix_length=3):
+    return category_slug[:prefix_length].upper() if category_slug else "PRD"
 
 def generate_sku(category_slug, model_class, prefix_length=3):
-    prefix = category_slug[:prefix_length].upper() if category_slug else "PRD"
+    """
+    SKU « PRÉFIXE-00042 » tiré de la séquence du préfixe (SkuSequence).
+
+    Si le numéro attribué a déjà été saisi à la main, la séquence est recalée
+    sur le plus grand SKU existant du préfixe.
+    """
+    from .models import SkuSequence
+
+    prefix = sku_prefix(category_slug, prefix_length)
+    sku = f"{prefix}-{SkuSequence.allocate(prefix):05d}"
+    if model_class.objects.filter(sku=sku).exists():
+        SkuSequence.resync(prefix)
+        sku = f"{prefix}-{SkuSequence.allocate(prefix):05d}"
+    return sku
+
+BENIN_TZ = pytz.timezone("Africa/Porto-Novo")
+WHATSAPP_GREETINGS = ("Bonjour", "Bonsoir")
 
-    last_product = model_class.objects.filter(
-        sku__startswith=prefix
-    ).order_by('-sku').first()
 
-    if last_product and last_product.sku:
-        try:
-            last_num = int(last_product.sku.split('-')[-1])
-            new_num = last_num + 1
-        except (ValueError, IndexError):
-            new_num = 1
-    else:
-        new_num = 1
+def whatsapp_greeting():
+    """Salutation du message WhatsApp selon l'heure du Bénin."""
+    return WHATSAPP_GREETINGS[datetime.now(BENIN_TZ).hour >= 12]
 
-    return f"{prefix}-{new_num:05d}"
 
-def build_whatsapp_message(product, settings_obj):
-    benin_tz = pytz.timezone("Africa/Porto-Novo")
-    current_hour = datetime.now(benin_tz).hour
-    salutation = "Bonsoir" if current_hour >= 12 else "Bonjour"
+def build_whatsapp_message(product, settings_obj, salutation=None):
+    salutation = salutation or whatsapp_greeting()
 
     message_parts = [
         f"{salutation} {settings_obj.company_name},",
@@ -125,3 +123,33 @@ def build_absolute_url(relative_url, request=None):
 def build_whatsapp_link(phone_number, message):
     encoded_message = urllib.parse.quote(message)
     return f"https://wa.me/{phone_number}?text={encoded_message}"
+
+
+TOKEN_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_text(text):
+    """Minuscules sans accents : « Écran Incurvé » -> « ecran incurve »."""
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def fold_token(token):
+    """Ramène pluriels simples au singulier (claviers -> clavier, jeux -> jeu)."""
+    if len(token) > 3 and token[-1] in 'sx' and not token.endswith('ss') and not token.isdigit():
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Découpe un texte en jetons normalisés, sans mots vides, dans l'ordre d'apparition."""
+    tokens = []
+    for token in TOKEN_SPLIT_RE.split(normalize_text(text)):
+        if token in SEARCH_STOPWORDS:
+            continue
+        if len(token) < SEARCH_MIN_TOKEN_LENGTH and not token.isdigit():
+            continue
+        tokens.append(fold_token(token))
+    return tokens
@@ -1,13 +1,15 @@
+from decimal import Decimal
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Q, F
+from django.db.models import Count, F, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from .models import (
-    Category, Product, ProductImage, Promotion, 
+    Category, Product, ProductImage, ProductStatus, Promotion, PromotionUsage,
     NewsletterSubscriber, NewsletterTemplate, NewsletterCampaign,
     Service, SocialLink, SiteSettings
 )
@@ -19,8 +21,18 @@ from .serializers import (
     PromotionListSerializer, PromotionDetailSerializer,
     NewsletterSubscriberSerializer, NewsletterTemplateSerializer,
     NewsletterCampaignListSerializer, NewsletterCampaignDetailSerializer,
-    ServiceSerializer, SocialLinkSerializer, SiteSettingsSerializer
+    ServiceSerializer, SocialLinkSerializer, SiteSettingsSerializer,
+    ProductQuoteLineSerializer, ProductQuoteSerializer
 )
+from .conditional import ConditionalGetMixin
+from .response_cache import CachedResponseMixin
+from .constants import AUTOCOMPLETE_DEFAULT_LIMIT, AUTOCOMPLETE_MAX_LIMIT, MAX_QUOTE_LINES
+from .services.autocomplete import autocomplete
+from .services.category_tree import CategoryTreeService
+from .services.counter_service import CounterService
+from .services.facets import FacetService
+from .services.promotion_service import PromotionService
+from .services.shelves import SHELVES, ShelfService
 
 from .api_filters import (
     ProductFilter, CategoryFilter, PromotionFilter, NewsletterCampaignFilter,
@@ -28,7 +40,11 @@ from .api_filters import (
 )
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+CATALOG_MODELS = (Category, Product, ProductImage, ProductStatus, Promotion, SiteSettings)
+SHELF_ACTIONS = tuple(SHELVES)
+
+
+class CategoryViewSet(CachedResponseMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet pour les catégories avec arborescence MPTT
     """
@@ -37,6 +53,8 @@ class CategoryViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = CategoryFilter
     lookup_field = 'slug'
+    cache_actions = ('list', 'retrieve', 'minimal', 'products')
+    cache_models = CATALOG_MODELS
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -50,22 +68,13 @@ class CategoryViewSet(viewsets.ModelViewSet):
         return CategorySerializer
     
     def get_queryset(self):
-        queryset = super().get_queryset()
-        
-        # Ajouter les annotations pour product_count
-        queryset = queryset.annotate(
-            product_count=Count('products', distinct=True),
-            direct_product_count=Count('products', filter=Q(products__category=F('id')), distinct=True)
-        )
-        
-        return queryset
+        # Compteurs de produits et chemins, lus depuis le cache catalogue
+        return super().get_queryset().with_tree_data()
     
     @action(detail=False, methods=['get'])
     def tree(self, request):
         """Retourne l'arborescence complète des catégories"""
-        root_categories = self.get_queryset().filter(parent__isnull=True)
-        serializer = self.get_serializer(root_categories, many=True)
-        return Response(serializer.data)
+        return Response(CategoryTreeService.get_tree())
     
     @action(detail=False, methods=['get'])
     def minimal(self, request):
@@ -78,7 +87,9 @@ class CategoryViewSet(viewsets.ModelViewSet):
     def products(self, request, slug=None):
         """Retourne les produits d'une catégorie"""
         category = self.get_object()
-        products = category.products.filter(is_active=True)
+        products = category.products.filter(is_active=True).select_related(
+            'category', 'status'
+        ).prefetch_related('images')
         
         # Utiliser le ProductListSerializer
         from .serializers import ProductListSerializer
@@ -86,7 +97,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(CachedResponseMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet pour les produits avec filtres avancés
     """
@@ -95,9 +106,11 @@ class ProductViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProductFilter
     lookup_field = 'slug'
+    cache_actions = ('list', 'retrieve', 'on_sale') + SHELF_ACTIONS
+    cache_models = CATALOG_MODELS
     
     def get_serializer_class(self):
-        if self.action == 'list':
+        if self.action in ('list', 'on_sale') + SHELF_ACTIONS:
             return ProductListSerializer
         elif self.action == 'retrieve':
             return ProductDetailSerializer
@@ -114,15 +127,17 @@ class ProductViewSet(viewsets.ModelViewSet):
         
         return queryset
     
+    def response_cache_hit(self, request, data):
+        # Une fiche servie depuis le cache compte aussi comme une vue
+        if self.action == 'retrieve':
+            CounterService.record_view(data['id'])
+    
     def retrieve(self, request, *args, **kwargs):
         """Incrémenter le compteur de vues lors de la consultation"""
         instance = self.get_object()
         
-        # Incrémenter les vues
-        if hasattr(instance, 'status') and instance.status:
-            instance.status.views_count = F('views_count') + 1
-            instance.status.save(update_fields=['views_count'])
-            instance.status.refresh_from_db()
+        # Incrémenter les vues (tamponné, appliqué en base au prochain flush)
+        CounterService.record_view(instance.pk)
         
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -130,36 +145,33 @@ class ProductViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Retourne les produits mis en avant"""
-        queryset = self.get_queryset().filter(status__is_featured=True)
-        queryset = queryset.order_by('-status__featured_score', '-created_at')
-        
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.shelf_response(request, 'featured')
     
     @action(detail=False, methods=['get'])
     def recommended(self, request):
         """Retourne les produits recommandés"""
-        queryset = self.get_queryset().filter(status__is_recommended=True)
-        queryset = queryset.order_by('-created_at')
-        
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.shelf_response(request, 'recommended')
+    
+    @action(detail=False, methods=['get'])
+    def new_arrivals(self, request):
+        """Retourne les nouveautés en stock"""
+        return self.shelf_response(request, 'new_arrivals')
+    
+    @action(detail=False, methods=['get'])
+    def trending(self, request):
+        """Retourne les produits tendance (vues et clics récents, à décroissance exponentielle)"""
+        return self.shelf_response(request, 'trending')
+    
+    @action(detail=False, methods=['get'])
+    def best_sellers(self, request):
+        """Retourne les produits en stock les plus demandés en ce moment"""
+        return self.shelf_response(request, 'best_sellers')
     
     @action(detail=False, methods=['get'])
     def on_sale(self, request):
         """Retourne les produits en promotion"""
-        queryset = self.get_queryset().exclude(
-            Q(compare_at_price__isnull=True) | Q(compare_at_price__lte=0)
+        queryset = self.get_queryset().filter(
+            Q(compare_at_price__gt=0) | Q(effective_price__lt=F('price'))
         )
         queryset = queryset.order_by('-created_at')
         
@@ -171,36 +183,163 @@ class ProductViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
-    @action(detail=True, methods=['post'])
+    def shelf_response(self, request, name):
+        """
+        Page d'un rayon précalculé (ShelfService) : lecture des produits par identifiants.
+
+        Le personnel (produits inactifs inclus) et la pagination par curseur
+        interrogent directement le queryset du rayon.
+        """
+        queryset = self.get_queryset()
+        if request.user.is_authenticated or self.paginator.cursor_query_param in request.query_params:
+            products = SHELVES[name](queryset)
+            page = self.paginate_queryset(products)
+        else:
+            ids = ShelfService.get_ids(name)
+            page = self.paginate_queryset(ids)
+            products = ShelfService.fetch(ids if page is None else page, queryset)
+            if page is not None:
+                page = products
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(products, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """Compteurs par marque, catégorie, tranche de prix, stock et réduction pour les filtres courants"""
+        queryset = self.get_queryset()
+        filterset = ProductFilter(request.query_params, queryset=queryset, request=request)
+        if not filterset.is_valid():
+            return Response(filterset.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        scope = 'staff' if request.user.is_authenticated else 'public'
+        return Response(FacetService.get_facets(queryset, request.query_params, scope))
+    
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    def autocomplete(self, request):
+        """Suggestions (produits, marques, catégories) pour une saisie partielle ?q="""
+        try:
+            limit = int(request.query_params.get('limit', AUTOCOMPLETE_DEFAULT_LIMIT))
+        except ValueError:
+            return Response({'error': 'Invalid limit'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(max(limit, 1), AUTOCOMPLETE_MAX_LIMIT)
+
+        suggestions = autocomplete(request.query_params.get('q', ''), limit)
+        return Response({
+            'products': [
+                {'id': entry['id'], 'name': entry['label'], 'slug': entry['slug']}
+                for entry in suggestions['product']
+            ],
+            'brands': [
+                {'name': entry['label'], 'product_count': entry['score']}
+                for entry in suggestions['brand']
+            ],
+            'categories': [
+                {'id': entry['id'], 'name': entry['label'], 'slug': entry['slug']}
+                for entry in suggestions['category']
+            ],
+        })
+    
+    @action(detail=False, methods=['post'], permission_classes=[AllowAny])
+    def quote(self, request):
+        """Calcule les prix (promotions incluses) d'une liste de lignes {id|slug, quantity}"""
+        lines_data = request.data.get('lines') if isinstance(request.data, dict) else request.data
+        if not lines_data or not isinstance(lines_data, list):
+            return Response({'error': 'Lines required'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(lines_data) > MAX_QUOTE_LINES:
+            return Response(
+                {'error': f'Maximum {MAX_QUOTE_LINES} lines per quote'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        line_serializer = ProductQuoteLineSerializer(data=lines_data, many=True)
+        line_serializer.is_valid(raise_exception=True)
+        lines = line_serializer.validated_data
+
+        ids = {line['id'] for line in lines if line.get('id')}
+        slugs = {line['slug'] for line in lines if not line.get('id')}
+        products = self.get_queryset().select_related('category').prefetch_related(None).filter(
+            Q(id__in=ids) | Q(slug__in=slugs)
+        )
+        by_id = {product.id: product for product in products}
+        by_slug = {product.slug: product for product in by_id.values()}
+
+        resolved, missing = [], []
+        for line in lines:
+            product = by_id.get(line['id']) if line.get('id') else by_slug.get(line['slug'])
+            if product is None:
+                missing.append(line.get('id') or line.get('slug'))
+            else:
+                resolved.append((product, line['quantity']))
+
+        if missing:
+            return Response(
+                {'error': 'Product not found', 'missing': missing},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        quotes = PromotionService.calculate_prices_bulk(
+            [product for product, _ in resolved],
+            [quantity for _, quantity in resolved]
+        )
+        data = ProductQuoteSerializer(quotes, many=True).data
+        grand_total = sum((quote['total'] for quote in quotes), Decimal('0.00'))
+        return Response({'lines': data, 'total': f'{grand_total:.2f}'})
+
+    @action(detail=True, methods=['post'], permission_classes=[AllowAny])
     def track_click(self, request, slug=None):
         """Enregistrer un clic sur le produit (WhatsApp par exemple)"""
         product = self.get_object()
-        
-        if hasattr(product, 'status') and product.status:
-            product.status.clicks_count = F('clicks_count') + 1
-            product.status.save(update_fields=['clicks_count'])
-        
+        CounterService.record_click(product.pk)
         return Response({'status': 'click tracked'})
 
 
-class PromotionViewSet(viewsets.ModelViewSet):
+class PromotionViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet pour les promotions
     """
-    queryset = Promotion.objects.all().prefetch_related('products', 'categories').order_by('-created_at')
+    queryset = Promotion.objects.all().order_by('-created_at')
     permission_classes = [IsAuthenticatedOrReadOnly]
     filter_backends = [DjangoFilterBackend]
     filterset_class = PromotionFilter
     lookup_field = 'slug'
+    cache_actions = ('list', 'retrieve', 'active')
+    cache_models = (Promotion, PromotionUsage, Product, ProductImage, Category)
     
     def get_serializer_class(self):
         if self.action == 'list':
             return PromotionListSerializer
         return PromotionDetailSerializer
     
+    @staticmethod
+    def with_details(queryset):
+        """Précharge produits (avec images), catégories et total d'utilisations"""
+        return queryset.prefetch_related(
+            Prefetch('products', queryset=Product.objects.prefetch_related('images')),
+            'categories'
+        ).annotate(usage_total=Coalesce(Sum('usages__count'), 0))
+
     def get_queryset(self):
         queryset = super().get_queryset()
         
+        if self.action == 'list':
+            # La liste n'affiche que des compteurs ; le total d'utilisations
+            # (sous-requête, hors des jointures comptées) sert à is_active_now
+            usage_totals = PromotionUsage.objects.filter(promotion=OuterRef('pk')).order_by().values(
+                'promotion'
+            ).annotate(total=Sum('count')).values('total')
+            queryset = queryset.annotate(
+                products_total=Count('products', distinct=True),
+                categories_total=Count('categories', distinct=True),
+                usage_total=Coalesce(Subquery(usage_totals), 0),
+            )
+        else:
+            queryset = self.with_details(queryset)
+        
         # Filtrer uniquement les promotions actives pour les non-authentifiés
         if not self.request.user.is_authenticated:
             now = timezone.now()
@@ -224,7 +363,7 @@ class PromotionViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
-    @action(detail=False, methods=['post'])
+    @action(detail=False, methods=['post'], permission_classes=[AllowAny])
     def validate_code(self, request):
         """Valider un code promo"""
         code = request.data.get('code')
@@ -232,7 +371,7 @@ class PromotionViewSet(viewsets.ModelViewSet):
             return Response({'error': 'Code required'}, status=status.HTTP_400_BAD_REQUEST)
         
         try:
-            promotion = Promotion.objects.get(code__iexact=code)
+            promotion = self.with_details(Promotion.objects.all()).get(code__iexact=code)
             if promotion.is_active_now():
                 serializer = self.get_serializer(promotion)
                 return Response(serializer.data)
@@ -307,7 +446,7 @@ class NewsletterTemplateViewSet(viewsets.ModelViewSet):
     """
     ViewSet pour les templates newsletter
     """
-    queryset = NewsletterTemplate.objects.all().order_by('name')
+    queryset = NewsletterTemplate.objects.annotate(campaigns_total=Count('campaigns')).order_by('name')
     serializer_class = NewsletterTemplateSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     filter_backends = [DjangoFilterBackend]
@@ -330,7 +469,7 @@ class NewsletterCampaignViewSet(viewsets.ModelViewSet):
         return NewsletterCampaignDetailSerializer
 
 
-class ServiceViewSet(viewsets.ModelViewSet):
+class ServiceViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet pour les services
     """
@@ -338,6 +477,7 @@ class ServiceViewSet(viewsets.ModelViewSet):
     serializer_class = ServiceSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     lookup_field = 'slug'
+    cache_models = (Service,)
     
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -349,27 +489,30 @@ class ServiceViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class SocialLinkViewSet(viewsets.ModelViewSet):
+class SocialLinkViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet pour les liens sociaux
     """
-    queryset = SocialLink.objects.all()
+    queryset = SocialLink.objects.all().order_by('id')
     serializer_class = SocialLinkSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    cache_models = (SocialLink,)
 
 
-class SiteSettingsViewSet(viewsets.ReadOnlyModelViewSet):
+class SiteSettingsViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet en lecture seule pour les paramètres du site
     """
     queryset = SiteSettings.objects.all()
     serializer_class = SiteSettingsSerializer
     permission_classes = [AllowAny]
+    cache_actions = ('list', 'retrieve', 'current')
+    cache_models = (SiteSettings, SocialLink)
     
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Retourne les paramètres actuels du site"""
-        settings = SiteSettings.get_settings()
+        settings = SiteSettings.load()
         serializer = self.get_serializer(settings)
         return Response(serializer.data)
  